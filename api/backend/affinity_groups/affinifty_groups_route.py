@@ -9,6 +9,8 @@ from flask import (
 )
 import json
 from backend.db_connection import db
+from backend.caching import table_versions
+from backend.http_cache import conditional
 from mysql.connector import Error
 import datetime
 
@@ -16,6 +18,7 @@ group = Blueprint("group", __name__)
 
 # get affinity group that can be filtered by focus area, country, and resource type
 @group.route("/groups", methods=["GET"])
+@conditional("AffinityResources", column="id", max_age=60)
 def get_all_groups():
     try: 
         current_app.logger.info('Starting get_all_groups request')
@@ -87,6 +90,9 @@ def add_new_group():
         db.get_db().commit()
         new_resource_id = cursor.lastrowid
 
+        # new ETags for /groups so clients stop reusing their cached lists
+        table_versions.bump("AffinityResources")
+
         cursor.close()
 
         return (
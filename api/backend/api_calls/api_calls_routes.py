@@ -9,6 +9,7 @@ from flask import (
 )
 import json
 from backend.db_connection import db
+from backend.http_cache import conditional
 from mysql.connector import Error
 import datetime
 
@@ -16,6 +17,7 @@ apis = Blueprint("apis", __name__)
 
 # Get model 1 routes
 @apis.route("/m1weights", methods=["GET"])
+@conditional("Model1Weights", column="weight_id")
 def get_model_1_weights():
     try:
         current_app.logger.info("Fetching Model 1 Weights")
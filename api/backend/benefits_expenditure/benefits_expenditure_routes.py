@@ -9,6 +9,8 @@ from flask import (
 )
 import json
 from backend.db_connection import db
+from backend.streaming import wants_stream, stream_query
+from backend.http_cache import conditional
 from mysql.connector import Error
 import datetime
 
@@ -16,6 +18,7 @@ benefits = Blueprint("benfits", __name__)
 
 # gets all benefit expenditures
 @benefits.route("/benefit", methods=["GET"])
+@conditional("Children_FamilyBenefits")
 def get_all_benefits():
     try: 
         cursor = db.get_db().cursor()
@@ -45,6 +48,12 @@ def get_all_benefits():
             params.append(unit_measured)
 
         current_app.logger.debug(f'Executing query: {query} with params: {params}')
+
+        # stream large results row by row when the client asks for NDJSON
+        if wants_stream():
+            cursor.close()
+            return stream_query(query, params)
+
         cursor.execute(query, params)
 
         benefits = cursor.fetchall()
@@ -0,0 +1,148 @@
+#------------------------------------------------------------
+# Helpers for bulk write routes.
+#
+# A bulk request is {"records": [...]}. Every record is checked
+# on its own and gets its own result, so one bad row does not
+# reject the others. The valid rows are written with multi-row
+# INSERT ... ON DUPLICATE KEY UPDATE statements (BATCH_SIZE rows
+# each) inside one transaction, so tens of thousands of rows
+# cost a few dozen round trips instead of one per row.
+#------------------------------------------------------------
+import datetime
+import re
+
+from flask import request
+
+# most records accepted by one request
+MAX_RECORDS = 50000
+
+# rows per INSERT statement (and values per IN (...) lookup)
+BATCH_SIZE = 1000
+
+TIME_PATTERN = re.compile(r"^\d{1,2}:\d{2}(:\d{2})?$")
+
+
+class BulkError(ValueError):
+    """Raised when the request body as a whole is not a valid bulk request"""
+
+
+def parse_records():
+    """The list of records in the request body"""
+    body = request.get_json(silent=True)
+    records = body.get("records") if isinstance(body, dict) else None
+    if not isinstance(records, list) or not records:
+        raise BulkError('Body must be {"records": [...]} with at least one record')
+    if len(records) > MAX_RECORDS:
+        raise BulkError(f"At most {MAX_RECORDS} records can be sent per request")
+    return records
+
+
+def convert(value, kind):
+    """value checked (and normalized) as a column of the given kind; raises ValueError"""
+    if value is None:
+        return None
+    if kind == "int":
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError("must be an integer")
+    elif kind == "number":
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("must be a number")
+    elif kind == "bool":
+        if not isinstance(value, bool):
+            raise ValueError("must be true or false")
+    elif kind == "time":
+        if not isinstance(value, str) or not TIME_PATTERN.match(value):
+            raise ValueError("must be a time like 07:30 or 07:30:00")
+        datetime.time(*map(int, value.split(":")))
+    elif kind == "text":
+        if not isinstance(value, str):
+            raise ValueError("must be a string")
+    return value
+
+
+def check_record(record, columns, required=()):
+    """(values in column order, None) for a valid record, or (None, error message)
+
+    `columns` maps each accepted field to its kind; fields not sent are None.
+    """
+    if not isinstance(record, dict):
+        return None, "Record must be an object"
+    for field in required:
+        if record.get(field) is None:
+            return None, f"Missing required field: {field}"
+    unknown = [field for field in record if field not in columns]
+    if unknown:
+        return None, f"Unknown field: {unknown[0]}"
+
+    values = []
+    for field, kind in columns.items():
+        try:
+            values.append(convert(record.get(field), kind))
+        except ValueError as e:
+            return None, f"{field} {e}"
+    return tuple(values), None
+
+
+def batches(items, size=None):
+    size = size or BATCH_SIZE
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def fetch_in(cursor, query, values):
+    """Rows of a query with one IN ({}) placeholder, run BATCH_SIZE values at a time"""
+    rows = []
+    values = list(values)
+    for batch in batches(values):
+        cursor.execute(query.format(", ".join(["%s"] * len(batch))), batch)
+        rows.extend(cursor.fetchall())
+    return rows
+
+
+def insert_rows(cursor, table, columns, rows, update_columns=()):
+    """Multi-row INSERT of rows (tuples in column order), BATCH_SIZE rows per statement.
+
+    When a row's key already exists, update_columns are overwritten with
+    the new values; a None keeps the stored value. Without update_columns
+    the auto-increment id of every row is returned. A multi-row INSERT is
+    a "simple insert", so InnoDB hands each statement one block of ids
+    starting at lastrowid; the block is only consecutive when
+    auto_increment_increment is 1, so otherwise each row is inserted on
+    its own and its lastrowid is kept.
+    """
+    placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    suffix = ""
+    if update_columns:
+        suffix = " AS new ON DUPLICATE KEY UPDATE " + ", ".join(
+            f"{column} = COALESCE(new.{column}, {table}.{column})" for column in update_columns
+        )
+    elif rows and auto_increment_step(cursor) != 1:
+        ids = []
+        for row in rows:
+            cursor.execute(f"INSERT INTO {table} ({', '.join(columns)}) VALUES {placeholders}", row)
+            ids.append(cursor.lastrowid)
+        return ids
+
+    ids = []
+    for batch in batches(rows):
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([placeholders] * len(batch))}{suffix}",
+            [value for row in batch for value in row],
+        )
+        if not update_columns:
+            ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(batch)))
+    return ids
+
+
+def auto_increment_step(cursor):
+    """The session's auto_increment_increment (greater than 1 e.g. on multi-source replicas)"""
+    cursor.execute("SELECT @@session.auto_increment_increment AS step")
+    return int(cursor.fetchone()["step"])
+
+
+def summary(results):
+    """Response body: per-record results plus counts by status"""
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    return {"results": results, "total": len(results), "counts": counts}
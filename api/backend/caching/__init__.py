@@ -0,0 +1,128 @@
+#------------------------------------------------------------
+# In-process caches for derived data that rarely changes.
+#
+# Entries are stored together with the data version they were
+# built from. A version is a cheap fingerprint of the source
+# table (row count + max of one column) plus a counter that
+# routes bump after they write to that table.
+#------------------------------------------------------------
+import threading
+import time
+from collections import OrderedDict
+
+from backend.db_connection import db
+
+
+class VersionedCache:
+    """Size-bounded LRU cache whose entries expire after a TTL or when their data version changes"""
+
+    def __init__(self, maxsize=32, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version, loader):
+        """Return the cached value for key, calling loader() when it is missing, stale or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                cached_version, created_at, value = entry
+                if cached_version == version and now - created_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+
+        # build outside the lock so a slow query does not block other keys
+        value = loader()
+
+        with self._lock:
+            self._entries[key] = (version, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one entry, or every entry when no key is given"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+            }
+
+
+class TableVersions:
+    """Cheap data versions per table, re-checked against MySQL at most once per ttl seconds"""
+
+    def __init__(self, ttl=30):
+        self.ttl = ttl
+        self._fingerprints = {}
+        self._bumps = {}
+        self._changes = {}
+        self._lock = threading.Lock()
+
+    def get(self, table, column="year"):
+        """Version string for a table, e.g. '312:2024:0'"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._fingerprints.get(table)
+            bumps = self._bumps.get(table, 0)
+        if cached is None or now - cached[1] >= self.ttl:
+            fingerprint = self._fingerprint(table, column)
+            with self._lock:
+                self._fingerprints[table] = (fingerprint, now)
+        else:
+            fingerprint = cached[0]
+        version = f"{fingerprint}:{bumps}"
+
+        # remember when this process first saw the current version
+        with self._lock:
+            change = self._changes.get(table)
+            if change is None or change[0] != version:
+                self._changes[table] = (version, time.time())
+        return version
+
+    def last_modified(self, table):
+        """Wall-clock time the current version of a table was first seen, or None before any get()"""
+        with self._lock:
+            change = self._changes.get(table)
+        return change[1] if change else None
+
+    def bump(self, table):
+        """Mark a table as changed; call this after committing a write to it"""
+        with self._lock:
+            self._bumps[table] = self._bumps.get(table, 0) + 1
+            self._fingerprints.pop(table, None)
+
+    def _fingerprint(self, table, column):
+        # table and column names only ever come from route code, never from requests
+        cursor = db.get_db().cursor()
+        cursor.execute(f"SELECT COUNT(*) AS row_count, MAX({column}) AS max_value FROM {table}")
+        row = cursor.fetchone()
+        cursor.close()
+        return f"{row['row_count']}:{row['max_value']}"
+
+
+# shared across every blueprint in this process
+table_versions = TableVersions()
@@ -9,6 +9,8 @@ from flask import (
 )
 import json
 from backend.db_connection import db
+from backend.streaming import wants_stream, stream_query
+from backend.http_cache import conditional
 from mysql.connector import Error
 import datetime
 
@@ -16,6 +18,7 @@ cpi = Blueprint("cpi", __name__)
 
 # gets all weekly working hours of full time adults
 @cpi.route("/cpi", methods=["GET"])
+@conditional("EUCPI", column="eucpi_id")
 def get_all_cpi():
     try: 
         cursor = db.get_db().cursor()
@@ -33,6 +36,12 @@ def get_all_cpi():
             params.append(year)
 
         current_app.logger.debug(f'Executing query: {query} with params: {params}')
+
+        # stream large results row by row when the client asks for NDJSON
+        if wants_stream():
+            cursor.close()
+            return stream_query(query, params)
+
         cursor.execute(query, params)
 
         item = cursor.fetchall()
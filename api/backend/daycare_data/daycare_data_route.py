@@ -9,12 +9,40 @@ from flask import (
 )
 import json
 from backend.db_connection import db
+from backend.pagination import (
+    PaginationError,
+    fetch_page,
+    page_envelope,
+    page_requested,
+    parse_fields,
+    parse_page,
+)
+from backend.serialization import serialize_rows
+from backend.caching import table_versions
+from backend.bulk import BulkError, check_record, fetch_in, insert_rows, parse_records, summary
 from mysql.connector import Error
-import datetime
+import pymysql
 
 # Create a Blueprint 
 daycare = Blueprint("daycare", __name__)
 
+# columns clients can ask for with ?fields=, and the key each one is returned under
+DAYCARE_DATA_FIELDS = {
+    "id": "ID",
+    "daycare_id": "daycare_id",
+    "enrollment": "Enrollment",
+    "year": "Year",
+    "staff": "Staff",
+    "monthly_budget": "Monthly Budget",
+    "percent_budget_used": "Percent Budget Used",
+    "monthly_price": "Monthly Price",
+    "opening_time": "Opening Time",
+    "closing_time": "Closing Time",
+}
+
+# the same columns as returned by the single daycare and single row routes
+DAYCARE_DETAIL_FIELDS = {**DAYCARE_DATA_FIELDS, "daycare_id": "Daycare ID"}
+
 
 # Get all daycare data with filtering by monthly price and year
 @daycare.route("/data", methods=["GET"])
@@ -30,8 +58,11 @@ def get_all_daycare_data():
 
         current_app.logger.debug(f'Query parameters - monthly_price: {monthly_price}, year: {year}')
 
+        # Only select the columns the client asked for
+        fields = parse_fields(list(DAYCARE_DATA_FIELDS), "id")
+
         # Prepare the Base query
-        query = "SELECT * FROM DaycareData WHERE 1=1"
+        query = f"SELECT {', '.join(fields)} FROM DaycareData WHERE 1=1"
         params = []
 
         # Add filters if provided
@@ -43,66 +74,132 @@ def get_all_daycare_data():
             params.append(year)
 
 
-        current_app.logger.debug(f'Executing query: {query} with params: {params}')
-        cursor.execute(query, params)
-        daycare = cursor.fetchall()
+        # One page at a time, keyed on id, when ?limit= or ?cursor= is given
+        next_cursor = None
+        if page_requested():
+            limit, after = parse_page()
+            current_app.logger.debug(f'Executing paged query: {query} with params: {params}, after: {after}')
+            daycare, next_cursor = fetch_page(cursor, query, params, "id", limit, after)
+        else:
+            current_app.logger.debug(f'Executing query: {query} with params: {params}')
+            cursor.execute(query, params)
+            daycare = cursor.fetchall()
         cursor.close()
 
-        #-----------------------------------------------------------------------------#
-        # this beautiful addition is credited to emily moy and her project last year
-        # it is necessary because json hates the time data type
-        # basically it turns it to a format that json likes 
-        results = []
-
-        # Groups the date and time so that it is in a jsonifiable format
-        for row in daycare:
-
-            time1 = row['opening_time']
-            time2 = row['closing_time']
-            year1 = row['year']
-            #If the time is in a format that isnt jsonifable change the format to the standard time format
-            if isinstance(time1, datetime.timedelta):
-                jsonifiable_time = (datetime.datetime.min + time1).time()
-            else:
-                jsonifiable_time = time1
-            
-            if isinstance(time2, datetime.timedelta):
-                jsonifiable_time2 = (datetime.datetime.min + time2).time()
-            else:
-                jsonifiable_time2 = time2
-
-            
-            
-            departure_time = jsonifiable_time
-            time_two = jsonifiable_time2
-
-            result = {
-                "ID": row["id"],
-                "daycare_id": row["daycare_id"],
-                "Enrollment": row["enrollment"],
-                "Year": row["year"],
-                "Staff": row["staff"],
-                "Monthly Budget": row["monthly_budget"],
-                "Percent Budget Used": row["percent_budget_used"],
-                "Monthly Price": row["monthly_price"],
-                "Opening Time": departure_time.isoformat(),
-                "Closing Time": time_two.isoformat()
-            }
-
-            results.append(result)
+        # TIME and DECIMAL columns converted column by column, keys renamed for the client
+        results = serialize_rows(
+            daycare, {field: DAYCARE_DATA_FIELDS[field] for field in fields}, cursor.description
+        )
 
-        the_response = make_response(jsonify(results))
+        if page_requested():
+            the_response = make_response(jsonify(page_envelope(results, next_cursor, limit)))
+        else:
+            the_response = make_response(jsonify(results))
         the_response.status_code = 200
 
-        # -------------------------------------------------------#
-
-
         current_app.logger.info(f'Successfully retrieved {len(daycare)} Daycare Data')
         return the_response
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
     except Error as e:
         current_app.logger.error(f'Database error in get_all_daycare_data: {str(e)}')
         return jsonify({"error": str(e)}), 500
     
+# dimensions the aggregates can be grouped by, and the columns each one selects
+AGGREGATE_DIMENSIONS = {
+    "country": ["l.country_code"],
+    "city": ["l.country_code", "l.city"],
+    "daycare": ["l.daycare_id", "l.daycare_name", "l.city", "l.country_code"],
+    "year": ["d.year"],
+}
+
+# statistics computed for every group
+AGGREGATE_METRICS = """
+            COUNT(*) AS row_count,
+            COUNT(DISTINCT d.daycare_id) AS daycare_count,
+            CAST(AVG(d.enrollment) AS DOUBLE) AS avg_enrollment,
+            CAST(SUM(d.enrollment) AS DOUBLE) AS total_enrollment,
+            CAST(AVG(d.staff) AS DOUBLE) AS avg_staff,
+            CAST(SUM(d.staff) AS DOUBLE) AS total_staff,
+            CAST(AVG(d.monthly_price) AS DOUBLE) AS avg_monthly_price,
+            CAST(MIN(d.monthly_price) AS DOUBLE) AS min_monthly_price,
+            CAST(MAX(d.monthly_price) AS DOUBLE) AS max_monthly_price,
+            CAST(AVG(d.monthly_budget) AS DOUBLE) AS avg_monthly_budget,
+            CAST(AVG(d.percent_budget_used) AS DOUBLE) AS avg_percent_budget_used
+"""
+
+# Get enrollment, staff, price and budget statistics grouped by country, city, daycare and/or year
+@daycare.route("/aggregates", methods=["GET"])
+def get_daycare_aggregates():
+    try:
+        current_app.logger.info('Starting get_daycare_aggregates request')
+
+        group_by = [dim.strip() for dim in request.args.get("group_by", "country,year").split(",") if dim.strip()]
+        unknown = [dim for dim in group_by if dim not in AGGREGATE_DIMENSIONS]
+        if not group_by or unknown:
+            return jsonify({
+                "error": f"group_by must be a comma-separated list of: {', '.join(AGGREGATE_DIMENSIONS)}"
+            }), 400
+
+        # Get query parameters for filtering
+        country = request.args.get("country_code")
+        city = request.args.get("city")
+        daycare_id = request.args.get("daycare_id")
+        year = request.args.get("year")
+        year_from = request.args.get("year_from")
+        year_to = request.args.get("year_to")
+
+        current_app.logger.debug(f'Query parameters - group_by: {group_by}, country: {country}, city: {city}, daycare_id: {daycare_id}, year: {year}, year_from: {year_from}, year_to: {year_to}')
+
+        columns = []
+        for dim in group_by:
+            for column in AGGREGATE_DIMENSIONS[dim]:
+                if column not in columns:
+                    columns.append(column)
+
+        # Prepare the Base query
+        query = f"""
+        SELECT {', '.join(columns)},{AGGREGATE_METRICS}
+        FROM DaycareData d
+        JOIN DaycareLocations l ON l.daycare_id = d.daycare_id
+        WHERE l.inactive = FALSE
+        """
+        params = []
+
+        # Add filters if provided
+        if country:
+            query += " AND l.country_code = %s"
+            params.append(country)
+        if city:
+            query += " AND l.city = %s"
+            params.append(city)
+        if daycare_id:
+            query += " AND d.daycare_id = %s"
+            params.append(daycare_id)
+        if year:
+            query += " AND d.year = %s"
+            params.append(year)
+        if year_from:
+            query += " AND d.year >= %s"
+            params.append(year_from)
+        if year_to:
+            query += " AND d.year <= %s"
+            params.append(year_to)
+
+        query += f" GROUP BY {', '.join(columns)} ORDER BY {', '.join(columns)}"
+
+        current_app.logger.debug(f'Executing query: {query} with params: {params}')
+        cursor = db.get_db().cursor()
+        cursor.execute(query, params)
+        aggregates = cursor.fetchall()
+        cursor.close()
+
+        current_app.logger.info(f'Successfully retrieved {len(aggregates)} Daycare aggregates')
+        return jsonify(aggregates), 200
+    except Error as e:
+        current_app.logger.error(f'Database error in get_daycare_aggregates: {str(e)}')
+        return jsonify({"error": str(e)}), 500
+    
 # Get all daycare data for a specific daycare with filtering by pretty much everything
 @daycare.route("/daycaredata/<int:daycare_id>", methods=["GET"])
 def get_daycare_data(daycare_id):
@@ -110,11 +207,6 @@ def get_daycare_data(daycare_id):
         current_app.logger.info('Starting get_all_daycare_data request')
         cursor = db.get_db().cursor()
 
-        # Check if Daycare exists
-        cursor.execute("SELECT * FROM DaycareLocations WHERE daycare_id = %s", (daycare_id,))
-        if not cursor.fetchone():
-            return jsonify({"error": "DaycareLocation not found"}), 404
-
         # Get query parameters for filtering
         monthly_price = request.args.get("monthly_price")
         year = request.args.get("year")
@@ -126,84 +218,56 @@ def get_daycare_data(daycare_id):
 
         current_app.logger.debug(f'Query parameters - monthly_price: {monthly_price}, year: {year}, enrollment: {enrollment}, staff: {staff}, monthly_budget: {monthly_budget}, percent_budget: {percent_budget}')
 
-        # Prepare the Base query
-        query = "SELECT * FROM DaycareData WHERE daycare_id = %s"
+        # Prepare the Base query: the location joined to its data, so one round trip
+        # tells us both whether the daycare exists and what data it has.
+        # Filters go in the ON clause so a daycare without matching data still comes back.
+        query = """
+        SELECT l.daycare_id AS location_id, d.*
+        FROM DaycareLocations l
+        LEFT JOIN DaycareData d ON d.daycare_id = l.daycare_id"""
         params = []
-        params.append(daycare_id)
 
         # Add filters if provided
         if monthly_price:
-            query += " AND monthly_price = %s"
+            query += " AND d.monthly_price = %s"
             params.append(monthly_price)
         if year:
-            query += " AND year = %s"
+            query += " AND d.year = %s"
             params.append(year)
         if enrollment:
-            query += " AND enrollment = %s"
+            query += " AND d.enrollment = %s"
             params.append(enrollment)
         if staff:
-            query += " AND staff = %s"
+            query += " AND d.staff = %s"
             params.append(staff)
         if monthly_budget:
-            query += " AND monthly_budget = %s"
+            query += " AND d.monthly_budget = %s"
             params.append(monthly_budget)
         if percent_budget:
-            query += " AND percent_budget_used = %s"
+            query += " AND d.percent_budget_used = %s"
             params.append(percent_budget)
 
 
+        query += " WHERE l.daycare_id = %s"
+        params.append(daycare_id)
+
         current_app.logger.debug(f'Executing query: {query} with params: {params}')
         cursor.execute(query, params)
-        daycare = cursor.fetchall()
+        rows = cursor.fetchall()
         cursor.close()
 
-        #-----------------------------------------------------------------------------#
-        # this beautiful addition is credited to emily moy and her project last year
-        # it is necessary because json hates the time data type
-        # basically it turns it to a format that json likes 
-        results = []
-
-        # Groups the date and time so that it is in a jsonifiable format
-        for row in daycare:
-
-            time1 = row['opening_time']
-            time2 = row['closing_time']
-            year1 = row['year']
-            #If the time is in a format that isnt jsonifable change the format to the standard time format
-            if isinstance(time1, datetime.timedelta):
-                jsonifiable_time = (datetime.datetime.min + time1).time()
-            else:
-                jsonifiable_time = time1
-            
-            if isinstance(time2, datetime.timedelta):
-                jsonifiable_time2 = (datetime.datetime.min + time2).time()
-            else:
-                jsonifiable_time2 = time2
-
-            
-            departure_time = jsonifiable_time
-            time_two = jsonifiable_time2
-
-            result = {
-                "ID": row["id"],
-                "Daycare ID": row["daycare_id"],
-                "Enrollment": row["enrollment"],
-                "Year": row["year"],
-                "Staff": row["staff"],
-                "Monthly Budget": row["monthly_budget"],
-                "Percent Budget Used": row["percent_budget_used"],
-                "Monthly Price": row["monthly_price"],
-                "Opening Time": departure_time.isoformat(),
-                "Closing Time": time_two.isoformat()
-            }
-
-            results.append(result)
+        # Check if Daycare exists
+        if not rows:
+            return jsonify({"error": "DaycareLocation not found"}), 404
 
-        the_response = make_response(jsonify(results))
-        the_response.status_code = 200
+        # a daycare without matching data comes back once with NULL data columns
+        daycare = [row for row in rows if row["id"] is not None]
 
-        # -------------------------------------------------------#
+        # TIME and DECIMAL columns converted column by column, keys renamed for the client
+        results = serialize_rows(daycare, DAYCARE_DETAIL_FIELDS, cursor.description)
 
+        the_response = make_response(jsonify(results))
+        the_response.status_code = 200
 
         current_app.logger.info(f'Successfully retrieved {len(daycare)} Daycare Data')
         return the_response
@@ -243,54 +307,12 @@ def get_data(id):
         daycare = cursor.fetchall()
         cursor.close()
 
-        #-----------------------------------------------------------------------------#
-        # this beautiful addition is credited to emily moy and her project last year
-        # it is necessary because json hates the time data type
-        # basically it turns it to a format that json likes 
-        results = []
-
-        # Groups the date and time so that it is in a jsonifiable format
-        for row in daycare:
-
-            time1 = row['opening_time']
-            time2 = row['closing_time']
-            year1 = row['year']
-            #If the time is in a format that isnt jsonifable change the format to the standard time format
-            if isinstance(time1, datetime.timedelta):
-                jsonifiable_time = (datetime.datetime.min + time1).time()
-            else:
-                jsonifiable_time = time1
-            
-            if isinstance(time2, datetime.timedelta):
-                jsonifiable_time2 = (datetime.datetime.min + time2).time()
-            else:
-                jsonifiable_time2 = time2
-
-            
-            departure_time = jsonifiable_time
-            time_two = jsonifiable_time2
-
-            result = {
-                "ID": row["id"],
-                "Daycare ID": row["daycare_id"],
-                "Enrollment": row["enrollment"],
-                "Year": row["year"],
-                "Staff": row["staff"],
-                "Monthly Budget": row["monthly_budget"],
-                "Percent Budget Used": row["percent_budget_used"],
-                "Monthly Price": row["monthly_price"],
-                "Opening Time": departure_time.isoformat(),
-                "Closing Time": time_two.isoformat()
-            }
-
-            results.append(result)
+        # TIME and DECIMAL columns converted column by column, keys renamed for the client
+        results = serialize_rows(daycare, DAYCARE_DETAIL_FIELDS, cursor.description)
 
         the_response = make_response(jsonify(results))
         the_response.status_code = 200
 
-        # -------------------------------------------------------#
-
-
         current_app.logger.info(f'Successfully retrieved {len(daycare)} Daycare Data')
         return the_response
     except Error as e:
@@ -332,4 +354,80 @@ def update_data(daycare_id):
 
     except Error as e:
         current_app.logger.error(f'Database error in update_data: {str(e)}')
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
+
+
+# fields of a bulk DaycareData record and their types; (daycare_id, year) identifies the row
+BULK_DATA_COLUMNS = {
+    "daycare_id": "int",
+    "year": "int",
+    "enrollment": "int",
+    "staff": "int",
+    "monthly_budget": "number",
+    "percent_budget_used": "number",
+    "monthly_price": "number",
+    "opening_time": "time",
+    "closing_time": "time",
+}
+
+# Insert or update the yearly data of many daycares in one transaction.
+# Rows are matched on (daycare_id, year); on an existing row only the fields
+# sent (not null) are changed.
+@daycare.route("/data/bulk", methods=["POST"])
+def bulk_upsert_data():
+    try:
+        current_app.logger.info('Starting bulk_upsert_data request')
+        records = parse_records()
+
+        results = [None] * len(records)
+        valid = []
+        for i, record in enumerate(records):
+            row, error = check_record(record, BULK_DATA_COLUMNS, required=("daycare_id", "year"))
+            if error:
+                results[i] = {"index": i, "status": "error", "error": error}
+            else:
+                valid.append((i, row))
+
+        conn = db.get_db()
+        cursor = conn.cursor()
+        try:
+            # a row for an unknown daycare would fail the foreign key for the whole statement
+            daycare_ids = {row[0] for _, row in valid}
+            known = {r["daycare_id"] for r in fetch_in(
+                cursor, "SELECT daycare_id FROM DaycareLocations WHERE daycare_id IN ({})", daycare_ids
+            )}
+            existing = {(r["daycare_id"], int(r["year"])) for r in fetch_in(
+                cursor, "SELECT daycare_id, year FROM DaycareData WHERE daycare_id IN ({})", known
+            )}
+
+            rows = []
+            for i, row in valid:
+                key = (row[0], row[1])
+                if row[0] not in known:
+                    results[i] = {"index": i, "status": "error", "error": "DaycareLocation not found"}
+                    continue
+                # a key sent twice is inserted once and then updated by the later record
+                status = "updated" if key in existing else "inserted"
+                existing.add(key)
+                results[i] = {"index": i, "status": status, "daycare_id": key[0], "year": key[1]}
+                rows.append(row)
+
+            columns = list(BULK_DATA_COLUMNS)
+            insert_rows(cursor, "DaycareData", columns, rows, update_columns=columns[2:])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        if rows:
+            table_versions.bump("DaycareData")
+        current_app.logger.info(f'Bulk upserted {len(rows)} of {len(records)} Daycare Data records')
+        return jsonify(summary(results)), 200
+
+    except BulkError as e:
+        return jsonify({"error": str(e)}), 400
+    except pymysql.MySQLError as e:
+        current_app.logger.error(f'Database error in bulk_upsert_data: {str(e)}')
+        return jsonify({"error": str(e)}), 500
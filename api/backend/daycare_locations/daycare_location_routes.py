@@ -9,12 +9,80 @@ from flask import (
 )
 import json
 from backend.db_connection import db
+from backend.pagination import (
+    PaginationError,
+    fetch_page,
+    page_envelope,
+    page_requested,
+    parse_fields,
+    parse_page,
+)
+from backend.serialization import serialize_rows
+from backend.caching import table_versions
+from backend.bulk import BulkError, check_record, fetch_in, insert_rows, parse_records, summary
 from mysql.connector import Error
-import datetime
+import pymysql
 
 
 locations = Blueprint("locations", __name__)
 
+# columns clients can ask for with ?fields=
+LOCATION_FIELDS = ["daycare_id", "daycare_name", "city", "country_code", "inactive", "owner_id"]
+
+# DaycareData columns returned under "data", and the key each one is returned under
+LOCATION_DATA_FIELDS = {
+    "id": "ID",
+    "enrollment": "Enrollment",
+    "year": "Year",
+    "staff": "Staff",
+    "monthly_budget": "Monthly Budget",
+    "percent_budget_used": "Percent Budget Used",
+    "monthly_price": "Monthly Price",
+    "opening_time": "Opening Time",
+    "closing_time": "Closing Time",
+}
+
+
+# Build one query that returns locations together with their DaycareData rows.
+# The data filters go in the ON clause so locations without matching data still come back.
+def location_data_query(where, params, fields=LOCATION_FIELDS, year=None, monthly_price=None):
+    location_columns = ", ".join(f"l.{field}" for field in fields)
+    data_columns = ", ".join(f"d.{field}" for field in LOCATION_DATA_FIELDS)
+    query = f"""
+        SELECT {location_columns}, {data_columns}
+        FROM DaycareLocations l
+        LEFT JOIN DaycareData d ON d.daycare_id = l.daycare_id"""
+    join_params = []
+    if year:
+        query += " AND d.year = %s"
+        join_params.append(year)
+    if monthly_price:
+        query += " AND d.monthly_price = %s"
+        join_params.append(monthly_price)
+    query += f" WHERE {where} ORDER BY l.daycare_id, d.id"
+    return query, join_params + list(params)
+
+
+# Fold joined location/data rows into one dict per location with a "data" list.
+# The data columns are serialized column by column in a single pass over all locations.
+def group_location_rows(rows, fields=LOCATION_FIELDS, description=None):
+    grouped = {}
+    data_rows = []
+    for row in rows:
+        if row["daycare_id"] not in grouped:
+            loc = {field: row[field] for field in fields}
+            loc["data"] = []
+            grouped[row["daycare_id"]] = loc
+
+        # a location without matching data comes back once with NULL data columns
+        if row["id"] is not None:
+            data_rows.append(row)
+
+    data_fields = {"daycare_id": "Daycare ID", **LOCATION_DATA_FIELDS}
+    for result in serialize_rows(data_rows, data_fields, description):
+        grouped[result["Daycare ID"]]["data"].append(result)
+    return list(grouped.values())
+
 # gets all the locations of daycares for Cara Days business planning page
 # right now it has filters but gonna get rid of them once this starts working
 @locations.route("/locations", methods=["GET"])
@@ -27,23 +95,70 @@ def get_all_locations():
         country = request.args.get("country_code")
         city = request.args.get("city")
         owner_id = request.args.get("owner_id")
+        ids = request.args.get("ids")
+        include = request.args.get("include")
+
+        current_app.logger.debug(f'Query parameters - country: {country}, city: {city}, owner: {owner_id}, ids: {ids}, include: {include}')
 
-        current_app.logger.debug(f'Query parameters - country: {country}, city: {city}, owner: {owner_id}')
+        # Only select the columns the client asked for
+        fields = parse_fields(LOCATION_FIELDS, "daycare_id")
 
-        # Prepare the Base query
-        query = "SELECT * FROM DaycareLocations WHERE inactive = FALSE"
+        # Prepare the Base filters
+        where = "l.inactive = FALSE"
         params = []
 
         # Add filters if provided
         if country:
-            query += " AND country_code = %s"
+            where += " AND l.country_code = %s"
             params.append(country)
         if city:
-            query += " AND city = %s"
+            where += " AND l.city = %s"
             params.append(city)
         if owner_id:
-            query += " AND owner_id = %s"
+            where += " AND l.owner_id = %s"
             params.append(owner_id)
+        if ids:
+            try:
+                id_list = [int(daycare_id) for daycare_id in ids.split(",") if daycare_id.strip()]
+            except ValueError:
+                return jsonify({"error": "ids must be a comma-separated list of integers"}), 400
+            if not id_list:
+                return jsonify({"error": "ids must not be empty"}), 400
+            where += f" AND l.daycare_id IN ({', '.join(['%s'] * len(id_list))})"
+            params.extend(id_list)
+
+        # Locations together with their data, in one joined query
+        if include == "data":
+            if page_requested():
+                return jsonify({"error": "include=data cannot be combined with limit or cursor"}), 400
+            query, params = location_data_query(
+                where,
+                params,
+                fields,
+                year=request.args.get("year"),
+                monthly_price=request.args.get("monthly_price"),
+            )
+            current_app.logger.debug(f'Executing query: {query} with params: {params}')
+            cursor.execute(query, params)
+            locations = group_location_rows(cursor.fetchall(), fields, cursor.description)
+            cursor.close()
+
+            current_app.logger.info(f'Successfully retrieved {len(locations)} Locations with data')
+            return jsonify(locations), 200
+        elif include:
+            return jsonify({"error": "include only supports 'data'"}), 400
+
+        query = f"SELECT {', '.join(f'l.{field}' for field in fields)} FROM DaycareLocations l WHERE {where}"
+
+        # One page at a time, keyed on daycare_id, when ?limit= or ?cursor= is given
+        if page_requested():
+            limit, after = parse_page()
+            current_app.logger.debug(f'Executing paged query: {query} with params: {params}, after: {after}')
+            locations, next_cursor = fetch_page(cursor, query, params, "daycare_id", limit, after)
+            cursor.close()
+
+            current_app.logger.info(f'Successfully retrieved a page of {len(locations)} Locations')
+            return jsonify(page_envelope(locations, next_cursor, limit)), 200
 
         current_app.logger.debug(f'Executing query: {query} with params: {params}')
         cursor.execute(query, params)
@@ -54,6 +169,8 @@ def get_all_locations():
         current_app.logger.info(f'Successfully retrieved {len(locations)} Locations')
         return jsonify(locations), 200
 
+    except PaginationError as e:
+        return jsonify({"error": str(e)}), 400
     except Error as e:
         current_app.logger.error(f'Database error in get_all_locations: {str(e)}')
         return jsonify({"error": str(e)}), 500
@@ -100,6 +217,88 @@ def add_new_location():
         return jsonify({"error": str(e)}), 500
 
 
+# fields of a bulk location record and their types
+BULK_LOCATION_COLUMNS = {
+    "daycare_id": "int",
+    "daycare_name": "text",
+    "city": "text",
+    "country_code": "text",
+    "owner_id": "int",
+    "inactive": "bool",
+}
+
+# Create and update many daycare locations in one transaction.
+# A record without daycare_id is a new location (same required fields as POST /locations);
+# a record with one updates that location, changing only the fields sent (not null).
+@locations.route("/locations/bulk", methods=["POST"])
+def bulk_upsert_locations():
+    try:
+        current_app.logger.info('Starting bulk_upsert_locations request')
+        records = parse_records()
+        required = ("daycare_name", "city", "country_code", "owner_id")
+
+        results = [None] * len(records)
+        valid = []
+        for i, record in enumerate(records):
+            is_update = isinstance(record, dict) and record.get("daycare_id") is not None
+            row, error = check_record(record, BULK_LOCATION_COLUMNS, required=() if is_update else required)
+            if error:
+                results[i] = {"index": i, "status": "error", "error": error}
+            else:
+                valid.append((i, row))
+
+        conn = db.get_db()
+        cursor = conn.cursor()
+        try:
+            # unknown owners would fail the foreign key for the whole statement
+            known_locations = {r["daycare_id"] for r in fetch_in(
+                cursor, "SELECT daycare_id FROM DaycareLocations WHERE daycare_id IN ({})",
+                {row[0] for _, row in valid if row[0] is not None},
+            )}
+            known_owners = {r["user_id"] for r in fetch_in(
+                cursor, "SELECT user_id FROM User WHERE user_id IN ({})",
+                {row[4] for _, row in valid if row[4] is not None},
+            )}
+
+            inserts, updates = [], []
+            for i, row in valid:
+                if row[0] is not None and row[0] not in known_locations:
+                    results[i] = {"index": i, "status": "error", "error": "Daycare not found"}
+                elif row[4] is not None and row[4] not in known_owners:
+                    results[i] = {"index": i, "status": "error", "error": "Owner not found"}
+                elif row[0] is None:
+                    inserts.append((i, row))
+                else:
+                    results[i] = {"index": i, "status": "updated", "daycare_id": row[0]}
+                    updates.append(row)
+
+            columns = list(BULK_LOCATION_COLUMNS)
+            insert_rows(cursor, "DaycareLocations", columns, updates, update_columns=columns[1:])
+
+            # new locations: inactive defaults to FALSE, ids are assigned by MySQL
+            new_rows = [row[1:5] + (bool(row[5]),) for _, row in inserts]
+            new_ids = insert_rows(cursor, "DaycareLocations", columns[1:], new_rows)
+            for (i, _), daycare_id in zip(inserts, new_ids):
+                results[i] = {"index": i, "status": "inserted", "daycare_id": daycare_id}
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        if inserts or updates:
+            table_versions.bump("DaycareLocations")
+        current_app.logger.info(f'Bulk inserted {len(inserts)} and updated {len(updates)} Daycare Locations')
+        return jsonify(summary(results)), 200
+
+    except BulkError as e:
+        return jsonify({"error": str(e)}), 400
+    except pymysql.MySQLError as e:
+        current_app.logger.error(f'Database error in bulk_upsert_locations: {str(e)}')
+        return jsonify({"error": str(e)}), 500
+
 # deletes daycare by setting it as inactive
 @locations.route("/locations/<int:daycare_id>", methods=["DELETE"])
 def delete_location(daycare_id):
@@ -132,76 +331,22 @@ def get_location_data(daycare_id):
     try:
         cursor = db.get_db().cursor()
 
-        # Get NGO details
-        cursor.execute("SELECT * FROM DaycareLocations WHERE daycare_id = %s", (daycare_id,))
-        loc = cursor.fetchone()
-
-        if not loc:
-            return jsonify({"error": "Location not found"}), 404
-
-        # Get associated data
-        query = "SELECT * FROM DaycareData WHERE daycare_id = %s"
-        params = []
-        params.append(daycare_id)
-        year = request.args.get("year")
-        monthly_price = request.args.get("monthly_price")
-        if year:
-            query += " AND year = %s"
-            params.append(year)
-        if monthly_price:
-            query += " AND monthly_price = %s"
-            params.append(monthly_price)
-
+        # Get the location and its associated data in one joined query
+        query, params = location_data_query(
+            "l.daycare_id = %s",
+            [daycare_id],
+            year=request.args.get("year"),
+            monthly_price=request.args.get("monthly_price"),
+        )
         cursor.execute(query, params)
+        rows = cursor.fetchall()
+        cursor.close()
 
-        daycare_data = cursor.fetchall()
-
-        #-----------------------------------------------------------------------------#
-        # this beautiful addition is credited to emily moy and her project last year
-        # it is necessary because json hates the time data type
-        # basically it turns it to a format that json likes 
-        results = []
-
-        # Groups the date and time so that it is in a jsonifiable format
-        for row in daycare_data:
-
-            time1 = row['opening_time']
-            time2 = row['closing_time']
-            year1 = row['year']
-            #If the time is in a format that isnt jsonifable change the format to the standard time format
-            if isinstance(time1, datetime.timedelta):
-                jsonifiable_time = (datetime.datetime.min + time1).time()
-            else:
-                jsonifiable_time = time1
-            
-            if isinstance(time2, datetime.timedelta):
-                jsonifiable_time2 = (datetime.datetime.min + time2).time()
-            else:
-                jsonifiable_time2 = time2
-
-            
-            departure_time = jsonifiable_time
-            time_two = jsonifiable_time2
-
-            result = {
-                "ID": row["id"],
-                "Daycare ID": row["daycare_id"],
-                "Enrollment": row["enrollment"],
-                "Year": row["year"],
-                "Staff": row["staff"],
-                "Monthly Budget": row["monthly_budget"],
-                "Percent Budget Used": row["percent_budget_used"],
-                "Monthly Price": row["monthly_price"],
-                "Opening Time": departure_time.isoformat(),
-                "Closing Time": time_two.isoformat()
-            }
-
-            results.append(result)
-
-        # Combine data from multiple related queries into one object to return (after jsonify)
-        loc["data"] = results
+        if not rows:
+            return jsonify({"error": "Location not found"}), 404
 
-        cursor.close()
+        # Combine the location and its data rows into one object to return (after jsonify)
+        loc = group_location_rows(rows, description=cursor.description)[0]
         return jsonify(loc), 200
     except Error as e:
         return jsonify({"error": str(e)}), 500
\ No newline at end of file
@@ -1,10 +1,190 @@
 #------------------------------------------------------------
 # This file creates a shared DB connection resource
+#
+# Connections come from a bounded pool instead of being opened
+# for every request. `db.get_db()` checks a connection out the
+# first time it is called in an app context and the connection
+# goes back to the pool when that context is torn down.
 #------------------------------------------------------------
-from flaskext.mysql import MySQL
+import threading
+import time
+from collections import deque
+
+import pymysql
+from flask import g
 from pymysql import cursors
 
 
-# the parameter instructs the connection to return data 
-# as a dictionary object. 
-db = MySQL(cursorclass=cursors.DictCursor)
\ No newline at end of file
+class PoolTimeoutError(pymysql.err.OperationalError):
+    """Raised when no connection becomes free within the checkout timeout"""
+
+
+class ConnectionPool:
+    """Bounded pool of PyMySQL connections, used as a drop-in for flaskext.mysql.MySQL"""
+
+    def __init__(self, cursorclass=cursors.DictCursor, max_size=10, checkout_timeout=10.0,
+                 max_lifetime=3600.0):
+        self.cursorclass = cursorclass
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_lifetime = max_lifetime
+        self._connect_kwargs = None
+
+        self._idle = deque()
+        self._created_at = {}
+        self._in_use = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+        # metrics
+        self._opened = 0
+        self._closed = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def init_app(self, app):
+        """Read the MYSQL_DATABASE_* settings and release connections on teardown"""
+        config = app.config
+        self._connect_kwargs = {
+            "host": config.get("MYSQL_DATABASE_HOST", "localhost"),
+            "port": config.get("MYSQL_DATABASE_PORT", 3306),
+            "user": config.get("MYSQL_DATABASE_USER"),
+            "password": config.get("MYSQL_DATABASE_PASSWORD"),
+            "database": config.get("MYSQL_DATABASE_DB"),
+            "charset": config.get("MYSQL_DATABASE_CHARSET", "utf8"),
+            "cursorclass": self.cursorclass,
+        }
+        self.max_size = config.get("MYSQL_POOL_SIZE", self.max_size)
+        self.checkout_timeout = config.get("MYSQL_POOL_TIMEOUT", self.checkout_timeout)
+        self.max_lifetime = config.get("MYSQL_POOL_MAX_LIFETIME", self.max_lifetime)
+        app.teardown_appcontext(self.teardown)
+
+    def get_db(self):
+        """Connection for the current app context, checked out from the pool on first use"""
+        if "mysql_db" not in g:
+            g.mysql_db = self.checkout()
+        return g.mysql_db
+
+    def teardown(self, exception):
+        conn = g.pop("mysql_db", None)
+        if conn is not None:
+            self.release(conn)
+
+    def checkout(self):
+        """Take a healthy connection from the pool, opening one if there is room"""
+        started = time.monotonic()
+        deadline = started + self.checkout_timeout
+        with self._available:
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._in_use += 1
+                    break
+                if self._in_use + len(self._idle) < self.max_size:
+                    conn = None
+                    self._in_use += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No database connection available after {self.checkout_timeout}s"
+                    )
+                self._available.wait(remaining)
+
+        try:
+            if conn is not None and not self._is_healthy(conn):
+                self._close(conn)
+                conn = None
+            if conn is None:
+                conn = self._open()
+        except Exception:
+            with self._available:
+                self._in_use -= 1
+                self._available.notify()
+            raise
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return conn
+
+    def release(self, conn):
+        """Return a connection to the pool, or close it if it is broken or too old"""
+        keep = not self._expired(conn)
+        if keep:
+            try:
+                # end any open transaction so the next user gets a fresh snapshot
+                conn.rollback()
+            except Exception:
+                keep = False
+        if not keep:
+            self._close(conn)
+
+        with self._available:
+            self._in_use -= 1
+            if keep:
+                self._idle.append(conn)
+            self._available.notify()
+
+    def stats(self):
+        """Pool metrics: connections in use and idle, plus checkout wait times"""
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "opened": self._opened,
+                "closed": self._closed,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_seconds_total": round(self._wait_total, 6),
+                "wait_seconds_avg": round(self._wait_total / self._checkouts, 6) if self._checkouts else 0.0,
+                "wait_seconds_max": round(self._wait_max, 6),
+            }
+
+    def close_all(self):
+        """Close every idle connection (connections in use are closed when released)"""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn in idle:
+            self._close(conn)
+
+    def _open(self):
+        conn = pymysql.connect(**self._connect_kwargs)
+        with self._lock:
+            self._created_at[id(conn)] = time.monotonic()
+            self._opened += 1
+        return conn
+
+    def _close(self, conn):
+        with self._lock:
+            self._created_at.pop(id(conn), None)
+            self._closed += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _expired(self, conn):
+        created_at = self._created_at.get(id(conn))
+        return created_at is None or time.monotonic() - created_at > self.max_lifetime
+
+    def _is_healthy(self, conn):
+        if self._expired(conn):
+            return False
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+
+# the parameter instructs the connection to return data
+# as a dictionary object.
+db = ConnectionPool(cursorclass=cursors.DictCursor)
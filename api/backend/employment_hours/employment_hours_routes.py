@@ -9,6 +9,8 @@ from flask import (
 )
 import json
 from backend.db_connection import db
+from backend.streaming import wants_stream, stream_query
+from backend.http_cache import conditional
 from mysql.connector import Error
 import datetime
 
@@ -16,6 +18,7 @@ hours = Blueprint("hours", __name__)
 
 # gets all weekly working hours of full time adults
 @hours.route("/weeklyhours", methods=["GET"])
+@conditional("EUEmployment", column="eue_id")
 def get_all_hours():
     try: 
         cursor = db.get_db().cursor()
@@ -37,6 +40,12 @@ def get_all_hours():
             params.append(sex)
 
         current_app.logger.debug(f'Executing query: {query} with params: {params}')
+
+        # stream large results row by row when the client asks for NDJSON
+        if wants_stream():
+            cursor.close()
+            return stream_query(query, params)
+
         cursor.execute(query, params)
 
         hours = cursor.fetchall()
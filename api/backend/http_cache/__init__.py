@@ -0,0 +1,80 @@
+#------------------------------------------------------------
+# Conditional GET support for routes that serve reference data.
+#
+# @conditional(table) gives a route a strong ETag built from the
+# table's data version (backend.caching.table_versions) and the
+# request's path and query string, plus Last-Modified and
+# Cache-Control headers. A request whose If-None-Match (or, when
+# no ETag is sent, If-Modified-Since) still matches gets an empty
+# 304 without running the route. The table version itself is
+# re-read from MySQL at most once per table_versions.ttl seconds,
+# so most revalidations never reach the database.
+#------------------------------------------------------------
+import functools
+import hashlib
+
+import pymysql
+from flask import current_app, make_response, request
+
+from backend.caching import table_versions
+from backend.streaming import wants_stream
+
+# seconds clients and proxies may reuse a response without revalidating
+DEFAULT_MAX_AGE = 300
+
+
+def request_etag(table, version):
+    """Strong ETag for the current request against one version of a table"""
+    args = sorted(request.args.items(multi=True))
+    # JSON and NDJSON bodies of the same query differ, so they get different tags
+    key = f"{table}|{version}|{request.path}|{args}|{wants_stream()}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def not_modified(etag, last_modified):
+    """True when the request's validators still match the current response"""
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    since = request.if_modified_since
+    # HTTP dates have one-second resolution
+    return since is not None and last_modified is not None and int(last_modified) <= since.timestamp()
+
+
+def set_cache_headers(response, etag, last_modified, max_age):
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = int(last_modified)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.vary.add("Accept")
+    return response
+
+
+def conditional(table, column="year", max_age=DEFAULT_MAX_AGE):
+    """Decorator adding ETag / Last-Modified / Cache-Control handling for a route reading `table`.
+
+    `column` is the column table_versions fingerprints the table with.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                version = table_versions.get(table, column)
+            except pymysql.MySQLError as e:
+                # without a version there is nothing to validate against, serve it uncached
+                current_app.logger.warning(f'No data version for {table}, skipping HTTP caching: {str(e)}')
+                return view(*args, **kwargs)
+
+            etag = request_etag(table, version)
+            last_modified = table_versions.last_modified(table)
+
+            if not_modified(etag, last_modified):
+                response = current_app.response_class(status=304)
+                return set_cache_headers(response, etag, last_modified, max_age)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                set_cache_headers(response, etag, last_modified, max_age)
+            return response
+        return wrapper
+    return decorator
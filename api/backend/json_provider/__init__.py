@@ -0,0 +1,84 @@
+#------------------------------------------------------------
+# App-wide JSON provider backed by orjson.
+#
+# Installed on the app in create_app, so jsonify, request.json
+# and the NDJSON streams all go through it. orjson encodes
+# dicts, lists, str, int, float, UUIDs, dataclasses and NumPy
+# arrays and scalars in native code. The types MySQL hands back
+# that JSON has no form for are written exactly as Flask's
+# default provider writes them, so clients see the same body:
+#   Decimal            -> "12.50"
+#   date / datetime    -> "Mon, 01 Jan 2024 00:00:00 GMT"
+#   timedelta (TIME)   -> "08:30:00"
+#
+# One difference: NaN and infinity are written as null (valid
+# JSON) instead of the bare NaN the standard library emits.
+#------------------------------------------------------------
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import orjson
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+from backend.serialization import time_to_iso
+
+# numpy arrays and scalars are encoded natively; datetimes are handed to
+# default() so they keep Flask's HTTP date format instead of orjson's RFC 3339
+OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def orjson_default(value):
+    """Encode the values orjson does not handle itself"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime.date):
+        return http_date(value)
+    if isinstance(value, (datetime.timedelta, datetime.time)):
+        return time_to_iso(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with orjson doing the encoding and decoding"""
+
+    def options(self, indent=False):
+        option = OPTIONS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps_bytes(self, obj, indent=False):
+        """Serialize obj as UTF-8 encoded JSON"""
+        return orjson.dumps(obj, default=orjson_default, option=self.options(indent))
+
+    def dumps(self, obj, **kwargs):
+        # callers asking for json.dumps specific behaviour (cls=, ensure_ascii=, ...)
+        # get the standard library encoder
+        indent = kwargs.pop("indent", None)
+        kwargs.pop("separators", None)
+        if kwargs:
+            if indent is not None:
+                kwargs["indent"] = indent
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, indent=bool(indent)).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        # the encoded bytes go straight into the response, no str round trip
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=indent) + b"\n", mimetype=self.mimetype
+        )
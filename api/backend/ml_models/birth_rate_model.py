@@ -0,0 +1,103 @@
+#------------------------------------------------------------
+# Model 1: linear regression of the birth rate on standardized
+# policy features, served from a registry artifact (see
+# backend.ml_models.registry) or the weights in Model1Weights.
+#
+# Each feature is either a raw input (weekly_hours, year, ...)
+# or a power of one (weekly_hours_squared, ..._cubed). The
+# standardization is folded into the weights once at load time:
+#     y = b + sum(w_i * (x_i - mean_i) / std_i)
+#       = (b - sum(w_i * mean_i / std_i)) + sum((w_i / std_i) * x_i)
+# so predicting any number of inputs is one matrix product of the
+# raw design matrix with a single coefficient vector.
+#------------------------------------------------------------
+import numpy as np
+
+# suffix of a derived feature and the power of its raw input
+POWERS = {"_squared": 2, "_cubed": 3}
+
+# raw inputs with a default when the caller leaves them out
+INPUT_DEFAULTS = {"year": 2024}
+
+
+def feature_source(feature):
+    """(raw input, power) a feature is computed from, e.g. ('weekly_hours', 2)"""
+    for suffix, power in POWERS.items():
+        if feature.endswith(suffix):
+            return feature[: -len(suffix)], power
+    return feature, 1
+
+
+class BirthRateModel:
+    """Model 1 weights with the standardization folded into one coefficient vector"""
+
+    def __init__(self, features, weights, means, stds, intercept, version=None, metrics=None):
+        self.features = list(features)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.means = np.asarray(means, dtype=np.float64)
+        self.stds = np.asarray(stds, dtype=np.float64)
+        self.intercept = float(intercept)
+        self.version = version
+        self.metrics = dict(metrics or {})
+
+        # a feature without spread was not scaled in training
+        scale = np.where(self.stds > 0, self.stds, 1.0)
+        self.coefficients = self.weights / scale
+        self.offset = self.intercept - float(np.dot(self.coefficients, self.means))
+
+        self.sources = [feature_source(feature) for feature in self.features]
+        self.inputs = list(dict.fromkeys(name for name, _ in self.sources))
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build the model from Model1Weights rows (feature_name, mean, std, weight)"""
+        intercept = 0.0
+        features, weights, means, stds = [], [], [], []
+        for row in rows:
+            if row["feature_name"] == "intercept":
+                intercept = float(row["weight"])
+                continue
+            features.append(row["feature_name"])
+            weights.append(float(row["weight"]))
+            means.append(float(row["mean"] or 0))
+            stds.append(float(row["std"] or 0))
+        return cls(features, weights, means, stds, intercept, version="Model1Weights")
+
+    @classmethod
+    def from_artifact(cls, arrays, version=None):
+        """Build the model from the arrays of a registry artifact"""
+        beta = arrays["beta"]
+        metrics = dict(zip(arrays["metric_names"].tolist(), arrays["metric_values"].tolist()))
+        return cls(
+            arrays["features"].tolist(), beta[1:], arrays["means"], arrays["stds"], beta[0],
+            version=version, metrics=metrics,
+        )
+
+    def design_matrix(self, columns):
+        """(N x features) matrix of raw feature values from {input: array of N values}"""
+        size = len(next(iter(columns.values()))) if columns else 0
+        matrix = np.empty((size, len(self.features)), dtype=np.float64)
+        for j, (name, power) in enumerate(self.sources):
+            values = columns[name]
+            matrix[:, j] = values if power == 1 else values ** power
+        return matrix
+
+    def predict(self, columns, clip=True):
+        """Birth rate per thousand for every row of {input: array}; negative values clipped to 0"""
+        predictions = self.design_matrix(columns) @ self.coefficients + self.offset
+        return np.maximum(predictions, 0.0) if clip else predictions
+
+    def describe(self):
+        """Weights and standardization parameters, in feature order"""
+        return {
+            "version": self.version,
+            "metrics": self.metrics,
+            "intercept": self.intercept,
+            "inputs": self.inputs,
+            "features": [
+                {"feature": feature, "weight": weight, "mean": mean, "std": std}
+                for feature, weight, mean, std in zip(
+                    self.features, self.weights.tolist(), self.means.tolist(), self.stds.tolist()
+                )
+            ],
+        }
@@ -0,0 +1,223 @@
+from flask import (
+    Blueprint,
+    request,
+    jsonify,
+    make_response,
+    current_app,
+)
+import math
+import numpy as np
+from backend.db_connection import db
+from backend.caching import VersionedCache, table_versions
+from backend.ml_models.birth_rate_model import BirthRateModel, INPUT_DEFAULTS
+from backend.ml_models.registry import registry, load_artifact
+
+# Blueprint for the Model 1 (birth rate) prediction routes
+model1_routes = Blueprint("model1_routes", __name__)
+
+# Registry name of the model artifacts
+MODEL_NAME = "model1"
+
+# Weights used while no artifact has been published
+WEIGHTS_TABLE = "Model1Weights"
+
+# The live model, rebuilt when a new artifact is published or the table changes
+model_cache = VersionedCache(maxsize=4, ttl=3600)
+
+# largest number of inputs accepted by one batch request
+MAX_BATCH_SIZE = 10000
+
+# largest number of points (product of the axis lengths) in one grid request
+MAX_GRID_POINTS = 250000
+
+
+# Read the weights table and build the model
+def load_model():
+    cursor = db.get_db().cursor()
+    cursor.execute(f"SELECT feature_name, mean, std, weight FROM {WEIGHTS_TABLE} ORDER BY weight_id")
+    rows = cursor.fetchall()
+    cursor.close()
+    return BirthRateModel.from_rows(rows)
+
+# Read a registry artifact and build the model
+def load_artifact_model(artifact):
+    version, path, _ = artifact
+    return BirthRateModel.from_artifact(load_artifact(path), version=f"v{version}")
+
+# Get the live model: the newest artifact, or Model1Weights when none is published.
+# A newly published artifact replaces the cached model on the next registry check.
+def get_model():
+    artifact = registry.latest(MODEL_NAME)
+    if artifact is not None:
+        return model_cache.get(MODEL_NAME, artifact, lambda: load_artifact_model(artifact))
+    version = table_versions.get(WEIGHTS_TABLE, "weight_id")
+    return model_cache.get(MODEL_NAME, version, load_model)
+
+def _input_value(record, name):
+    """Numeric input value, its default when missing, or NaN when it is not a number"""
+    value = record.get(name, INPUT_DEFAULTS.get(name)) if isinstance(record, dict) else None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return np.nan
+    return float(value)
+
+def parse_inputs(records, model):
+    """Validate many input dicts at once.
+
+    Returns {input: array of values} for every model input and a list with
+    an error message (or None) for every record.
+    """
+    raw = np.array(
+        [[_input_value(record, name) for name in model.inputs] for record in records],
+        dtype=np.float64,
+    ).reshape(len(records), len(model.inputs))
+
+    invalid = ~np.isfinite(raw)
+    errors = [None] * len(records)
+    for row in np.flatnonzero(invalid.any(axis=1)):
+        name = model.inputs[int(np.argmax(invalid[row]))]
+        errors[row] = f"Missing or non-numeric required field: {name}"
+
+    # invalid rows still get a value so the whole batch is one product
+    raw[invalid] = 0.0
+    return {name: raw[:, j] for j, name in enumerate(model.inputs)}, errors
+
+def axis_length(name, spec):
+    """Number of values a grid axis spec asks for, checked without building the axis"""
+    if isinstance(spec, dict):
+        # same rules as an input value: real, finite numbers, and num a real integer
+        bounds = [_input_value(spec, bound) for bound in ("start", "stop")]
+        num = spec.get("num", 50)
+        if not np.isfinite(bounds).all() or isinstance(num, bool) or not isinstance(num, int):
+            raise ValueError(f"grid axis {name} needs numeric start and stop and an integer num")
+        if num < 1:
+            raise ValueError(f"grid axis {name} needs num >= 1")
+        if num > MAX_GRID_POINTS:
+            raise ValueError(f"grid axis {name} has {num} points, at most {MAX_GRID_POINTS} are allowed")
+        return num
+    if isinstance(spec, list) and spec:
+        return len(spec)
+    raise ValueError(f"grid axis {name} must be a non-empty list of numbers or {{start, stop, num}}")
+
+def parse_axis(name, spec):
+    """Values of one grid axis: a list of numbers or {"start", "stop", "num"}"""
+    num = axis_length(name, spec)
+    if isinstance(spec, dict):
+        return np.linspace(float(spec["start"]), float(spec["stop"]), num)
+
+    values = np.array([_input_value({name: value}, name) for value in spec], dtype=np.float64)
+    if not np.isfinite(values).all():
+        raise ValueError(f"grid axis {name} must be a non-empty list of numbers or {{start, stop, num}}")
+    return values
+
+def error_response(message, status=400):
+    return make_response(jsonify({"error": message})), status
+
+@model1_routes.route("/api/model", methods=["GET"])
+def get_model_parameters():
+    """Weights and standardization parameters of the birth rate model"""
+    current_app.logger.info("GET /api/model handler")
+    try:
+        return jsonify(get_model().describe()), 200
+    except Exception as e:
+        current_app.logger.error(f"Error loading model 1: {str(e)}")
+        return make_response(jsonify({"error": "Error loading model", "message": str(e)})), 500
+
+@model1_routes.route("/api/predict", methods=["POST"])
+def predict_birth_rate():
+    """Predict the birth rate for one input dict, or for a list of them"""
+    current_app.logger.info("POST /api/predict handler")
+
+    try:
+        body = request.get_json(silent=True)
+        inputs = body.get("inputs") if isinstance(body, dict) else None
+        single = isinstance(inputs, dict)
+        records = [inputs] if single else inputs
+
+        if not isinstance(records, list) or not records:
+            return error_response("inputs must be an object or a non-empty list of objects")
+        if len(records) > MAX_BATCH_SIZE:
+            return error_response(f"At most {MAX_BATCH_SIZE} inputs can be sent per request")
+
+        model = get_model()
+        columns, errors = parse_inputs(records, model)
+        predictions = model.predict(columns)
+
+        if single:
+            if errors[0]:
+                return error_response(errors[0])
+            return jsonify({"inputs": inputs, "prediction": float(predictions[0])}), 200
+
+        results = [
+            {"index": i, "error": error} if error else {"index": i, "prediction": prediction}
+            for i, (prediction, error) in enumerate(zip(predictions.tolist(), errors))
+        ]
+        return jsonify({
+            "results": results,
+            "total": len(results),
+            "valid": sum(error is None for error in errors),
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f"Error in birth rate prediction: {str(e)}")
+        return make_response(jsonify({"error": "Error processing prediction request", "message": str(e)})), 500
+
+@model1_routes.route("/api/predict/grid", methods=["POST"])
+def predict_birth_rate_grid():
+    """Predict the birth rate over every combination of the given input ranges"""
+    current_app.logger.info("POST /api/predict/grid handler")
+
+    try:
+        body = request.get_json(silent=True)
+        grid = body.get("grid") if isinstance(body, dict) else None
+        fixed = body.get("fixed", {}) if isinstance(body, dict) else {}
+
+        if not isinstance(grid, dict) or not grid:
+            return error_response("grid must map at least one input to its values")
+        if not isinstance(fixed, dict):
+            return error_response("fixed must be an object")
+
+        model = get_model()
+        unknown = [name for name in list(grid) + list(fixed) if name not in model.inputs]
+        if unknown:
+            return error_response(f"Unknown input: {unknown[0]} (inputs are {', '.join(model.inputs)})")
+
+        # the grid size comes from the requested lengths, before any axis is built
+        try:
+            shape = [axis_length(name, spec) for name, spec in grid.items()]
+        except ValueError as e:
+            return error_response(str(e))
+        size = math.prod(shape)
+        if size > MAX_GRID_POINTS:
+            return error_response(f"The grid has {size} points, at most {MAX_GRID_POINTS} are allowed")
+
+        try:
+            axes = {name: parse_axis(name, spec) for name, spec in grid.items()}
+        except ValueError as e:
+            return error_response(str(e))
+
+        # every grid point as one row of the design matrix
+        mesh = np.meshgrid(*axes.values(), indexing="ij")
+        columns = {name: values.ravel() for name, values in zip(axes, mesh)}
+
+        # inputs outside the grid are the same for every point
+        for name in model.inputs:
+            if name in columns:
+                continue
+            value = _input_value(fixed, name)
+            if not np.isfinite(value):
+                return error_response(f"Missing or non-numeric fixed value: {name}")
+            columns[name] = np.full(size, value)
+
+        predictions = model.predict(columns).reshape(shape)
+        # predictions[i][j]... follows the axis order in dims
+        return jsonify({
+            "dims": list(axes),
+            "axes": {name: values.tolist() for name, values in axes.items()},
+            "fixed": {name: fixed.get(name, INPUT_DEFAULTS.get(name)) for name in model.inputs if name not in axes},
+            "shape": shape,
+            "predictions": predictions.tolist(),
+        }), 200
+
+    except Exception as e:
+        current_app.logger.error(f"Error in birth rate grid prediction: {str(e)}")
+        return make_response(jsonify({"error": "Error processing prediction request", "message": str(e)})), 500
@@ -0,0 +1,124 @@
+#------------------------------------------------------------
+# Versioned model artifacts on disk.
+#
+# Every trained model is one uncompressed .npz file holding
+# everything inference needs, so nothing is copied by hand into
+# tables or pages:
+#     beta           intercept followed by one weight per feature
+#     means, stds    standardization of each feature in training
+#     features       feature names, in the order of the weights
+#     metric_names, metric_values   training metrics (r2, mae, ...)
+#
+# Artifacts live in <root>/<model name>/v0001.npz, v0002.npz, ...
+# and the highest version is the live one. Publishing writes a
+# new version atomically, and the API picks it up on its next
+# check without a restart; removing the newest file rolls back.
+#------------------------------------------------------------
+import io
+import os
+import re
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+# api/models, next to the backend package (the api folder is mounted into the container)
+DEFAULT_ROOT = os.getenv(
+    "MODEL_REGISTRY_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "models"),
+)
+
+ARTIFACT_NAME = re.compile(r"^v(\d+)\.npz$")
+
+
+def save_artifact(path, beta, means, stds, features, metrics=None):
+    """Write one artifact file; readers never see a half-written file"""
+    metrics = metrics or {}
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+
+    handle, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as f:
+            np.savez(
+                f,
+                beta=np.asarray(beta, dtype=np.float64),
+                means=np.asarray(means, dtype=np.float64),
+                stds=np.asarray(stds, dtype=np.float64),
+                features=np.asarray(features, dtype=str),
+                metric_names=np.asarray(list(metrics), dtype=str),
+                metric_values=np.asarray(list(metrics.values()), dtype=np.float64),
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_artifact(path):
+    """{array name: array} of one artifact, read from disk in a single read"""
+    with open(path, "rb") as f:
+        data = f.read()
+    with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+        return {name: arrays[name] for name in arrays.files}
+
+
+class ModelRegistry:
+    """Versioned artifacts per model name, re-scanned at most once per check_interval seconds"""
+
+    def __init__(self, root=DEFAULT_ROOT, check_interval=5):
+        self.root = root
+        self.check_interval = check_interval
+        self._latest = {}
+        self._lock = threading.Lock()
+
+    def path(self, name, version):
+        return os.path.join(self.root, name, f"v{version:04d}.npz")
+
+    def versions(self, name):
+        """Every published version of a model, oldest first"""
+        try:
+            entries = os.listdir(os.path.join(self.root, name))
+        except FileNotFoundError:
+            return []
+        return sorted(int(match.group(1)) for match in map(ARTIFACT_NAME.match, entries) if match)
+
+    def latest(self, name):
+        """(version, path, mtime) of the live artifact, or None when nothing is published.
+
+        The mtime is part of the result so an artifact replaced in place
+        also counts as a new model.
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._latest.get(name)
+        if cached is not None and now - cached[1] < self.check_interval:
+            return cached[0]
+
+        versions = self.versions(name)
+        current = None
+        if versions:
+            path = self.path(name, versions[-1])
+            try:
+                current = (versions[-1], path, os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                # removed between the listing and the stat, look again next time
+                current = None
+
+        with self._lock:
+            self._latest[name] = (current, now)
+        return current
+
+    def publish(self, name, beta, means, stds, features, metrics=None):
+        """Save a new version of a model and return its version number"""
+        versions = self.versions(name)
+        version = versions[-1] + 1 if versions else 1
+        save_artifact(self.path(name, version), beta, means, stds, features, metrics)
+        with self._lock:
+            self._latest.pop(name, None)
+        return version
+
+
+# shared across every blueprint in this process
+registry = ModelRegistry()
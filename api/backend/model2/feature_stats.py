@@ -0,0 +1,126 @@
+#------------------------------------------------------------
+# Materialized feature statistics for /model2/api/features/stats
+#
+# Statistics are computed for every feature in one pass over the
+# country snapshot and stored in the FeatureStatistics table,
+# tagged with the data version they were computed from.
+#------------------------------------------------------------
+import json
+from datetime import datetime
+
+import numpy as np
+
+from backend.db_connection import db
+
+# percentiles stored for every feature (used by the predictor page sliders)
+PERCENTILES = [5, 10, 25, 50, 75, 90, 95]
+
+# number of histogram bins stored for every feature
+HISTOGRAM_BINS = 10
+
+
+def _clean(value):
+    """Convert a numpy value to a JSON-friendly float (None for NaN)"""
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+def compute_feature_statistics(df, features):
+    """Compute summary statistics, percentiles and histograms for all features at once"""
+    values = df[features].to_numpy(dtype=np.float64)
+    count = values.shape[0]
+
+    if count == 0:
+        return {}
+
+    # one vectorized reduction per statistic across every feature column
+    mins = np.nanmin(values, axis=0)
+    maxs = np.nanmax(values, axis=0)
+    means = np.nanmean(values, axis=0)
+    # ddof=1 to match pandas' Series.std()
+    stds = np.nanstd(values, axis=0, ddof=1) if count > 1 else np.full(len(features), np.nan)
+    quantiles = np.nanpercentile(values, PERCENTILES + [50], axis=0)
+
+    stats = {}
+    for i, feature in enumerate(features):
+        column = values[:, i]
+        counts, edges = np.histogram(column[~np.isnan(column)], bins=HISTOGRAM_BINS)
+        stats[feature] = {
+            "min": _clean(mins[i]),
+            "max": _clean(maxs[i]),
+            "mean": _clean(means[i]),
+            "median": _clean(quantiles[-1, i]),
+            "std": _clean(stds[i]),
+            "percentiles": {f"p{p}": _clean(quantiles[j, i]) for j, p in enumerate(PERCENTILES)},
+            "histogram": {
+                "bin_edges": [_clean(edge) for edge in edges],
+                "counts": counts.tolist(),
+            },
+        }
+    return stats
+
+
+def write_feature_statistics(stats, data_points, data_version):
+    """Replace the materialized statistics in a single transaction"""
+    refreshed_at = datetime.now()
+    rows = [
+        (
+            feature,
+            data_version,
+            data_points,
+            stat["min"],
+            stat["max"],
+            stat["mean"],
+            stat["median"],
+            stat["std"],
+            json.dumps(stat["percentiles"]),
+            json.dumps(stat["histogram"]),
+            refreshed_at,
+        )
+        for feature, stat in stats.items()
+    ]
+
+    conn = db.get_db()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DELETE FROM FeatureStatistics")
+        cursor.executemany(
+            """
+            INSERT INTO FeatureStatistics (feature_name, data_version, data_points, min_value,
+                                           max_value, mean_value, median_value, std_value,
+                                           percentiles, histogram, refreshed_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """,
+            rows,
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def read_feature_statistics():
+    """Load the materialized statistics as {feature: stats}, plus their data version and size"""
+    cursor = db.get_db().cursor()
+    cursor.execute("SELECT * FROM FeatureStatistics")
+    rows = cursor.fetchall()
+    cursor.close()
+
+    stats = {}
+    data_version = None
+    data_points = 0
+    for row in rows:
+        data_version = row["data_version"]
+        data_points = row["data_points"]
+        stats[row["feature_name"]] = {
+            "min": row["min_value"],
+            "max": row["max_value"],
+            "mean": row["mean_value"],
+            "median": row["median_value"],
+            "std": row["std_value"],
+            "percentiles": json.loads(row["percentiles"]) if row["percentiles"] else None,
+            "histogram": json.loads(row["histogram"]) if row["histogram"] else None,
+        }
+    return stats, data_version, data_points
@@ -8,12 +8,20 @@ from flask import (
     url_for,
 )
 import json
+import click
 import pandas as pd
 import numpy as np
 from backend.db_connection import db
+from backend.caching import VersionedCache, table_versions
+from backend.model2.recommender import CountryRecommender
+from backend.model2.feature_stats import (
+    compute_feature_statistics,
+    read_feature_statistics,
+    write_feature_statistics,
+)
 
 # This blueprint handles some basic routes that you can use for testing
-model2_routes = Blueprint("model2_routes", __name__)
+model2_routes = Blueprint("model2_routes", __name__, cli_group="model2")
 
 # Features used in the recommendation model
 FEATURES = ["weekly_hours", "cash_per_capita", "maternity_per_capita", "services_per_capita"]
@@ -25,6 +33,40 @@ def normalize_user_input(user_input, max_scale=10):
     """Normalize user input from 0-10 scale to 0-1"""
     return np.array([user_input[feature] / max_scale for feature in FEATURES])
 
+def _preference_value(user_input, feature):
+    """Numeric preference value, or NaN when it is missing or not a number"""
+    value = user_input.get(feature) if isinstance(user_input, dict) else None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return np.nan
+    return float(value)
+
+def normalize_user_inputs(user_inputs, max_scale=10):
+    """Validate and normalize many preference dicts at once.
+
+    Returns the (N x features) matrix on the 0-1 scale and a list with an
+    error message (or None) for every input. /api/recommend validates its
+    single input through here too, so both routes report the same error:
+    the one for the first feature, in FEATURES order, that is invalid.
+    """
+    raw = np.array(
+        [[_preference_value(user_input, feature) for feature in FEATURES] for user_input in user_inputs],
+        dtype=np.float64,
+    ).reshape(len(user_inputs), len(FEATURES))
+
+    missing = np.isnan(raw)
+    out_of_range = ~missing & ((raw < 0) | (raw > max_scale))
+
+    invalid = missing | out_of_range
+    errors = [None] * len(user_inputs)
+    for row in np.flatnonzero(invalid.any(axis=1)):
+        column = int(np.argmax(invalid[row]))
+        if missing[row, column]:
+            errors[row] = f"Missing or non-numeric required field: {FEATURES[column]}"
+        else:
+            errors[row] = f"{FEATURES[column]} must be between 0 and {max_scale}"
+
+    return raw / max_scale, errors
+
 # computee cosine similarity between user preferences and country features
 def compute_cosine_similarity(user_vec, country_vec):
     dot = np.dot(user_vec, country_vec)
@@ -119,13 +161,72 @@ def normalize_country_features(df):
     
     return df_norm
 
+# Source table of the country snapshots
+COUNTRY_DATA_TABLE = "eu_family_employment_data"
+# primary key, so rows replaced in place (pipeline upserts) still change the version
+COUNTRY_DATA_KEY = "eu_fed_id"
+
+# Snapshots derived from COUNTRY_DATA_TABLE, rebuilt when its version changes
+country_cache = VersionedCache(maxsize=16, ttl=3600)
+
+# Get the latest country data, reusing the cached DataFrame while the table is unchanged
+# (callers must not modify the returned DataFrame)
+def get_country_snapshot():
+    version = table_versions.get(COUNTRY_DATA_TABLE, COUNTRY_DATA_KEY)
+    return country_cache.get("latest_country_data", version, get_latest_country_data)
+
+# Get the recommender engine built from the current country snapshot
+def get_recommender():
+    version = table_versions.get(COUNTRY_DATA_TABLE, COUNTRY_DATA_KEY)
+    return country_cache.get(
+        "recommender",
+        version,
+        lambda: CountryRecommender(get_country_snapshot(), FEATURES),
+    )
+
+# Recompute the materialized feature statistics from the latest data and store them
+def refresh_feature_statistics(version):
+    df = get_latest_country_data()
+    stats = compute_feature_statistics(df, FEATURES)
+    try:
+        write_feature_statistics(stats, len(df), version)
+    except Exception as e:
+        # still serve the fresh numbers if the summary table cannot be written
+        current_app.logger.warning(f"Could not store feature statistics: {str(e)}")
+    return {"statistics": stats, "data_points": len(df)}
+
+# Load the materialized feature statistics, refreshing them if the data has changed
+def load_feature_statistics(version):
+    try:
+        stats, stored_version, data_points = read_feature_statistics()
+    except Exception as e:
+        current_app.logger.warning(f"Could not read feature statistics: {str(e)}")
+        stats, stored_version, data_points = {}, None, 0
+
+    if stored_version != version or set(stats) != set(FEATURES):
+        return refresh_feature_statistics(version)
+    return {"statistics": stats, "data_points": data_points}
+
+@model2_routes.cli.command("refresh-feature-stats")
+def refresh_feature_stats_command():
+    """Recompute the FeatureStatistics table in one pass over the data"""
+    version = table_versions.get(COUNTRY_DATA_TABLE, COUNTRY_DATA_KEY)
+    df = get_latest_country_data()
+    stats = compute_feature_statistics(df, FEATURES)
+    write_feature_statistics(stats, len(df), version)
+    country_cache.invalidate("feature_statistics")
+    click.echo(
+        f"Refreshed statistics for {len(stats)} features "
+        f"over {len(df)} countries (data version {version})"
+    )
+
 @model2_routes.route('/api/countries/data', methods=['GET'])
 def get_countries_data():
     """Get all available countries with their latest data"""
     current_app.logger.info("GET /api/countries/data handler")
     
     try:
-        df = get_latest_country_data()
+        df = get_country_snapshot()
         
         # Convert DataFrame to list of dictionaries
         countries = df.to_dict('records')
@@ -156,60 +257,26 @@ def recommend_countries():
         # Get user input from request body
         user_input = request.json
         
-        # Validate input
-        for feature in FEATURES:
-            if feature not in user_input:
-                return make_response(jsonify({
-                    "error": f"Missing required field: {feature}"
-                })), 400
-            
-            # Ensure values are between 0 and 10
-            if not (0 <= user_input[feature] <= 10):
-                return make_response(jsonify({
-                    "error": f"{feature} must be between 0 and 10"
-                })), 400
+        # Validate input with the same rules and messages as the batch route
+        user_matrix, errors = normalize_user_inputs([user_input])
+        if errors[0]:
+            return make_response(jsonify({
+                "error": errors[0]
+            })), 400
         
-        # Get latest country data
-        df = get_latest_country_data()
+        engine = get_recommender()
         
-        if df.empty:
+        if engine.size == 0:
             return make_response(jsonify({
                 "error": "No country data available"
             })), 404
         
-        # Normalize country features
-        df_norm = normalize_country_features(df)
-        
-        # Normalize user input
-        user_vec = normalize_user_input(user_input)
-        
-        # Compute similarities
-        similarities = []
-        for _, row in df_norm.iterrows():
-            country_vec = row[FEATURES].values
-            similarity = compute_cosine_similarity(user_vec, country_vec)
-            similarities.append(similarity)
-        
-        df['similarity_score'] = similarities
+        # Normalized user input
+        user_vec = user_matrix[0]
         
-        # Sort by similarity (highest first)
-        df_sorted = df.sort_values('similarity_score', ascending=False)
-        
-        # Prepare response
-        recommendations = []
-        for _, row in df_sorted.iterrows():
-            recommendations.append({
-                "country_code": row['country_code'],
-                "country": row['Country'],
-                "similarity_score": round(row['similarity_score'], 4),
-                "year": int(row['year']),
-                "weekly_hours": float(row['weekly_hours']) if row['weekly_hours'] is not None else None,
-                "cash_per_capita": float(row['cash_per_capita']) if row['cash_per_capita'] is not None else None,
-                "maternity_per_capita": float(row['maternity_per_capita']) if row['maternity_per_capita'] is not None else None,
-                "services_per_capita": float(row['services_per_capita']) if row['services_per_capita'] is not None else None,
-                "birth_rate_per_thousand": float(row['birth_rate_per_thousand']) if row['birth_rate_per_thousand'] is not None else None,
-                "price_index": float(row['price_index']) if row['price_index'] is not None else None
-            })
+        # Score every country at once and build the response column by column
+        top_k = request.args.get("top_k", type=int)
+        recommendations = engine.recommend(user_vec, top_k=top_k)
         
         response = make_response(jsonify({
             "user_preferences": user_input,
@@ -228,6 +295,68 @@ def recommend_countries():
         response.status_code = 500
         return response
 
+# largest number of preference profiles accepted by one batch request
+MAX_BATCH_SIZE = 10000
+
+@model2_routes.route('/api/recommend/batch', methods=['POST'])
+def recommend_countries_batch():
+    """Recommend EU countries for many sets of user preferences in one call"""
+    current_app.logger.info("POST /api/recommend/batch handler")
+    
+    try:
+        body = request.get_json(silent=True) or {}
+        preferences = body.get("preferences") if isinstance(body, dict) else None
+        top_k = body.get("top_k", 5) if isinstance(body, dict) else 5
+        
+        if not isinstance(preferences, list) or not preferences:
+            return make_response(jsonify({
+                "error": "preferences must be a non-empty list"
+            })), 400
+        
+        if len(preferences) > MAX_BATCH_SIZE:
+            return make_response(jsonify({
+                "error": f"At most {MAX_BATCH_SIZE} preferences can be sent per batch"
+            })), 400
+        
+        if top_k is not None and (isinstance(top_k, bool) or not isinstance(top_k, int) or top_k < 1):
+            return make_response(jsonify({
+                "error": "top_k must be a positive integer"
+            })), 400
+        
+        engine = get_recommender()
+        
+        if engine.size == 0:
+            return make_response(jsonify({
+                "error": "No country data available"
+            })), 404
+        
+        # Validate every profile in one pass, then score the valid ones with one matmul
+        user_matrix, errors = normalize_user_inputs(preferences)
+        valid_rows = [i for i, error in enumerate(errors) if error is None]
+        recommendations = engine.recommend_many(user_matrix[valid_rows], top_k=top_k)
+        
+        results = [{"index": i, "error": error} for i, error in enumerate(errors)]
+        for i, recs in zip(valid_rows, recommendations):
+            results[i] = {"index": i, "recommendations": recs}
+        
+        response = make_response(jsonify({
+            "results": results,
+            "total": len(results),
+            "valid": len(valid_rows),
+            "top_k": top_k
+        }))
+        response.status_code = 200
+        return response
+        
+    except Exception as e:
+        current_app.logger.error(f"Error in batch recommendation: {str(e)}")
+        response = make_response(jsonify({
+            "error": "Error processing batch recommendation request",
+            "message": str(e)
+        }))
+        response.status_code = 500
+        return response
+
 @model2_routes.route('/api/countries/<country_code>', methods=['GET'])
 def get_country_details(country_code):
     """Get detailed information for a specific country"""
@@ -284,33 +413,63 @@ def get_country_details(country_code):
         response.status_code = 500
         return response
 
+@model2_routes.route('/api/cache/stats', methods=['GET'])
+def get_cache_statistics():
+    """Get hit/miss counters for the cached country snapshots"""
+    current_app.logger.info("GET /api/cache/stats handler")
+    
+    try:
+        response = make_response(jsonify({
+            "country_cache": country_cache.stats(),
+            "data_version": table_versions.get(COUNTRY_DATA_TABLE, COUNTRY_DATA_KEY)
+        }))
+        response.status_code = 200
+        return response
+        
+    except Exception as e:
+        current_app.logger.error(f"Error fetching cache statistics: {str(e)}")
+        response = make_response(jsonify({
+            "error": "Error fetching cache statistics",
+            "message": str(e)
+        }))
+        response.status_code = 500
+        return response
+
 @model2_routes.route('/api/features/stats', methods=['GET'])
 def get_feature_statistics():
     """Get statistics about the features used in recommendations"""
     current_app.logger.info("GET /api/features/stats handler")
     
     try:
-        df = get_latest_country_data()
+        include_percentiles = request.args.get("percentiles", "false").lower() in ("1", "true", "yes")
+        include_histogram = request.args.get("histogram", "false").lower() in ("1", "true", "yes")
+        
+        # Materialized statistics, refreshed only when the source table changes
+        version = table_versions.get(COUNTRY_DATA_TABLE, COUNTRY_DATA_KEY)
+        materialized = country_cache.get(
+            "feature_statistics",
+            version,
+            lambda: load_feature_statistics(version),
+        )
         
-        if df.empty:
+        if not materialized["data_points"]:
             return make_response(jsonify({
                 "error": "No country data available"
             })), 404
         
         stats = {}
         for feature in FEATURES:
-            stats[feature] = {
-                "min": float(df[feature].min()),
-                "max": float(df[feature].max()),
-                "mean": float(df[feature].mean()),
-                "median": float(df[feature].median()),
-                "std": float(df[feature].std())
-            }
+            stored = materialized["statistics"][feature]
+            stats[feature] = {key: stored[key] for key in ("min", "max", "mean", "median", "std")}
+            if include_percentiles:
+                stats[feature]["percentiles"] = stored["percentiles"]
+            if include_histogram:
+                stats[feature]["histogram"] = stored["histogram"]
         
         response = make_response(jsonify({
             "features": FEATURES,
             "statistics": stats,
-            "data_points": len(df)
+            "data_points": materialized["data_points"]
         }))
         response.status_code = 200
         return response
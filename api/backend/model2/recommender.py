@@ -0,0 +1,138 @@
+#------------------------------------------------------------
+# In-memory recommender engine for the model2 routes.
+#
+# The country features are min-max normalized and divided by
+# their L2 norm once when the engine is built, so scoring a
+# request is a single matrix-vector product plus a sort.
+#------------------------------------------------------------
+import numpy as np
+
+# columns returned with every recommendation, in response order
+RESPONSE_COLUMNS = [
+    "country_code",
+    "country",
+    "year",
+    "weekly_hours",
+    "cash_per_capita",
+    "maternity_per_capita",
+    "services_per_capita",
+    "birth_rate_per_thousand",
+    "price_index",
+]
+
+# numeric columns that may contain NULLs coming from MySQL
+FLOAT_COLUMNS = [
+    "weekly_hours",
+    "cash_per_capita",
+    "maternity_per_capita",
+    "services_per_capita",
+    "birth_rate_per_thousand",
+    "price_index",
+]
+
+
+def _float_column(values):
+    """Turn a float array into an object array with None in place of NaN"""
+    values = np.asarray(values, dtype=np.float64)
+    column = values.astype(object)
+    column[np.isnan(values)] = None
+    return column
+
+
+class CountryRecommender:
+    """Pre-normalized country matrix that scores user preference vectors"""
+
+    def __init__(self, df, features):
+        self.features = list(features)
+        self.size = len(df)
+
+        raw = df[self.features].to_numpy(dtype=np.float64)
+
+        # min-max normalize each feature, same rules as normalize_country_features
+        if self.size:
+            mins = raw.min(axis=0)
+            span = raw.max(axis=0) - mins
+        else:
+            mins = np.zeros(len(self.features))
+            span = np.zeros(len(self.features))
+        safe_span = np.where(span > 0, span, 1.0)
+        normalized = np.where(span > 0, (raw - mins) / safe_span, 0.5)
+
+        # divide every row by its L2 norm up front so a dot product is the cosine
+        row_norms = np.linalg.norm(normalized, axis=1, keepdims=True)
+        self.matrix = np.divide(
+            normalized,
+            row_norms,
+            out=np.zeros_like(normalized),
+            where=row_norms > 0,
+        )
+
+        # keep the response columns as arrays so they can be gathered by index
+        self.columns = {
+            "country_code": df["country_code"].to_numpy(dtype=object),
+            "country": df["Country"].to_numpy(dtype=object),
+            "year": df["year"].to_numpy(dtype=np.int64).astype(object),
+        }
+        for column in FLOAT_COLUMNS:
+            self.columns[column] = _float_column(df[column])
+
+    def score(self, user_vec):
+        """Cosine similarity of one normalized user vector against every country"""
+        user_vec = np.asarray(user_vec, dtype=np.float64)
+        norm_user = np.linalg.norm(user_vec)
+        if norm_user == 0:
+            return np.zeros(self.size)
+        return self.matrix @ (user_vec / norm_user)
+
+    def rank(self, scores, top_k=None):
+        """Indices of the best scores, highest first"""
+        if top_k is not None and 0 < top_k < self.size:
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+            return candidates[np.argsort(-scores[candidates], kind="stable")]
+        return np.argsort(-scores, kind="stable")
+
+    def recommend(self, user_vec, top_k=None):
+        """Build the recommendation list for one user vector"""
+        scores = self.score(user_vec)
+        order = self.rank(scores, top_k)
+        return self.build_records(order, scores)
+
+    def score_many(self, user_matrix):
+        """Cosine similarity of N normalized user vectors against every country, as (N x C)"""
+        user_matrix = np.asarray(user_matrix, dtype=np.float64)
+        norms = np.linalg.norm(user_matrix, axis=1, keepdims=True)
+        unit = np.divide(user_matrix, norms, out=np.zeros_like(user_matrix), where=norms > 0)
+        return unit @ self.matrix.T
+
+    def rank_many(self, scores, top_k=None):
+        """Indices of the best scores for every row of an (N x C) score matrix"""
+        if top_k is not None and 0 < top_k < self.size:
+            candidates = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+        else:
+            candidates = np.broadcast_to(np.arange(self.size), scores.shape)
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        return np.take_along_axis(candidates, order, axis=1)
+
+    def recommend_many(self, user_matrix, top_k=None):
+        """Build one recommendation list per row of a user matrix"""
+        scores = self.score_many(user_matrix)
+        orders = self.rank_many(scores, top_k)
+        keys, columns = self._gather(orders, np.take_along_axis(scores, orders, axis=1))
+        return [
+            [dict(zip(keys, row)) for row in zip(*(column[i] for column in columns))]
+            for i in range(len(orders))
+        ]
+
+    def build_records(self, order, scores):
+        """Gather every response column by index, then zip the columns into rows"""
+        keys, columns = self._gather(order, scores[order])
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+
+    def _gather(self, order, ordered_scores):
+        """Response keys and the matching columns gathered in `order`"""
+        gathered = [self.columns[column][order].tolist() for column in RESPONSE_COLUMNS]
+        similarity = np.round(ordered_scores, 4).tolist()
+        keys = RESPONSE_COLUMNS[:2] + ["similarity_score"] + RESPONSE_COLUMNS[2:]
+        columns = gathered[:2] + [similarity] + gathered[2:]
+        return keys, columns
@@ -0,0 +1,92 @@
+#------------------------------------------------------------
+# Keyset pagination and field projection for list routes.
+#
+# `?limit=` and `?cursor=` switch a route into paged mode: rows
+# are ordered by the table's key and a page starts right after
+# the key in `cursor`, so every page costs the same no matter
+# how deep into the table it is. `?fields=a,b` selects only the
+# listed columns.
+#------------------------------------------------------------
+from flask import request
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+class PaginationError(ValueError):
+    """Raised for an invalid limit, cursor or fields argument"""
+
+
+def page_requested():
+    """True when the request asked for a page instead of the full list"""
+    return "limit" in request.args or "cursor" in request.args
+
+
+def parse_fields(allowed, key):
+    """Columns to select from ?fields=, always including the key column"""
+    raw = request.args.get("fields")
+    if not raw:
+        return list(allowed)
+
+    fields = []
+    for field in raw.split(","):
+        field = field.strip()
+        if not field or field in fields:
+            continue
+        if field not in allowed:
+            raise PaginationError(f"Unknown field: {field}")
+        fields.append(field)
+
+    # the key is needed to order the rows and to build the next cursor
+    if key not in fields:
+        fields.insert(0, key)
+    return fields
+
+
+def parse_page():
+    """(limit, cursor) from the query string"""
+    limit = request.args.get("limit", DEFAULT_PAGE_SIZE)
+    cursor = request.args.get("cursor")
+    try:
+        limit = int(limit)
+        cursor = int(cursor) if cursor not in (None, "") else None
+    except ValueError:
+        raise PaginationError("limit and cursor must be integers")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise PaginationError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    return limit, cursor
+
+
+def fetch_page(db_cursor, query, params, key, limit, after=None):
+    """Run a filtered query one page at a time.
+
+    `query` must end in a WHERE clause so the keyset condition can be
+    appended. Returns the rows of the page and the cursor for the next
+    page (None on the last page).
+    """
+    params = list(params)
+    if after is not None:
+        query += f" AND {key} > %s"
+        params.append(after)
+    # one extra row tells us whether another page exists
+    query += f" ORDER BY {key} LIMIT %s"
+    params.append(limit + 1)
+
+    db_cursor.execute(query, params)
+    rows = db_cursor.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1][key]
+    return rows, next_cursor
+
+
+def page_envelope(data, next_cursor, limit):
+    """Response body for a page of results"""
+    return {
+        "data": data,
+        "next_cursor": next_cursor,
+        "limit": limit,
+        "count": len(data),
+    }
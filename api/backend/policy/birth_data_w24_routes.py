@@ -1,14 +1,39 @@
 from flask import Blueprint, request, jsonify, make_response, current_app
 import pandas as pd
+from pymysql import cursors
 from backend.db_connection import db
+from backend.streaming import wants_stream, stream_query
+from backend.http_cache import conditional
 
 # Blueprint for birth data routes
 birth_data_routes = Blueprint('birth_data_routes', __name__)
 
 @birth_data_routes.route('/api/birth-rates', methods=['GET'])
+@conditional("EUBirthData_With2024", column="eubd_w24_id")
 def get_birth_rates():
     current_app.logger.info("GET /api/birth-rates handler")
     try:
+        # Get query parameters for filtering
+        country = request.args.get("country")
+        year_from = request.args.get("year_from")
+        year_to = request.args.get("year_to")
+        response_format = request.args.get("format", "rows")
+
+        if response_format not in ("rows", "columns"):
+            return jsonify({"error": "format must be 'rows' or 'columns'"}), 400
+        try:
+            year_from = int(year_from) if year_from else None
+            year_to = int(year_to) if year_to else None
+        except ValueError:
+            return jsonify({"error": "year_from and year_to must be integers"}), 400
+
+        # country takes one code or a comma-separated list
+        countries = None
+        if country:
+            countries = [code.strip() for code in country.split(",") if code.strip()]
+            if not countries:
+                return jsonify({"error": "country must list at least one country code"}), 400
+
         query = """
         SELECT 
             country,
@@ -17,11 +42,44 @@ def get_birth_rates():
             live_births
         FROM EUBirthData_With2024
         WHERE birth_rate_per_thousand IS NOT NULL
-        ORDER BY country, year
         """
+        params = []
+
+        # Add filters if provided
+        if countries:
+            query += f" AND country IN ({', '.join(['%s'] * len(countries))})"
+            params.extend(countries)
+        if year_from is not None:
+            query += " AND year >= %s"
+            params.append(year_from)
+        if year_to is not None:
+            query += " AND year <= %s"
+            params.append(year_to)
+
+        query += " ORDER BY country, year"
+
+        current_app.logger.debug(f'Executing query: {query} with params: {params}')
+
+        # stream large results row by row when the client asks for NDJSON
+        if wants_stream():
+            if response_format == "columns":
+                return jsonify({"error": "format=columns cannot be streamed"}), 400
+            return stream_query(query, params)
+
+        # one array per field: tuples from the cursor are transposed in a single zip,
+        # and the client can hand the object straight to pd.DataFrame
+        if response_format == "columns":
+            cursor = db.get_db().cursor(cursors.Cursor)
+            cursor.execute(query, params)
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+            cursor.close()
+
+            values = list(zip(*rows)) if rows else [()] * len(columns)
+            return jsonify({column: list(value) for column, value in zip(columns, values)}), 200
 
         cursor = db.get_db().cursor()
-        cursor.execute(query)
+        cursor.execute(query, params)
         
         # Fetch all results
         results = cursor.fetchall()
@@ -5,6 +5,7 @@ import logging
 from logging.handlers import RotatingFileHandler
 
 from backend.db_connection import db
+from backend.json_provider import OrjsonProvider
 from backend.daycare_locations.daycare_location_routes import locations
 from backend.api_calls.api_calls_routes import apis
 from backend.employment_hours.employment_hours_routes import hours
@@ -15,12 +16,16 @@ from backend.policy.policy_route import policy
 from backend.users.user_routes import users
 from backend.notes.notes_routes import notes
 from backend.model2.model2_routes import model2_routes
+from backend.ml_models.model1_routes import model1_routes
 from backend.policy.birth_data_w24_routes import birth_data_routes
 from backend.cpi.cpi_routes import cpi
 
 def create_app():
     app = Flask(__name__)
 
+    # Encode every JSON response (and decode request bodies) with orjson
+    app.json = OrjsonProvider(app)
+
     # Configure logging
     # Create logs directory if it doesn't exist
     setup_logging(app)
@@ -46,6 +51,11 @@ def create_app():
     app.config["MYSQL_DATABASE_PORT"] = int(os.getenv("DB_PORT").strip())
     app.config["MYSQL_DATABASE_DB"] = os.getenv("DB_NAME").strip()  # Change this to your DB name
 
+    # connection pool limits for the DB object (optional in the .env file)
+    app.config["MYSQL_POOL_SIZE"] = int(os.getenv("DB_POOL_SIZE", "10"))
+    app.config["MYSQL_POOL_TIMEOUT"] = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    app.config["MYSQL_POOL_MAX_LIFETIME"] = float(os.getenv("DB_POOL_MAX_LIFETIME", "3600"))
+
     # Initialize the database object with the settings above.
     app.logger.info("current_app(): starting the database connection")
     db.init_app(app)
@@ -63,6 +73,7 @@ def create_app():
     app.register_blueprint(users, url_prefix="/users")
     app.register_blueprint(notes, url_prefix="/notes")
     app.register_blueprint(model2_routes, url_prefix="/model2")
+    app.register_blueprint(model1_routes, url_prefix="/model1")
     app.register_blueprint(birth_data_routes, url_prefix="/birthdata")
     app.register_blueprint(cpi, url_prefix="/cpi")
 
@@ -0,0 +1,106 @@
+#------------------------------------------------------------
+# Column-wise serialization of DictCursor rows for JSON.
+#
+# PyMySQL returns TIME columns as timedelta, which json cannot
+# encode, and DECIMAL / DATE columns that the encoder only handles
+# through its per-value fallback. serialize_rows renames
+# the keys, then picks a converter for each of those columns from
+# the cursor description and runs it over the whole column; TIME
+# and DATE values are converted once per distinct value.
+#
+# Output matches what Flask's encoder produced before: TIME as
+# "HH:MM:SS", DECIMAL as its string form, DATE/DATETIME as an
+# HTTP date.
+#------------------------------------------------------------
+import datetime
+from operator import itemgetter
+
+from pymysql.constants import FIELD_TYPE
+from werkzeug.http import http_date
+
+
+def time_to_iso(value):
+    """A TIME value (timedelta or time) as an ISO time string"""
+    if isinstance(value, datetime.timedelta):
+        # same result as (datetime.datetime.min + value).time().isoformat(),
+        # without building the intermediate datetime and time objects
+        minutes, seconds = divmod(value.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if value.microseconds:
+            return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{value.microseconds:06d}"
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return value.isoformat()
+
+
+def times_to_iso(values):
+    """TIME column values as ISO strings, converting each distinct value once"""
+    # a TIME column has few distinct values (opening hours), so this is a
+    # handful of conversions no matter how many rows there are
+    distinct = {value: time_to_iso(value) for value in set(values) if value is not None}
+    distinct[None] = None
+    return [distinct[value] for value in values]
+
+
+def decimals_to_str(values):
+    """DECIMAL column values as the strings Flask's encoder would write"""
+    # prices and budgets are nearly all distinct and Decimal hashing is slow,
+    # so these are converted straight through
+    return [value if value is None else str(value) for value in values]
+
+
+def dates_to_http(values):
+    """DATE / DATETIME column values as the HTTP dates Flask's encoder would write"""
+    distinct = {value: http_date(value) for value in set(values) if value is not None}
+    distinct[None] = None
+    return [distinct[value] for value in values]
+
+
+# column converter per MySQL column type
+CONVERTERS = {
+    FIELD_TYPE.TIME: times_to_iso,
+    FIELD_TYPE.DECIMAL: decimals_to_str,
+    FIELD_TYPE.NEWDECIMAL: decimals_to_str,
+    FIELD_TYPE.DATE: dates_to_http,
+    FIELD_TYPE.DATETIME: dates_to_http,
+    FIELD_TYPE.TIMESTAMP: dates_to_http,
+}
+
+
+def column_converters(description):
+    """{column: converter} for the TIME, DECIMAL and DATE columns of a cursor description"""
+    return {
+        column[0]: CONVERTERS[column[1]]
+        for column in description or ()
+        if column[1] in CONVERTERS
+    }
+
+
+def serialize_rows(rows, fields, description=None):
+    """JSON-ready dicts from DictCursor rows.
+
+    `fields` maps each column to the key it is returned under (a list
+    keeps the column names). `description` is the cursor description
+    the rows came from; its TIME, DECIMAL and DATE columns are converted.
+    """
+    if not isinstance(fields, dict):
+        fields = {field: field for field in fields}
+    if not fields:
+        return [{} for _ in rows]
+
+    # rename the keys row by row, itemgetter pulls every column in one C call
+    keys = list(fields.values())
+    getter = itemgetter(*fields)
+    if len(fields) == 1:
+        results = [{keys[0]: getter(row)} for row in rows]
+    else:
+        results = [dict(zip(keys, getter(row))) for row in rows]
+
+    # then convert the special columns a whole column at a time
+    for field, convert in column_converters(description).items():
+        key = fields.get(field)
+        if key is None:
+            continue
+        values = convert([result[key] for result in results])
+        for result, value in zip(results, values):
+            result[key] = value
+    return results
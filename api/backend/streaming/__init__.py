@@ -0,0 +1,52 @@
+#------------------------------------------------------------
+# Opt-in NDJSON streaming for routes that return whole tables.
+#
+# A client asks for streaming with `?stream=1` or an
+# `Accept: application/x-ndjson` header. Rows are then read from
+# an unbuffered (server-side) cursor and written out in fixed-size
+# chunks, one JSON object per line, so neither the result set nor
+# the JSON body is ever held in memory as a whole.
+#------------------------------------------------------------
+from flask import Response, current_app, request, stream_with_context
+from pymysql import cursors
+
+from backend.db_connection import db
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# rows fetched from MySQL and serialized per chunk
+STREAM_CHUNK_SIZE = 500
+
+
+def wants_stream():
+    """True when the current request asked for an NDJSON stream"""
+    if request.args.get("stream", "").lower() in ("1", "true", "yes"):
+        return True
+    best = request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def stream_query(query, params=None, chunk_size=STREAM_CHUNK_SIZE):
+    """Run query on an unbuffered cursor and stream the rows back as NDJSON"""
+    # execute before building the response so SQL errors still reach the route's handler
+    cursor = db.get_db().cursor(cursors.SSDictCursor)
+    try:
+        cursor.execute(query, params)
+    except Exception:
+        cursor.close()
+        raise
+
+    dumps = current_app.json.dumps
+
+    def generate():
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield "".join([dumps(row) + "\n" for row in rows])
+        finally:
+            # closing an unbuffered cursor drains whatever the client did not read
+            cursor.close()
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
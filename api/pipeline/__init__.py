@@ -0,0 +1,11 @@
+#------------------------------------------------------------
+# Reproducible version of the data-prep notebooks.
+#
+# Four steps, each in its own module:
+#   sources  fetch Eurostat JSON-stat (or read saved files offline)
+#   stages   clean and merge into the layout of each MySQL table
+#   cache    content-hashed stage outputs, so unchanged work is skipped
+#   load     upsert only the rows that changed
+#
+# Run it from the api folder with `python -m pipeline.run`.
+#------------------------------------------------------------
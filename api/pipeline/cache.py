@@ -0,0 +1,78 @@
+#------------------------------------------------------------
+# Content-addressed cache of stage outputs.
+#
+# A stage's output is stored under the hash of the stage's name,
+# the source of the whole module that defines it (its helpers and
+# constants included) and the hashes of its input frames, so a
+# stage only re-runs when that code or one of its inputs changes.
+# manifest.json keeps the output hash of every stage and source
+# from the last run, and the hash last loaded into each table.
+#------------------------------------------------------------
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+
+def frame_hash(frame):
+    """sha256 of a DataFrame's columns, dtypes and values (not its index)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(c), str(t)] for c, t in frame.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def stage_key(name, func, input_hashes):
+    # the whole module's source, since a stage's own source misses the helpers and constants it uses
+    digest = hashlib.sha256()
+    digest.update(name.encode())
+    digest.update(inspect.getsource(sys.modules[func.__module__]).encode())
+    for input_hash in input_hashes:
+        digest.update(input_hash.encode())
+    return digest.hexdigest()
+
+
+class StageCache:
+    """Pickled stage outputs plus the run manifest, under one folder"""
+
+    def __init__(self, root):
+        self.root = root
+        self.raw = os.path.join(root, "raw")
+        os.makedirs(os.path.join(root, "stages"), exist_ok=True)
+        os.makedirs(self.raw, exist_ok=True)
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self.manifest = {"outputs": {}, "loaded": {}}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.manifest.update(json.load(f))
+
+    def path(self, key):
+        return os.path.join(self.root, "stages", key + ".pkl")
+
+    def get(self, key):
+        """Cached output for a stage key, or None"""
+        path = self.path(key)
+        if not os.path.exists(path):
+            return None
+        return pd.read_pickle(path)
+
+    def put(self, key, frame):
+        # written next to the target, then renamed, so a crash never leaves half a file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path(key)), suffix=".tmp")
+        os.close(fd)
+        try:
+            frame.to_pickle(tmp)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def save_manifest(self):
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
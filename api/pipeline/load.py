@@ -0,0 +1,99 @@
+#------------------------------------------------------------
+# Writes a stage's output into its MySQL table, touching only the
+# rows whose values changed.
+#
+# The stage output is compared, key by key, with the rows already
+# in the table (after rounding each value to its column's scale).
+# The keys that are new or differ are deleted and re-inserted in
+# one transaction; the tables have no unique key to upsert on, and
+# this also collapses any duplicates of a changed key. Rows that
+# are in the table but not in the output are left alone.
+#------------------------------------------------------------
+import math
+from decimal import Decimal
+
+# rows per executemany call
+BATCH_SIZE = 1000
+
+
+def column_scales(conn, table):
+    """{column: decimal places} for the table's DECIMAL columns"""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT column_name AS col, data_type AS data_type, numeric_scale AS scale "
+        "FROM information_schema.columns WHERE table_schema = DATABASE() AND table_name = %s",
+        (table,),
+    )
+    rows = cursor.fetchall()
+    cursor.close()
+    return {row["col"]: row["scale"] for row in rows if row["data_type"] == "decimal"}
+
+
+def normalize(value, scale=None):
+    """A value as it compares after a round trip through MySQL"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (float, Decimal)):
+        return round(float(value), 9 if scale is None else scale)
+    if hasattr(value, "item"):
+        # numpy scalars
+        return normalize(value.item(), scale)
+    return value
+
+
+def frame_rows(frame, columns, scales):
+    """Stage output as normalized tuples in column order"""
+    rows = frame[columns].astype(object).itertuples(index=False, name=None)
+    return [tuple(normalize(value, scales.get(column)) for value, column in zip(row, columns)) for row in rows]
+
+
+def current_rows(conn, table, columns, key_indexes, scales):
+    """{key tuple: row tuple} of what is in the table now"""
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {', '.join(columns)} FROM {table}")
+    current = {}
+    for row in cursor.fetchall():
+        values = tuple(normalize(row[column], scales.get(column)) for column in columns)
+        current[tuple(values[i] for i in key_indexes)] = values
+    cursor.close()
+    return current
+
+
+def changed_rows(rows, current, key_indexes):
+    return [row for row in rows if current.get(tuple(row[i] for i in key_indexes)) != row]
+
+
+def upsert(conn, table, key, columns, rows):
+    """Replace the rows of every key in rows with rows, in one transaction"""
+    key_indexes = [columns.index(column) for column in key]
+    # <=> so a NULL key part (e.g. the EU row's country_code) still matches
+    delete = f"DELETE FROM {table} WHERE " + " AND ".join(f"{column} <=> %s" for column in key)
+    insert = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+
+    cursor = conn.cursor()
+    conn.begin()
+    try:
+        for start in range(0, len(rows), BATCH_SIZE):
+            batch = rows[start:start + BATCH_SIZE]
+            cursor.executemany(delete, [tuple(row[i] for i in key_indexes) for row in batch])
+            cursor.executemany(insert, batch)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def load_table(conn, table, key, columns, frame, dry_run=False):
+    """Upsert the changed rows of frame into table; returns (rows in frame, rows written)"""
+    scales = column_scales(conn, table)
+    key_indexes = [columns.index(column) for column in key]
+    rows = frame_rows(frame, columns, scales)
+    current = current_rows(conn, table, columns, key_indexes, scales)
+    changed = changed_rows(rows, current, key_indexes)
+    if changed and not dry_run:
+        upsert(conn, table, key, columns, changed)
+    return len(rows), len(changed)
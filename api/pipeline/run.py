@@ -0,0 +1,116 @@
+#------------------------------------------------------------
+# Runs the pipeline: fetch -> clean/merge -> load.
+#
+#     python -m pipeline.run                       # fetch from Eurostat, load what changed
+#     python -m pipeline.run --offline ../datasets/.pipeline-cache/raw
+#     python -m pipeline.run EUCPI --dry-run       # report changed rows, write nothing
+#     python -m pipeline.run --no-load             # build and cache the stages only
+#
+# Every source is fetched on each run (a fetch saves its raw
+# responses under <cache>/raw, which --offline can read back).
+# A stage re-runs only when its code or an input's content hash
+# changed, and a table is only diffed against MySQL when its
+# stage output differs from what was last loaded into it.
+#------------------------------------------------------------
+import os
+import time
+
+from pipeline.cache import StageCache, frame_hash, stage_key
+from pipeline.load import load_table
+from pipeline.sources import LocalSource, default_sources
+from pipeline.stages import STAGES, TABLES
+from scripts.query_shapes import connect, connection_arguments
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "datasets")
+DEFAULT_CACHE = os.path.join(DATASETS, ".pipeline-cache")
+
+
+def offline_sources(folder, sources):
+    """Sources replaced by <folder>/<name>.json or .csv; local defaults are kept when no file exists"""
+    offline = {}
+    for name, source in sources.items():
+        for extension in (".json", ".csv"):
+            path = os.path.join(folder, name + extension)
+            if os.path.exists(path):
+                offline[name] = LocalSource(path)
+                break
+        else:
+            if not isinstance(source, LocalSource):
+                raise FileNotFoundError(f"no {name}.json or {name}.csv in {folder}")
+            offline[name] = source
+    return offline
+
+
+def run(sources, cache, tables, conn=None, target="", force=False, dry_run=False, log=print):
+    """Build the stages for tables and, with a connection, load the ones that changed"""
+    names = sorted({name for table in tables for name in STAGES[table][1]})
+    frames, hashes = {}, {}
+    for name in names:
+        started = time.perf_counter()
+        frames[name] = sources[name].fetch(save_to=os.path.join(cache.raw, name + ".json"))
+        hashes[name] = frame_hash(frames[name])
+        changed = cache.manifest["outputs"].get(name) != hashes[name]
+        cache.manifest["outputs"][name] = hashes[name]
+        log(f"fetch  {name:<26} {len(frames[name]):>8} rows  {time.perf_counter() - started:>6.2f}s  {'changed' if changed else 'unchanged'}")
+
+    loaded = cache.manifest["loaded"].setdefault(target, {})
+    for table in tables:
+        func, inputs = STAGES[table]
+        started = time.perf_counter()
+        key = stage_key(table, func, [hashes[name] for name in inputs])
+        output = cache.get(key)
+        ran = output is None
+        if ran:
+            output = func(*(frames[name] for name in inputs))
+            cache.put(key, output)
+        output_hash = frame_hash(output)
+        cache.manifest["outputs"][table] = output_hash
+        log(f"stage  {table:<26} {len(output):>8} rows  {time.perf_counter() - started:>6.2f}s  {'ran' if ran else 'cached'}")
+
+        if conn is None:
+            continue
+        if not force and loaded.get(table) == output_hash:
+            log(f"load   {table:<26} {'':>8}       {'':>7} already loaded")
+            continue
+        started = time.perf_counter()
+        key_columns, columns = TABLES[table]
+        total, written = load_table(conn, table, key_columns, columns, output, dry_run)
+        if not dry_run:
+            loaded[table] = output_hash
+        action = "would write" if dry_run else "written"
+        log(f"load   {table:<26} {total:>8} rows  {time.perf_counter() - started:>6.2f}s  {written} changed {action}")
+
+    cache.save_manifest()
+
+
+def main():
+    parser = connection_arguments("Fetch the Eurostat data, rebuild the changed stages and upsert the changed rows")
+    parser.add_argument("tables", nargs="*", help=f"tables to build (default: {', '.join(STAGES)})")
+    parser.add_argument("--cache", default=DEFAULT_CACHE, help="stage cache folder")
+    parser.add_argument("--offline", metavar="FOLDER", help="read every source from <FOLDER>/<source>.json or .csv")
+    parser.add_argument("--force", action="store_true", help="diff every table against MySQL, even if already loaded")
+    parser.add_argument("--dry-run", action="store_true", help="count the changed rows without writing them")
+    parser.add_argument("--no-load", action="store_true", help="build the stages without a database")
+    args = parser.parse_args()
+
+    unknown = [table for table in args.tables if table not in STAGES]
+    if unknown:
+        parser.error(f"no stage for {', '.join(unknown)} (known: {', '.join(STAGES)})")
+
+    sources = default_sources(DATASETS)
+    if args.offline:
+        sources = offline_sources(args.offline, sources)
+
+    conn = None if args.no_load else connect(args)
+    try:
+        run(
+            sources, StageCache(args.cache), args.tables or list(STAGES), conn,
+            target=f"{args.host}:{args.port}/{args.database}", force=args.force, dry_run=args.dry_run,
+        )
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
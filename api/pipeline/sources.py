@@ -0,0 +1,133 @@
+#------------------------------------------------------------
+# Where the pipeline's raw data comes from.
+#
+# A source returns one long DataFrame: a code column and a
+# <dim>_label column per dimension, plus "value". EurostatSource
+# downloads a JSON-stat dataset from the dissemination API;
+# LocalSource reads the same data from a saved .json response or
+# a .csv, so the pipeline also runs offline.
+#------------------------------------------------------------
+import json
+import os
+import time
+import urllib.parse
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+EUROSTAT_URL = "https://ec.europa.eu/eurostat/api/dissemination/statistics/1.0/data/"
+
+# EU27 aggregate plus the member states, as requested in the notebooks
+EU_GEO = [
+    "EU27_2020", "BE", "BG", "CZ", "DK", "DE", "EE", "IE", "EL", "ES", "FR", "HR", "IT", "CY",
+    "LV", "LT", "LU", "HU", "MT", "NL", "AT", "PL", "PT", "RO", "SI", "SK", "FI", "SE",
+]
+
+
+def decode_jsonstat(data):
+    """Long DataFrame from a JSON-stat 2.0 response: one row per non-missing value"""
+    dims = data["id"]
+    sizes = data["size"]
+    values = data.get("value") or {}
+    if isinstance(values, list):
+        values = {i: value for i, value in enumerate(values) if value is not None}
+
+    flat = np.fromiter((int(i) for i in values), dtype=np.int64, count=len(values))
+    positions = np.unravel_index(flat, sizes) if len(flat) else [flat] * len(dims)
+
+    columns = {}
+    for dim, position in zip(dims, positions):
+        category = data["dimension"][dim]["category"]
+        index = category["index"]
+        codes = list(index) if isinstance(index, list) else sorted(index, key=index.get)
+        labels = category.get("label", {})
+        codes = np.array(codes, dtype=object)
+        columns[dim] = codes[position]
+        columns[f"{dim}_label"] = np.array([labels.get(code, code) for code in codes], dtype=object)[position]
+    columns["value"] = np.array(list(values.values()), dtype=np.float64)
+    return pd.DataFrame(columns)
+
+
+class EurostatSource:
+    """One Eurostat dataset; list-valued params are sent as repeated query arguments.
+
+    `split` names a list-valued param to request one value at a time,
+    for queries that would be too large as a single request.
+    """
+
+    def __init__(self, dataset, params, split=None, timeout=60, pause=0.3):
+        self.dataset = dataset
+        self.params = params
+        self.split = split
+        self.timeout = timeout
+        self.pause = pause
+
+    def describe(self):
+        return {"dataset": self.dataset, "params": self.params, "split": self.split}
+
+    def responses(self):
+        """Raw JSON-stat responses"""
+        queries = [self.params]
+        if self.split:
+            queries = [{**self.params, self.split: [value]} for value in self.params[self.split]]
+
+        responses = []
+        for n, params in enumerate(queries):
+            if n:
+                time.sleep(self.pause)
+            url = EUROSTAT_URL + self.dataset + "?" + urllib.parse.urlencode({"format": "JSON", "lang": "en", **params}, doseq=True)
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                data = json.load(response)
+            if "value" in data and "dimension" in data:
+                responses.append(data)
+        return responses
+
+    def fetch(self, save_to=None):
+        responses = self.responses()
+        if save_to:
+            # the same responses, readable later by LocalSource
+            with open(save_to, "w", encoding="utf-8") as f:
+                json.dump(responses, f)
+        return pd.concat([decode_jsonstat(data) for data in responses], ignore_index=True)
+
+
+class LocalSource:
+    """Saved data: a .json file with one or a list of JSON-stat responses, or a .csv"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def describe(self):
+        return {"path": os.path.abspath(self.path)}
+
+    def fetch(self, save_to=None):
+        if self.path.endswith(".csv"):
+            return pd.read_csv(self.path)
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        responses = data if isinstance(data, list) else [data]
+        return pd.concat([decode_jsonstat(response) for response in responses], ignore_index=True)
+
+
+def default_sources(datasets_dir):
+    """The sources the pipeline reads when nothing else is configured"""
+    return {
+        # live births and crude birth rate
+        "births": EurostatSource("tps00204", {
+            "geo": EU_GEO, "indic_de": ["LBIRTH_NR", "GBIRTHRT_THSP"], "sinceTimePeriod": 2015,
+        }),
+        # average weekly hours of work, by employment status, full/part-time, age and sex
+        "work_hours": EurostatSource("lfsa_ewhun2", {
+            "geo": EU_GEO, "unit": "HR", "nace_r2": "TOTAL",
+            "wstatus": ["EMP", "SAL", "NSAL", "SELF", "SELF_S", "SELF_NS", "CFAM", "NCFAM"],
+            "worktime": ["TOTAL", "PT", "FT"],
+            "age": ["Y15-24", "Y15-34", "Y15-64", "Y_GE15", "Y20-64", "Y25-54", "Y25-64", "Y35-49", "Y_GE50", "Y55-64"],
+            "sex": ["T", "M", "F"], "sinceTimePeriod": 2015,
+        }, split="geo"),
+        # comparative price level index (EU27 = 100)
+        "price_levels": EurostatSource("tec00120", {"geo": EU_GEO, "sinceTimePeriod": 2015}),
+        # family benefit spending per capita has no API source yet: country_code, year,
+        # cash_per_capita, maternity_per_capita, services_per_capita
+        "family_expenditure": LocalSource(os.path.join(datasets_dir, "raw-datasets", "family_employment_data.csv")),
+    }
@@ -0,0 +1,185 @@
+#------------------------------------------------------------
+# Clean and merge stages: pure functions from DataFrames to a
+# DataFrame in the column layout of one MySQL table.
+#
+# The raw frames come from pipeline.sources (a code and a
+# <dim>_label column per JSON-stat dimension, plus "value"). The
+# cleaning follows the notebooks that built the seed data, so a
+# pipeline run reproduces the rows in database-files/, except the
+# price levels: PLI_cleaning.ipynb decoded its JSON-stat with
+# idx % geo_size, which reads the wrong dimension, so the seed
+# EUCPI.cpi_value and eu_family_employment_data.price_index values
+# are wrong. The first run rewrites almost every one of those rows
+# with the values Eurostat actually publishes.
+#------------------------------------------------------------
+import re
+
+import numpy as np
+import pandas as pd
+
+# EU27 aggregate as the tables name it
+EU_CODE = "EU27_2020"
+EU_EMPLOYMENT_NAME = "european_union_-_27_countries_(2020)"
+EU_FAMILY_CODE, EU_FAMILY_NAME = "EU27", "EU Average"
+
+# EUEmployment uses ISO codes, Eurostat uses EL for Greece
+EMPLOYMENT_CODES = {"EL": "GR", EU_CODE: None}
+
+SEXES = {"F": "females", "M": "males", "T": "total"}
+
+# Eurostat wstatus -> EUEmployment column prefix, and worktime -> suffix.
+# Employees (SAL) have their own suffixes so they don't clash with EMP.
+WORK_STATUSES = {
+    "CFAM": "cfw", "NCFAM": "ecfw", "NSAL": "eee", "EMP": "emp",
+    "SAL": "emp", "SELF": "self", "SELF_S": "self_empr", "SELF_NS": "self_own",
+}
+WORKTIMES = {"FT": "full", "PT": "part", "TOTAL": "total"}
+EMPLOYEE_WORKTIMES = {"FT": "ft", "PT": "pt", "TOTAL": "all"}
+
+EMPLOYMENT_MEASURES = [
+    f"{prefix}_{suffix}"
+    for prefix in ("cfw", "ecfw", "eee", "emp") for suffix in ("full", "part", "total")
+] + ["emp_ft", "emp_pt", "emp_all"] + [
+    f"{prefix}_{suffix}"
+    for prefix in ("self", "self_empr", "self_own") for suffix in ("full", "part", "total")
+]
+
+EXPENDITURE_COLUMNS = ["cash_per_capita", "maternity_per_capita", "services_per_capita"]
+
+
+def age_group(code):
+    """Eurostat age code as EUEmployment writes it: Y15-64 -> 15__64, Y_GE15 -> 15_or_over"""
+    match = re.fullmatch(r"Y(\d+)-(\d+)", code)
+    if match:
+        return f"{match[1]}__{match[2]}"
+    match = re.fullmatch(r"Y_GE(\d+)", code)
+    if match:
+        return f"{match[1]}_or_over"
+    return code.lower()
+
+
+def snake_label(label):
+    return label.strip().lower().replace(" ", "_")
+
+
+def clean_births(raw):
+    """EUBirthData_With2024: country, freq, year, birth_rate_per_thousand, live_births"""
+    wide = raw.pivot_table(index=["geo", "freq", "time"], columns="indic_de", values="value", aggfunc="first")
+    wide = wide.reindex(columns=["GBIRTHRT_THSP", "LBIRTH_NR"]).reset_index()
+    out = pd.DataFrame({
+        "country": wide["geo"],
+        "freq": wide["freq"],
+        "year": wide["time"].astype(int),
+        "birth_rate_per_thousand": wide["GBIRTHRT_THSP"].round(2),
+        "live_births": wide["LBIRTH_NR"].round(1),
+    })
+    return out.sort_values(["country", "year"], ignore_index=True)
+
+
+def clean_work_hours(raw):
+    """EUEmployment: one row per country, year, sex and age group, one column per measure"""
+    raw = raw[raw["wstatus"].isin(list(WORK_STATUSES)) & raw["worktime"].isin(list(WORKTIMES))]
+    suffixes = np.where(
+        raw["wstatus"] == "SAL", raw["worktime"].map(EMPLOYEE_WORKTIMES), raw["worktime"].map(WORKTIMES)
+    )
+    raw = raw.assign(measure=raw["wstatus"].map(WORK_STATUSES) + "_" + suffixes)
+
+    wide = raw.pivot_table(
+        index=["geo", "geo_label", "time", "sex", "age"], columns="measure", values="value", aggfunc="first"
+    )
+    wide = wide.reindex(columns=EMPLOYMENT_MEASURES).reset_index()
+    names = wide["geo_label"].map(snake_label).where(wide["geo"] != EU_CODE, EU_EMPLOYMENT_NAME)
+    codes = wide["geo"].map(lambda code: EMPLOYMENT_CODES.get(code, code))
+
+    out = pd.concat([
+        pd.DataFrame({
+            "country_code": codes,
+            "country_name": names,
+            "year": wide["time"].astype(int),
+            "sex": wide["sex"].map(SEXES),
+            "age_group": wide["age"].map(age_group),
+        }),
+        wide[EMPLOYMENT_MEASURES],
+    ], axis=1)
+    return out.sort_values(["country_name", "year", "sex", "age_group"], ignore_index=True)
+
+
+def clean_price_levels(raw):
+    """EUCPI: country_name, year, cpi_value (price level index, EU27 = 100)"""
+    if "na_item" in raw:
+        raw = raw[raw["na_item"] == "PLI_EU27_2020"]
+    out = pd.DataFrame({
+        "country_name": raw["geo_label"],
+        "year": raw["time"].astype(int),
+        "cpi_value": raw["value"].round(2),
+        "geo": raw["geo"],
+    })
+    return out.sort_values(["country_name", "year"], ignore_index=True)
+
+
+def weekly_hours(work_hours):
+    """Average usual weekly hours of employed people aged 15+, the mean of women and men"""
+    rows = work_hours[
+        (work_hours["wstatus"] == "EMP") & (work_hours["worktime"] == "TOTAL")
+        & (work_hours["age"] == "Y_GE15") & work_hours["sex"].isin(["F", "M"])
+    ]
+    hours = rows.groupby(["geo", "time"])["value"].agg(["mean", "count"])
+    # both sexes are needed for the average
+    hours = hours[hours["count"] == 2]["mean"].rename("weekly_hours").reset_index()
+    return hours.assign(year=hours["time"].astype(int)).drop(columns="time")
+
+
+def merge_family_employment(births, work_hours, price_levels, family_expenditure):
+    """eu_family_employment_data: births joined with price levels, hours worked and benefit spending"""
+    frame = births[births["indic_de"] == "GBIRTHRT_THSP"]
+    frame = pd.DataFrame({
+        "geo": frame["geo"],
+        "Country": frame["geo_label"],
+        "year": frame["time"].astype(int),
+        "birth_rate_per_thousand": frame["value"],
+    })
+
+    prices = clean_price_levels(price_levels)[["geo", "year", "cpi_value"]].rename(columns={"cpi_value": "price_index"})
+    frame = frame.merge(prices, on=["geo", "year"], how="left")
+    frame = frame.merge(weekly_hours(work_hours), on=["geo", "year"], how="left")
+
+    frame["country_code"] = frame["geo"].replace({EU_CODE: EU_FAMILY_CODE})
+    frame.loc[frame["geo"] == EU_CODE, "Country"] = EU_FAMILY_NAME
+
+    spending = family_expenditure[["country_code", "year"] + EXPENDITURE_COLUMNS].astype({"year": int})
+    frame = frame.merge(spending.drop_duplicates(["country_code", "year"]), on=["country_code", "year"], how="left")
+
+    frame["weekly_hours"] = frame["weekly_hours"].round(2)
+    out = frame[[
+        "country_code", "Country", "year", "birth_rate_per_thousand", "price_index",
+        *EXPENDITURE_COLUMNS, "weekly_hours",
+    ]]
+    return out.sort_values(["country_code", "year"], ignore_index=True)
+
+
+# stage name -> (function, input names); inputs are source names or earlier stages
+STAGES = {
+    "EUBirthData_With2024": (clean_births, ["births"]),
+    "EUEmployment": (clean_work_hours, ["work_hours"]),
+    "EUCPI": (clean_price_levels, ["price_levels"]),
+    "eu_family_employment_data": (
+        merge_family_employment, ["births", "work_hours", "price_levels", "family_expenditure"]
+    ),
+}
+
+# table -> (key columns, loaded columns); every stage above loads the table it is named after
+TABLES = {
+    "EUBirthData_With2024": (
+        ["country", "year"], ["country", "freq", "year", "birth_rate_per_thousand", "live_births"],
+    ),
+    "EUEmployment": (
+        ["country_name", "year", "sex", "age_group"],
+        ["country_code", "country_name", "year", "sex", "age_group"] + EMPLOYMENT_MEASURES,
+    ),
+    "EUCPI": (["country_name", "year"], ["country_name", "year", "cpi_value"]),
+    "eu_family_employment_data": (
+        ["country_code", "year"],
+        ["country_code", "Country", "year", "birth_rate_per_thousand", "price_index",
+         *EXPENDITURE_COLUMNS, "weekly_hours"],
+    ),
+}
@@ -0,0 +1,142 @@
+#------------------------------------------------------------
+# Index benchmark: copies the Eurobebe tables into a scratch
+# database, scales them up by --factor, and times every query
+# shape from query_shapes.py before and after the secondary
+# indexes are created.
+#
+#     python -m scripts.bench_indexes --factor 50 --repeat 20
+#
+# Each extra copy of a table gets a shifted country or id column,
+# so the filters in QUERY_SHAPES keep matching the original rows
+# while the tables around them grow.
+#------------------------------------------------------------
+import statistics
+import time
+
+from scripts.query_shapes import INDEXES, QUERY_SHAPES, connect, connection_arguments, index_ddl
+
+# per table, the columns rewritten for copy k (k >= 1) of the data;
+# k has at most two digits, so short columns are cut to leave room for it
+SCALE_COLUMNS = {
+    "EUEmployment": {"country_name": "CONCAT(country_name, ' {k}')"},
+    "Children_FamilyBenefits": {"year": "year + {k} * 100"},
+    "EUCPI": {"country_name": "CONCAT(country_name, ' {k}')"},
+    "EUBirthData_With2024": {"country": "CONCAT(LEFT(country, 7), {k})"},
+    "eu_family_employment_data": {"country_code": "CONCAT(LEFT(country_code, 2), {k})"},
+    "DaycareLocations": {"daycare_id": "daycare_id + {k} * 100000"},
+    "DaycareData": {"daycare_id": "daycare_id + {k} * 100000"},
+    "Policies": {"policy_id": "policy_id + {k} * 100000", "country_code": "CONCAT(country_code, {k})"},
+    "AffinityResources": {"country_code": "CONCAT(country_code, {k})"},
+    "User": {"role_id": "role_id + {k} * 10"},
+}
+
+
+def execute(conn, sql, params=None):
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def copy_columns(conn, database, table):
+    """(column, is auto_increment) in table order"""
+    rows = execute(
+        conn,
+        "SELECT column_name AS name, extra AS extra FROM information_schema.columns "
+        "WHERE table_schema = %s AND table_name = %s ORDER BY ordinal_position",
+        (database, table),
+    )
+    return [(row["name"], "auto_increment" in row["extra"]) for row in rows]
+
+
+def build_bench_database(conn, source, target, factor):
+    """Create target as a copy of source with every table repeated factor times"""
+    execute(conn, f"DROP DATABASE IF EXISTS {target}")
+    execute(conn, f"CREATE DATABASE {target}")
+
+    for table, overrides in SCALE_COLUMNS.items():
+        execute(conn, f"CREATE TABLE {target}.{table} LIKE {source}.{table}")
+        columns = [
+            name for name, auto_increment in copy_columns(conn, source, table)
+            if not auto_increment or name in overrides
+        ]
+        for k in range(factor):
+            select = [overrides[name].format(k=k) if k and name in overrides else name for name in columns]
+            execute(
+                conn,
+                f"INSERT INTO {target}.{table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(select)} FROM {source}.{table}",
+            )
+        count = execute(conn, f"SELECT COUNT(*) AS n FROM {target}.{table}")[0]["n"]
+        print(f"  {table:<26} {count:>10} rows")
+
+
+def set_indexes(conn, database, create):
+    """Create or drop every index from INDEXES in database"""
+    existing = {
+        (row["table_name"], row["index_name"])
+        for row in execute(
+            conn,
+            "SELECT DISTINCT table_name AS table_name, index_name AS index_name "
+            "FROM information_schema.statistics WHERE table_schema = %s",
+            (database,),
+        )
+    }
+    for table, name, columns, unique in INDEXES:
+        if create and (table, name) not in existing:
+            execute(conn, index_ddl(table, name, columns, unique, database))
+        elif not create and (table, name) in existing:
+            execute(conn, f"DROP INDEX {name} ON {database}.{table}")
+    for table in SCALE_COLUMNS:
+        execute(conn, f"ANALYZE TABLE {database}.{table}")
+
+
+def time_shapes(conn, repeat):
+    """Median milliseconds per query shape"""
+    timings = []
+    for _, _, sql, params in QUERY_SHAPES:
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            execute(conn, sql, params)
+            samples.append((time.perf_counter() - started) * 1000)
+        timings.append(statistics.median(samples))
+    return timings
+
+
+def main():
+    parser = connection_arguments("Benchmark the API's query shapes with and without indexes")
+    parser.add_argument("--factor", type=int, default=50,
+                        help="number of copies of each table in the scratch database (max 99)")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per query shape")
+    parser.add_argument("--bench-database", default="euro_bench",
+                        help="scratch database, dropped and recreated on every run")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch database afterwards")
+    args = parser.parse_args()
+
+    if not 1 <= args.factor <= 99:
+        parser.error("--factor must be between 1 and 99")
+
+    conn = connect(args)
+    print(f"Building {args.bench_database} at {args.factor}x {args.database}...")
+    build_bench_database(conn, args.database, args.bench_database, args.factor)
+    conn.select_db(args.bench_database)
+
+    set_indexes(conn, args.bench_database, create=False)
+    without = time_shapes(conn, args.repeat)
+    set_indexes(conn, args.bench_database, create=True)
+    with_indexes = time_shapes(conn, args.repeat)
+
+    print(f"\n{'blueprint':<18} {'query shape':<48} {'no index':>10} {'indexed':>10} {'speedup':>8}")
+    for (blueprint, description, _, _), before, after in zip(QUERY_SHAPES, without, with_indexes):
+        speedup = before / after if after else float("inf")
+        print(f"{blueprint:<18} {description:<48} {before:>8.2f}ms {after:>8.2f}ms {speedup:>7.1f}x")
+
+    if not args.keep:
+        execute(conn, f"DROP DATABASE {args.bench_database}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
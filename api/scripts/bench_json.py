@@ -0,0 +1,147 @@
+#------------------------------------------------------------
+# JSON provider benchmark: time to build the response body of
+# the two largest list routes with Flask's default provider and
+# with the orjson provider from backend.json_provider.
+#
+#     python -m scripts.bench_json --rows 100000
+#     python -m scripts.bench_json --from-db
+#
+# By default the rows are synthetic, shaped like the DictCursor
+# results of /hours/weeklyhours and /daycaredata/data. With
+# --from-db the real tables are read instead (connection options
+# as in the other scripts, defaulting to the .env settings).
+#------------------------------------------------------------
+import datetime
+import random
+import time
+from decimal import Decimal
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from pymysql.constants import FIELD_TYPE
+
+from backend.json_provider import OrjsonProvider
+from backend.serialization import serialize_rows
+from scripts.query_shapes import connect, connection_arguments
+
+HOURS_QUERY = "SELECT eue_id, emp_all, country_code, year, sex, age_group FROM EUEmployment"
+DAYCARE_QUERY = "SELECT * FROM DaycareData"
+
+# the key each DaycareData column is returned under by /daycaredata/data
+DAYCARE_FIELDS = {
+    "id": "ID",
+    "daycare_id": "daycare_id",
+    "enrollment": "Enrollment",
+    "year": "Year",
+    "staff": "Staff",
+    "monthly_budget": "Monthly Budget",
+    "percent_budget_used": "Percent Budget Used",
+    "monthly_price": "Monthly Price",
+    "opening_time": "Opening Time",
+    "closing_time": "Closing Time",
+}
+
+DAYCARE_DESCRIPTION = [
+    ("monthly_budget", FIELD_TYPE.NEWDECIMAL),
+    ("percent_budget_used", FIELD_TYPE.NEWDECIMAL),
+    ("monthly_price", FIELD_TYPE.NEWDECIMAL),
+    ("opening_time", FIELD_TYPE.TIME),
+    ("closing_time", FIELD_TYPE.TIME),
+]
+
+COUNTRIES = ["AT", "BE", "BG", "CY", "CZ", "DE", "DK", "EE", "EL", "ES", "FI", "FR", "HR", "HU",
+             "IE", "IT", "LT", "LU", "LV", "MT", "NL", "PL", "PT", "RO", "SE", "SI", "SK"]
+
+
+def synthetic_hours(count, rng):
+    """/hours/weeklyhours rows: ints, a DOUBLE and short strings"""
+    return [
+        {
+            "eue_id": i + 1,
+            "emp_all": round(rng.uniform(30, 45), 1),
+            "country_code": rng.choice(COUNTRIES),
+            "year": rng.randint(2009, 2024),
+            "sex": rng.choice(("Males", "Females", "Total")),
+            "age_group": rng.choice(("15-64", "20-64", "25-54")),
+        }
+        for i in range(count)
+    ]
+
+
+def synthetic_daycare(count, rng):
+    """DaycareData rows as the DictCursor returns them (Decimal and timedelta columns)"""
+    return [
+        {
+            "id": i + 1,
+            "daycare_id": rng.randint(1, 5000),
+            "enrollment": rng.randint(10, 200),
+            "year": rng.randint(2015, 2025),
+            "staff": rng.randint(2, 40),
+            "monthly_budget": Decimal(rng.randint(500000, 9000000)) / 100,
+            "percent_budget_used": Decimal(rng.randint(4000, 10000)) / 100,
+            "monthly_price": Decimal(rng.randint(20000, 150000)) / 100,
+            "opening_time": datetime.timedelta(hours=rng.randint(6, 9), minutes=rng.choice((0, 30))),
+            "closing_time": datetime.timedelta(hours=rng.randint(16, 19), minutes=rng.choice((0, 30))),
+        }
+        for i in range(count)
+    ]
+
+
+def load_from_db(args):
+    """The /hours/weeklyhours rows and the serialized /daycaredata/data rows from MySQL"""
+    conn = connect(args)
+    cursor = conn.cursor()
+    cursor.execute(HOURS_QUERY)
+    hours = cursor.fetchall()
+    cursor.execute(DAYCARE_QUERY)
+    daycare = serialize_rows(cursor.fetchall(), DAYCARE_FIELDS, cursor.description)
+    cursor.close()
+    conn.close()
+    return hours, daycare
+
+
+def best_of(repeat, app, payload):
+    """Fastest time and body size of app.json.response(payload) over repeat runs"""
+    best = None
+    with app.app_context():
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body = app.json.response(payload).get_data()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+    return best, len(body)
+
+
+def main():
+    parser = connection_arguments("Benchmark JSON serialization of the largest API responses")
+    parser.add_argument("--rows", type=int, default=100_000, help="synthetic rows per route")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per provider, the fastest is reported")
+    parser.add_argument("--from-db", action="store_true", help="serialize the real tables instead")
+    args = parser.parse_args()
+
+    if args.from_db:
+        hours, daycare = load_from_db(args)
+    else:
+        rng = random.Random(0)
+        hours = synthetic_hours(args.rows, rng)
+        daycare = serialize_rows(synthetic_daycare(args.rows, rng), DAYCARE_FIELDS, DAYCARE_DESCRIPTION)
+
+    default_app = Flask("bench_default")
+    default_app.json = DefaultJSONProvider(default_app)
+    orjson_app = Flask("bench_orjson")
+    orjson_app.json = OrjsonProvider(orjson_app)
+
+    print(f"{'response':<22} {'rows':>8} {'provider':<10} {'time':>10} {'MB/s':>8} {'rows/s':>12}")
+    for name, payload in (("/hours/weeklyhours", hours), ("/daycaredata/data", daycare)):
+        baseline = None
+        for provider, app in (("default", default_app), ("orjson", orjson_app)):
+            elapsed, size = best_of(args.repeat, app, payload)
+            baseline = baseline or elapsed
+            print(
+                f"{name:<22} {len(payload):>8} {provider:<10} {elapsed * 1000:>8.1f}ms "
+                f"{size / elapsed / 1e6:>8.1f} {len(payload) / elapsed:>12,.0f}  ({baseline / elapsed:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#------------------------------------------------------------
+# Serializer benchmark: per-row cost of turning DaycareData
+# rows into JSON-ready dicts, comparing the per-row timedelta
+# loop the daycare routes used to run with the column-wise
+# serialize_rows from backend.serialization.
+#
+#     python -m scripts.bench_serializer --rows 1000000
+#
+# Rows are synthetic but shaped exactly like what the DictCursor
+# returns for SELECT * FROM DaycareData (timedelta for TIME,
+# Decimal for DECIMAL, int for YEAR), so no database is needed.
+# With --encode the timings also include the json.dumps call
+# that Flask's default encoder makes for the response body.
+#
+# The two come out about even: across reruns at 200k and 1M rows
+# serialize_rows has measured from 0.7x to 1.3x the loop, with or
+# without --encode, which is within the noise. serialize_rows is
+# there so the routes share one serializer, not for speed; this
+# script checks that it stays the same output at about the same cost.
+#------------------------------------------------------------
+import argparse
+import datetime
+import json
+import random
+import time
+from decimal import Decimal
+
+from pymysql.constants import FIELD_TYPE
+from werkzeug.http import http_date
+
+from backend.serialization import serialize_rows
+
+# cursor.description for SELECT * FROM DaycareData (name and type code are all serialize_rows reads)
+DESCRIPTION = [
+    ("id", FIELD_TYPE.LONG),
+    ("daycare_id", FIELD_TYPE.LONG),
+    ("enrollment", FIELD_TYPE.LONG),
+    ("year", FIELD_TYPE.YEAR),
+    ("staff", FIELD_TYPE.LONG),
+    ("monthly_budget", FIELD_TYPE.NEWDECIMAL),
+    ("percent_budget_used", FIELD_TYPE.NEWDECIMAL),
+    ("monthly_price", FIELD_TYPE.NEWDECIMAL),
+    ("opening_time", FIELD_TYPE.TIME),
+    ("closing_time", FIELD_TYPE.TIME),
+]
+
+FIELDS = {
+    "id": "ID",
+    "daycare_id": "Daycare ID",
+    "enrollment": "Enrollment",
+    "year": "Year",
+    "staff": "Staff",
+    "monthly_budget": "Monthly Budget",
+    "percent_budget_used": "Percent Budget Used",
+    "monthly_price": "Monthly Price",
+    "opening_time": "Opening Time",
+    "closing_time": "Closing Time",
+}
+
+
+def synthetic_rows(count, seed=0):
+    """DaycareData rows as the DictCursor returns them"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        rows.append({
+            "id": i + 1,
+            "daycare_id": rng.randint(1, 5000),
+            "enrollment": rng.randint(10, 200),
+            "year": rng.randint(2015, 2025),
+            "staff": rng.randint(2, 40),
+            "monthly_budget": Decimal(rng.randint(500000, 9000000)) / 100,
+            "percent_budget_used": Decimal(rng.randint(4000, 10000)) / 100,
+            "monthly_price": Decimal(rng.randint(20000, 150000)) / 100,
+            "opening_time": datetime.timedelta(hours=rng.randint(6, 9), minutes=rng.choice((0, 15, 30, 45))),
+            "closing_time": datetime.timedelta(hours=rng.randint(16, 19), minutes=rng.choice((0, 15, 30, 45))),
+        })
+    return rows
+
+
+def per_row_loop(rows):
+    """The conversion loop the daycare routes ran before backend.serialization"""
+    results = []
+    for row in rows:
+        time1 = row['opening_time']
+        time2 = row['closing_time']
+        if isinstance(time1, datetime.timedelta):
+            jsonifiable_time = (datetime.datetime.min + time1).time()
+        else:
+            jsonifiable_time = time1
+        if isinstance(time2, datetime.timedelta):
+            jsonifiable_time2 = (datetime.datetime.min + time2).time()
+        else:
+            jsonifiable_time2 = time2
+
+        results.append({
+            "ID": row["id"],
+            "Daycare ID": row["daycare_id"],
+            "Enrollment": row["enrollment"],
+            "Year": row["year"],
+            "Staff": row["staff"],
+            "Monthly Budget": row["monthly_budget"],
+            "Percent Budget Used": row["percent_budget_used"],
+            "Monthly Price": row["monthly_price"],
+            "Opening Time": jsonifiable_time.isoformat(),
+            "Closing Time": jsonifiable_time2.isoformat(),
+        })
+    return results
+
+
+def column_wise(rows):
+    return serialize_rows(rows, FIELDS, DESCRIPTION)
+
+
+def flask_default(value):
+    """The fallback Flask's default JSON provider uses for values json cannot encode"""
+    if isinstance(value, datetime.date):
+        return http_date(value)
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def best_of(repeat, fn, rows, encode):
+    """Fastest wall time of fn(rows) (plus json.dumps when encode is set) over repeat runs"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = fn(rows)
+        if encode:
+            json.dumps(results, default=flask_default, sort_keys=True)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DaycareData row serialization")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="number of synthetic rows")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per serializer, the fastest is reported")
+    parser.add_argument("--encode", action="store_true", help="include the json.dumps of the response body")
+    args = parser.parse_args()
+
+    print(f"Building {args.rows} synthetic DaycareData rows...")
+    rows = synthetic_rows(args.rows)
+
+    # both serializers must produce the same JSON body
+    sample = rows[:1000]
+    if json.dumps(per_row_loop(sample), default=flask_default, sort_keys=True) != json.dumps(
+        column_wise(sample), default=flask_default, sort_keys=True
+    ):
+        raise SystemExit("serialize_rows output differs from the per-row loop")
+
+    print(f"\n{'serializer':<22} {'total':>10} {'per row':>10}")
+    baseline = None
+    for name, fn in (("per-row loop", per_row_loop), ("serialize_rows", column_wise)):
+        elapsed = best_of(args.repeat, fn, rows, args.encode)
+        baseline = baseline or elapsed
+        print(f"{name:<22} {elapsed:>9.3f}s {elapsed / args.rows * 1e6:>8.3f}us  ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
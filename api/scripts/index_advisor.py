@@ -0,0 +1,85 @@
+#------------------------------------------------------------
+# Index advisor: replays every blueprint's query shapes under
+# EXPLAIN and flags the ones MySQL answers with a full table
+# scan, a filesort or a temporary table.
+#
+#     python -m scripts.index_advisor [--strict]
+#------------------------------------------------------------
+import sys
+
+from scripts.query_shapes import INDEXES, QUERY_SHAPES, connect, connection_arguments, index_ddl
+
+
+def explain(conn, sql, params):
+    """EXPLAIN rows for one query"""
+    cursor = conn.cursor()
+    cursor.execute("EXPLAIN " + sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def findings(plan):
+    """Problems found in an EXPLAIN plan, one string per table access"""
+    problems = []
+    for step in plan:
+        table = step.get("table")
+        extra = step.get("Extra") or ""
+        # derived tables are materialized subqueries, their inner plan is reported separately
+        if not table or table.startswith("<"):
+            continue
+        if step.get("type") == "ALL":
+            problems.append(f"full scan of {table} (~{step.get('rows')} rows)")
+        if "Using filesort" in extra:
+            problems.append(f"filesort on {table}")
+        if "Using temporary" in extra:
+            problems.append(f"temporary table for {table}")
+    return problems
+
+
+def missing_indexes(conn, database):
+    """Indexes from INDEXES that do not exist in the database yet"""
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT DISTINCT table_name AS table_name, index_name AS index_name "
+        "FROM information_schema.statistics WHERE table_schema = %s",
+        (database,),
+    )
+    existing = {(row["table_name"], row["index_name"]) for row in cursor.fetchall()}
+    cursor.close()
+    return [index for index in INDEXES if (index[0], index[1]) not in existing]
+
+
+def main():
+    parser = connection_arguments("Flag table scans in the API's query shapes")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit with status 1 when any query shape needs attention")
+    args = parser.parse_args()
+
+    conn = connect(args)
+    flagged = 0
+
+    for blueprint, description, sql, params in QUERY_SHAPES:
+        plan = explain(conn, sql, params)
+        problems = findings(plan)
+        keys = ", ".join(sorted({step["key"] for step in plan if step.get("key")})) or "-"
+        status = "FLAG" if problems else "ok"
+        print(f"[{status:>4}] {blueprint:<18} {description:<48} key: {keys}")
+        for problem in problems:
+            print(f"         - {problem}")
+        flagged += bool(problems)
+
+    missing = missing_indexes(conn, args.database)
+    if missing:
+        print("\nMissing indexes (see database-files/8_Indexes.sql):")
+        for index in missing:
+            print(f"  {index_ddl(*index)};")
+
+    conn.close()
+    print(f"\n{flagged} of {len(QUERY_SHAPES)} query shapes flagged")
+    if args.strict and (flagged or missing):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
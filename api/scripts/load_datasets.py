@@ -0,0 +1,290 @@
+#------------------------------------------------------------
+# Bulk loader for the reference tables that have a CSV source
+# under datasets/.
+#
+#     python -m scripts.load_datasets                  # every table
+#     python -m scripts.load_datasets EUCPI EUBirthData
+#     python -m scripts.load_datasets --method infile  # LOAD DATA LOCAL INFILE
+#     python -m scripts.load_datasets --check          # parse the CSVs only
+#
+# Each CSV is streamed row by row. Every cell is converted with
+# the column's declared type, and an empty cell becomes NULL. The
+# rows go into a staging copy of the table that has no secondary
+# indexes. Its indexes are rebuilt in one ALTER after the load,
+# then the copy is swapped in with an atomic RENAME. Re-running
+# therefore replaces the table's contents, never duplicates them,
+# and readers see either the old or the new data.
+#
+# Run it after the schema exists (database-files/0_Eurobebe.sql
+# and friends). The tables must not be referenced by foreign
+# keys, which is why the mock-data tables are not loaded here.
+#------------------------------------------------------------
+import csv
+import os
+import tempfile
+import time
+from decimal import Decimal
+
+from scripts.query_shapes import connect, connection_arguments
+
+DEFAULT_DATASETS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "datasets"
+)
+
+# rows per executemany call; pymysql folds each call into multi-row INSERTs
+BATCH_SIZE = 5000
+
+
+def to_int(text):
+    value = Decimal(text)
+    if value != value.to_integral_value():
+        raise ValueError(f"{text!r} is not a whole number")
+    return int(value)
+
+
+# how a CSV cell is typed before it is sent; DECIMAL columns keep their exact text
+CONVERTERS = {
+    "int": to_int,
+    "float": float,
+    "decimal": lambda text: str(Decimal(text)),
+    "str": str,
+}
+
+EMPLOYMENT_MEASURES = [
+    "cfw_full", "cfw_part", "cfw_total",
+    "ecfw_full", "ecfw_part", "ecfw_total",
+    "eee_full", "eee_part", "eee_total",
+    "emp_full", "emp_part", "emp_total",
+    "emp_ft", "emp_pt", "emp_all",
+    "self_full", "self_part", "self_total",
+    "self_empr_full", "self_empr_part", "self_empr_total",
+    "self_own_full", "self_own_part", "self_own_total",
+]
+
+# table -> CSV (relative to datasets/) and (CSV column, table column, type) per loaded column.
+# "melt" CSVs have one column per year: (id column, table column, type), then the
+# table columns and types the header and the cells go to.
+DATASETS = {
+    "EUBirthData": {
+        "csv": "preprocessed-datasets/1Birth.csv",
+        "columns": [
+            ("country", "country_code", "str"),
+            ("freq", "frequency", "str"),
+            ("year", "year", "int"),
+            ("birth_rate_per_thousand", "birth_rate", "decimal"),
+            ("live_births", "live_births", "int"),
+        ],
+    },
+    "EUCPI": {
+        "csv": "preprocessed-datasets/4CPI.csv",
+        "melt": (("Country", "country_name", "str"), ("year", "int"), ("cpi_value", "decimal")),
+    },
+    "EUEmployment": {
+        "csv": "preprocessed-datasets/2Work_hours_with_codes.csv",
+        # the measure columns follow the table's column order
+        "columns": [
+            ("geo", "country_name", "str"),
+            ("Country Code", "country_code", "str"),
+            ("time", "year", "int"),
+            ("sex", "sex", "str"),
+            ("age", "age_group", "str"),
+        ] + [(None, column, "float") for column in EMPLOYMENT_MEASURES],
+    },
+    "eu_family_employment_data": {
+        "csv": "raw-datasets/family_employment_data.csv",
+        "columns": [
+            ("country_code", "country_code", "str"),
+            ("Country", "Country", "str"),
+            ("year", "year", "int"),
+            ("birth_rate_per_thousand", "birth_rate_per_thousand", "decimal"),
+            ("price_index", "price_index", "decimal"),
+            ("cash_per_capita", "cash_per_capita", "decimal"),
+            ("maternity_per_capita", "maternity_per_capita", "decimal"),
+            ("services_per_capita", "services_per_capita", "decimal"),
+            ("weekly_hours", "weekly_hours", "decimal"),
+        ],
+    },
+}
+
+
+def table_columns(spec):
+    if "melt" in spec:
+        (_, id_column, _), (variable, _), (value, _) = spec["melt"]
+        return [id_column, variable, value]
+    return [column for _, column, _ in spec["columns"]]
+
+
+def typed(text, kind, path, line, column):
+    if text == "":
+        return None
+    try:
+        return CONVERTERS[kind](text)
+    except (ValueError, ArithmeticError) as e:
+        raise ValueError(f"{path}:{line}: column {column}: {e}")
+
+
+def read_rows(path, spec):
+    """Typed row tuples, in table column order, streamed from one CSV"""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+
+        if "melt" in spec:
+            (id_name, _, id_kind), (_, variable_kind), (_, value_kind) = spec["melt"]
+            id_index = header.index(id_name)
+            variables = [(i, typed(name, variable_kind, path, 1, name)) for i, name in enumerate(header) if i != id_index]
+            for line, cells in enumerate(reader, start=2):
+                key = typed(cells[id_index], id_kind, path, line, id_name)
+                for i, variable in variables:
+                    yield key, variable, typed(cells[i], value_kind, path, line, header[i])
+            return
+
+        # columns without a CSV name are taken by position
+        indexes = [header.index(name) if name else position for position, (name, _, _) in enumerate(spec["columns"])]
+        if len(header) < len(indexes):
+            raise ValueError(f"{path}: expected at least {len(indexes)} columns, found {len(header)}")
+        for line, cells in enumerate(reader, start=2):
+            yield tuple(
+                typed(cells[index], kind, path, line, column)
+                for index, (_, column, kind) in zip(indexes, spec["columns"])
+            )
+
+
+def execute(conn, sql, params=None):
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def secondary_indexes(conn, table):
+    """[(index name, unique, [columns])] of every index but the primary key"""
+    rows = execute(
+        conn,
+        "SELECT index_name AS name, non_unique AS non_unique, column_name AS col "
+        "FROM information_schema.statistics WHERE table_schema = DATABASE() AND table_name = %s "
+        "AND index_name != 'PRIMARY' ORDER BY index_name, seq_in_index",
+        (table,),
+    )
+    indexes = {}
+    for row in rows:
+        indexes.setdefault(row["name"], (not row["non_unique"], []))[1].append(row["col"])
+    return [(name, unique, columns) for name, (unique, columns) in indexes.items()]
+
+
+def insert_rows(conn, table, columns, rows):
+    """Batched executemany in one transaction; returns the row count"""
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    count = 0
+    batch = []
+    cursor = conn.cursor()
+    conn.begin()
+    try:
+        for row in rows:
+            batch.append(row)
+            if len(batch) == BATCH_SIZE:
+                cursor.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+            count += len(batch)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+    return count
+
+
+def infile_value(value):
+    if value is None:
+        return "\\N"
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def load_infile(conn, table, columns, rows):
+    """Typed rows written to a temporary tab-separated file, then LOAD DATA LOCAL INFILE"""
+    count = 0
+    with tempfile.NamedTemporaryFile("w", suffix=".tsv", encoding="utf-8", delete=False) as f:
+        for row in rows:
+            f.write("\t".join(infile_value(value) for value in row) + "\n")
+            count += 1
+    try:
+        execute(
+            conn,
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({', '.join(columns)})",
+            (f.name,),
+        )
+    finally:
+        os.unlink(f.name)
+    return count
+
+
+def load_table(conn, table, spec, datasets, method):
+    """Load one table through a staging copy; returns the number of rows loaded"""
+    staging, old = f"{table}__load", f"{table}__old"
+    execute(conn, f"DROP TABLE IF EXISTS {staging}, {old}")
+    execute(conn, f"CREATE TABLE {staging} LIKE {table}")
+
+    # rows go in without secondary indexes, which are built once at the end
+    indexes = secondary_indexes(conn, staging)
+    if indexes:
+        execute(conn, f"ALTER TABLE {staging} " + ", ".join(f"DROP INDEX {name}" for name, _, _ in indexes))
+
+    try:
+        rows = read_rows(os.path.join(datasets, spec["csv"]), spec)
+        load = load_infile if method == "infile" else insert_rows
+        count = load(conn, staging, table_columns(spec), rows)
+
+        if indexes:
+            execute(conn, f"ALTER TABLE {staging} " + ", ".join(
+                f"ADD {'UNIQUE ' if unique else ''}INDEX {name} ({', '.join(columns)})"
+                for name, unique, columns in indexes
+            ))
+        execute(conn, f"ANALYZE TABLE {staging}")
+    except Exception:
+        execute(conn, f"DROP TABLE IF EXISTS {staging}")
+        raise
+
+    execute(conn, f"RENAME TABLE {table} TO {old}, {staging} TO {table}")
+    execute(conn, f"DROP TABLE {old}")
+    return count
+
+
+def main():
+    parser = connection_arguments("Load the CSV datasets into their MySQL tables")
+    parser.add_argument("tables", nargs="*", help=f"tables to load (default: {', '.join(DATASETS)})")
+    parser.add_argument("--datasets", default=DEFAULT_DATASETS, help="datasets folder")
+    parser.add_argument("--method", choices=("executemany", "infile"), default="executemany",
+                        help="infile needs local_infile=ON on the server")
+    parser.add_argument("--check", action="store_true", help="only parse and type the CSVs, without a database")
+    args = parser.parse_args()
+
+    unknown = [table for table in args.tables if table not in DATASETS]
+    if unknown:
+        parser.error(f"no dataset for {', '.join(unknown)} (known: {', '.join(DATASETS)})")
+    tables = args.tables or list(DATASETS)
+
+    conn = None
+    if not args.check:
+        conn = connect(args, local_infile=args.method == "infile")
+
+    for table in tables:
+        spec = DATASETS[table]
+        started = time.perf_counter()
+        if args.check:
+            count = sum(1 for _ in read_rows(os.path.join(args.datasets, spec["csv"]), spec))
+        else:
+            count = load_table(conn, table, spec, args.datasets, args.method)
+        print(f"{table:<26} {count:>8} rows  {time.perf_counter() - started:>7.2f}s  from {spec['csv']}")
+
+    if conn is not None:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
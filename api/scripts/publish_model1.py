@@ -0,0 +1,62 @@
+#------------------------------------------------------------
+# Publish Model 1 to the model registry.
+#
+#     python -m scripts.publish_model1                  # from Model1Weights
+#     python -m scripts.publish_model1 --from-npz m.npz # from a training run
+#
+# The first form copies the weights, means and stds of the
+# Model1Weights table into a new artifact, so the API serves the
+# same model from the registry. The second republishes an .npz
+# written by ml-src (same arrays as backend.ml_models.registry)
+# as the next version. The running API switches to the new
+# version within the registry's check interval.
+#------------------------------------------------------------
+from backend.ml_models.model1_routes import MODEL_NAME, WEIGHTS_TABLE
+from backend.ml_models.registry import ModelRegistry, DEFAULT_ROOT, load_artifact
+from scripts.query_shapes import connect, connection_arguments
+
+
+def weights_from_db(args):
+    """(beta, means, stds, features) from the Model1Weights table"""
+    conn = connect(args)
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT feature_name, mean, std, weight FROM {WEIGHTS_TABLE} ORDER BY weight_id")
+    rows = cursor.fetchall()
+    cursor.close()
+    conn.close()
+
+    intercept = next((float(row["weight"]) for row in rows if row["feature_name"] == "intercept"), 0.0)
+    features = [row for row in rows if row["feature_name"] != "intercept"]
+    return (
+        [intercept] + [float(row["weight"]) for row in features],
+        [float(row["mean"] or 0) for row in features],
+        [float(row["std"] or 0) for row in features],
+        [row["feature_name"] for row in features],
+    )
+
+
+def main():
+    parser = connection_arguments("Publish a new version of Model 1 to the model registry")
+    parser.add_argument("--from-npz", help="artifact written by a training run, instead of the table")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="registry folder")
+    args = parser.parse_args()
+
+    if args.from_npz:
+        arrays = load_artifact(args.from_npz)
+        beta, means, stds = arrays["beta"], arrays["means"], arrays["stds"]
+        features = arrays["features"].tolist()
+        metrics = dict(zip(arrays["metric_names"].tolist(), arrays["metric_values"].tolist()))
+    else:
+        beta, means, stds, features = weights_from_db(args)
+        metrics = {}
+
+    if len(beta) != len(features) + 1 or not (len(means) == len(stds) == len(features)):
+        parser.error("beta must hold the intercept plus one weight per feature, with a mean and std for each")
+
+    registry = ModelRegistry(args.root)
+    version = registry.publish(MODEL_NAME, beta, means, stds, features, metrics)
+    print(f"published {MODEL_NAME} v{version} ({len(features)} features) to {registry.path(MODEL_NAME, version)}")
+
+
+if __name__ == "__main__":
+    main()
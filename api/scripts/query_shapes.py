@@ -0,0 +1,111 @@
+#------------------------------------------------------------
+# Query shapes used by the API blueprints, plus the secondary
+# indexes that serve them. Shared by the index advisor and the
+# index benchmark in this folder.
+#
+# Run the tools from the api/ folder (or inside the api
+# container) so the .env file is picked up:
+#     python -m scripts.index_advisor
+#     python -m scripts.bench_indexes --factor 50
+#------------------------------------------------------------
+import argparse
+import os
+
+import pymysql
+from dotenv import load_dotenv
+from pymysql import cursors
+
+# (blueprint, description, SQL, parameters) for every filtered query the routes run
+QUERY_SHAPES = [
+    ("hours", "weekly hours by country, year and sex",
+     "SELECT eue_id, emp_all, country_code, year, sex, age_group FROM EUEmployment "
+     "WHERE 1=1 AND country_name = %s AND year = %s AND sex = %s",
+     ("Austria", 2022, "males")),
+    ("benefits", "benefits by country, year, unit and target group",
+     "SELECT cfb_id, benefit_type, target_group, unit_measured, country_code, year, expenditure "
+     "FROM Children_FamilyBenefits WHERE 1=1 AND country_code = %s AND year = %s "
+     "AND unit_measured = %s AND target_group = %s",
+     ("AT", 2022, "Million Euros", "All Parents")),
+    ("cpi", "CPI by country",
+     "SELECT * FROM EUCPI WHERE 1=1 AND country_name = %s",
+     ("Austria",)),
+    ("birth_data_routes", "birth rates for one country",
+     "SELECT country, year, birth_rate_per_thousand, live_births FROM EUBirthData_With2024 "
+     "WHERE birth_rate_per_thousand IS NOT NULL AND country = %s ORDER BY country, year",
+     ("AT",)),
+    ("model2_routes", "latest complete row per country",
+     "SELECT country_code, year FROM ("
+     "SELECT country_code, year, ROW_NUMBER() OVER (PARTITION BY country_code ORDER BY year DESC) AS rn "
+     "FROM eu_family_employment_data WHERE country_code != 'EU27') latest WHERE rn = 1",
+     ()),
+    ("model2_routes", "country details",
+     "SELECT * FROM eu_family_employment_data WHERE country_code = %s ORDER BY year DESC",
+     ("AT",)),
+    ("locations", "active locations in a city",
+     "SELECT * FROM DaycareLocations WHERE inactive = FALSE AND country_code = %s AND city = %s",
+     ("IT", "Rome")),
+    ("daycare", "data for one daycare and year",
+     "SELECT * FROM DaycareData WHERE daycare_id = %s AND year = %s",
+     (1, 2024)),
+    ("daycare", "all daycare data for one year",
+     "SELECT * FROM DaycareData WHERE 1=1 AND year = %s",
+     (2024,)),
+    ("policy", "policies by country, focus area and year",
+     "SELECT * FROM Policies WHERE 1=1 AND country_code IN (%s, %s) AND focus_area = %s AND year = %s",
+     ("DE", "FR", "Childcare", 2020)),
+    ("group", "affinity resources by country and focus area",
+     "SELECT * FROM AffinityResources WHERE 1=1 AND country_code = %s AND focus_area = %s",
+     ("DE", "Parenting")),
+    ("users", "users with a role",
+     "SELECT user_id, first_name, last_name FROM User WHERE role_id = %s ORDER BY last_name, first_name",
+     (1,)),
+]
+
+# (table, index name, columns, unique), mirrored in database-files/8_Indexes.sql
+INDEXES = [
+    ("EUEmployment", "idx_euemployment_country_year_sex", ["country_name", "year", "sex"], False),
+    ("Children_FamilyBenefits", "idx_familybenefits_country_year_type_group",
+     ["country_code", "year", "benefit_type", "target_group"], False),
+    ("EUCPI", "idx_eucpi_country_year", ["country_name", "year"], False),
+    ("EUBirthData_With2024", "idx_birthdata_w24_country_year", ["country", "year"], False),
+    ("eu_family_employment_data", "idx_family_employment_country_year", ["country_code", "year"], False),
+    ("DaycareLocations", "idx_daycarelocations_active_country_city", ["inactive", "country_code", "city"], False),
+    ("DaycareData", "idx_daycaredata_daycare_year", ["daycare_id", "year"], True),
+    ("DaycareData", "idx_daycaredata_year", ["year"], False),
+    ("Policies", "idx_policies_country_focus_year", ["country_code", "focus_area", "year"], False),
+    ("AffinityResources", "idx_affinityresources_country_focus_type",
+     ["country_code", "focus_area", "resource_type"], False),
+    ("User", "idx_user_role_name", ["role_id", "last_name", "first_name"], False),
+]
+
+
+def index_ddl(table, name, columns, unique, database=None):
+    """CREATE [UNIQUE] INDEX statement for one INDEXES entry"""
+    target = f"{database}.{table}" if database else table
+    return f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} ON {target} ({', '.join(columns)})"
+
+
+def connection_arguments(description):
+    """Argument parser with the connection options, defaulting to the API's .env settings"""
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--host", default=os.getenv("DB_HOST", "localhost").strip())
+    parser.add_argument("--port", type=int, default=int(os.getenv("DB_PORT", "3306").strip()))
+    parser.add_argument("--user", default=os.getenv("DB_USER", "root").strip())
+    parser.add_argument("--password", default=os.getenv("MYSQL_ROOT_PASSWORD", "").strip())
+    parser.add_argument("--database", default=os.getenv("DB_NAME", "euro_database").strip())
+    return parser
+
+
+def connect(args, database=None, **options):
+    """Open a DictCursor connection from parsed connection arguments (extra pymysql options allowed)"""
+    return pymysql.connect(
+        host=args.host,
+        port=args.port,
+        user=args.user,
+        password=args.password,
+        database=database or args.database,
+        cursorclass=cursors.DictCursor,
+        autocommit=True,
+        **options,
+    )
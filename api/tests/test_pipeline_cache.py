@@ -0,0 +1,42 @@
+import importlib
+import sys
+
+from pipeline.cache import stage_key
+
+STAGE_MODULE = '''
+SCALE = {scale}
+
+
+def helper(frame):
+    return frame * SCALE
+
+
+def stage(frame):
+    return helper(frame)
+'''
+
+
+def write_module(folder, scale):
+    (folder / "fake_stages.py").write_text(STAGE_MODULE.format(scale=scale))
+
+
+def test_editing_a_helper_or_constant_changes_the_stage_key(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    write_module(tmp_path, 2)
+    module = importlib.import_module("fake_stages")
+    try:
+        before = stage_key("fake", module.stage, ["input"])
+        assert stage_key("fake", module.stage, ["input"]) == before
+
+        write_module(tmp_path, 3)
+        module = importlib.reload(module)
+        assert stage_key("fake", module.stage, ["input"]) != before
+    finally:
+        sys.modules.pop("fake_stages", None)
+
+
+def test_stage_key_changes_with_its_inputs():
+    from pipeline.stages import STAGES
+
+    func, _ = STAGES["EUCPI"]
+    assert stage_key("EUCPI", func, ["a"]) != stage_key("EUCPI", func, ["b"])
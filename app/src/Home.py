@@ -4,7 +4,7 @@
 ##################################################
 
 # Set up basic logging infrastructure
-import logging, requests
+import logging
 import base64
 from datetime import datetime
 from streamlit.components.v1 import html
@@ -16,6 +16,7 @@ logger = logging.getLogger(__name__)
 # as SideBarLinks function from src/modules folder
 import streamlit as st
 from modules.nav import SideBarLinks, AlwaysShowAtBottom
+from modules.api_client import api_get_many
 
 # streamlit supports regular and wide layout (how the controls
 # are organized/displayed on the screen).
@@ -47,13 +48,17 @@ def get_base64(path):
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode()
     
-def fetch_users_by_role(role_id):
-    try:
-        response = requests.get(f"http://web-api:4000/users/role/{role_id}")
-        if response.status_code == 200:
-            return response.json()
-    except Exception as e:
-        logger.error(f"Error fetching users: {e}")
+def fetch_users_by_roles(role_ids):
+    # one request per role, all sent at once; None for a role that could not be loaded
+    responses = api_get_many({role_id: f"/users/role/{role_id}" for role_id in role_ids})
+    users = {}
+    for role_id, response in responses.items():
+        users[role_id] = None
+        if isinstance(response, Exception):
+            logger.error(f"Error fetching users: {response}")
+        elif response.status_code == 200:
+            users[role_id] = response.json()
+    return users
 
 background_img = get_base64("assets/homepage_background.png")
 
@@ -109,9 +114,10 @@ st.markdown("<h2 style='text-align: center;'>Are you here as...</h2>", unsafe_al
 col1, col2, col3 = st.columns(3)
 
 # Fetch users, going by role
-daycare_users = fetch_users_by_role(1)  # role_id 1: daycare
-parent_users = fetch_users_by_role(2)   # role_id 2: parent
-politician_users = fetch_users_by_role(3)  # role_id 3: politician
+users_by_role = fetch_users_by_roles([1, 2, 3])
+daycare_users = users_by_role[1]  # role_id 1: daycare
+parent_users = users_by_role[2]   # role_id 2: parent
+politician_users = users_by_role[3]  # role_id 3: politician
 
 with col1:
     st.markdown("# A daycare?")
@@ -0,0 +1,233 @@
+# Shared client for every call the app makes to the web-api container.
+#
+# All pages go through one pooled requests.Session, so TCP connections are
+# reused across reruns and sessions instead of being opened per call.
+# GET responses are cached per (path, params) for a TTL picked by the
+# endpoint's prefix (see CACHE_TTLS); once a TTL runs out the cached copy is
+# revalidated with its ETag, so unchanged reference data comes back as a
+# small 304. Identical GETs issued at the same time (several users or
+# reruns at once) share a single HTTP request. Writes go straight through
+# and drop the cached GETs of the blueprint they touched. api_get_many runs
+# independent GETs side by side on a small thread pool, so a page waits for
+# its slowest call rather than the sum of all of them.
+#
+# Usage from a page:
+#     from modules.api_client import api_get
+#     response = api_get("/cpi/cpi", params={"country_name": "Austria"})
+#     if response.status_code == 200:
+#         data = response.json()
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+API_BASE_URL = "http://web-api:4000"
+
+# seconds to wait for the API to accept the connection and to send a response
+CONNECT_TIMEOUT = 3
+READ_TIMEOUT = 20
+
+# seconds a cached GET is reused without asking the API, by path prefix.
+# The longest matching prefix wins; 0 means never cache.
+CACHE_TTLS = {
+    "/cpi": 3600,
+    "/hours": 3600,
+    "/benefits": 3600,
+    "/birthdata": 3600,
+    "/euro_apis": 3600,
+    "/model1": 600,
+    "/model2": 600,
+    "/policy": 600,
+    "/users": 300,
+    "/group": 60,
+    "/location": 60,
+    "/daycaredata": 60,
+    "/notes": 0,
+}
+DEFAULT_TTL = 60
+
+# writes under one prefix also change what these prefixes return
+# (locations are returned with their data, aggregates join the locations)
+RELATED_PREFIXES = {
+    "/location": ("/daycaredata",),
+    "/daycaredata": ("/location",),
+}
+
+# most cached responses kept at once, the oldest are dropped first
+MAX_CACHE_ENTRIES = 256
+
+# threads for api_get_many, and the seconds a whole batch may take by default
+FANOUT_WORKERS = 8
+DEFAULT_DEADLINE = 15
+
+
+class ApiClient:
+    """Pooled, caching HTTP client for the web-api container"""
+
+    def __init__(self, base_url=API_BASE_URL, ttls=CACHE_TTLS, pool_size=20):
+        self.base_url = base_url.rstrip("/")
+        self.ttls = ttls
+        self.session = requests.Session()
+        # connection errors on GETs are retried with a short backoff; writes are never retried
+        retry = Retry(total=2, connect=2, read=0, backoff_factor=0.2, allowed_methods=["GET"])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._cache = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="api-fanout")
+
+    def ttl_for(self, path):
+        """Cache TTL for a path, from the longest matching prefix in ttls"""
+        matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        return self.ttls[max(matches, key=len)] if matches else DEFAULT_TTL
+
+    def get(self, path, params=None, ttl=None, timeout=None):
+        """GET path, served from the cache while it is fresh. Returns a requests.Response"""
+        ttl = self.ttl_for(path) if ttl is None else ttl
+        if not ttl:
+            return self._send("GET", path, params=params, timeout=timeout)
+
+        key = (path, _freeze(params))
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            # someone else is already fetching this exact request, wait for their answer
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            response = self._fetch(key, path, params, ttl, timeout, entry)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def get_many(self, calls, deadline=DEFAULT_DEADLINE):
+        """Run several GETs in parallel, waiting at most deadline seconds for all of them.
+
+        `calls` maps a name to a path or a (path, params) pair. Returns
+        {name: response}; a call that failed or missed the deadline maps to
+        its exception (requests.exceptions.Timeout for the deadline) instead.
+        """
+        # no single call may outlive the batch
+        timeout = (CONNECT_TIMEOUT, min(READ_TIMEOUT, deadline))
+        futures = {}
+        for name, call in calls.items():
+            path, params = (call, None) if isinstance(call, str) else call
+            futures[name] = self._executor.submit(self.get, path, params, None, timeout)
+
+        wait(futures.values(), timeout=deadline)
+        results = {}
+        for name, future in futures.items():
+            if not future.done():
+                future.cancel()
+                results[name] = requests.exceptions.Timeout(f"{name} did not finish within {deadline}s")
+            elif future.exception() is not None:
+                results[name] = future.exception()
+            else:
+                results[name] = future.result()
+        return results
+
+    def post(self, path, json=None, timeout=None, **kwargs):
+        return self._write("POST", path, json=json, timeout=timeout, **kwargs)
+
+    def put(self, path, json=None, timeout=None, **kwargs):
+        return self._write("PUT", path, json=json, timeout=timeout, **kwargs)
+
+    def delete(self, path, timeout=None, **kwargs):
+        return self._write("DELETE", path, timeout=timeout, **kwargs)
+
+    def invalidate(self, prefix=""):
+        """Drop every cached GET whose path starts with prefix"""
+        with self._lock:
+            for key in [key for key in self._cache if key[0].startswith(prefix)]:
+                del self._cache[key]
+
+    def _fetch(self, key, path, params, ttl, timeout, entry):
+        # revalidate an expired copy with its ETag instead of downloading it again
+        headers = {}
+        etag = entry[1].headers.get("ETag") if entry is not None else None
+        if etag:
+            headers["If-None-Match"] = etag
+
+        response = self._send("GET", path, params=params, timeout=timeout, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            response = entry[1]
+        elif response.status_code != 200:
+            return response
+
+        with self._lock:
+            self._cache.pop(key, None)
+            self._cache[key] = (time.monotonic() + ttl, response)
+            while len(self._cache) > MAX_CACHE_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+        return response
+
+    def _write(self, method, path, **kwargs):
+        response = self._send(method, path, **kwargs)
+        # e.g. a POST to /location/locations drops every cached /location GET
+        prefix = "/" + path.lstrip("/").split("/", 1)[0]
+        for stale in (prefix, *RELATED_PREFIXES.get(prefix, ())):
+            self.invalidate(stale)
+        return response
+
+    def _send(self, method, path, timeout=None, **kwargs):
+        logger.debug(f"{method} {path} {kwargs.get('params') or ''}")
+        return self.session.request(
+            method,
+            self.base_url + path,
+            timeout=timeout or (CONNECT_TIMEOUT, READ_TIMEOUT),
+            **kwargs,
+        )
+
+
+def _freeze(params):
+    """Hashable, order-independent form of a params dict"""
+    if not params:
+        return ()
+    return tuple(sorted((str(name), str(value)) for name, value in params.items()))
+
+
+# one client per app process, shared by every page and session
+client = ApiClient()
+
+
+def api_get(path, params=None, ttl=None, timeout=None):
+    return client.get(path, params=params, ttl=ttl, timeout=timeout)
+
+
+def api_get_many(calls, deadline=DEFAULT_DEADLINE):
+    return client.get_many(calls, deadline=deadline)
+
+
+def api_post(path, json=None, timeout=None, **kwargs):
+    return client.post(path, json=json, timeout=timeout, **kwargs)
+
+
+def api_put(path, json=None, timeout=None, **kwargs):
+    return client.put(path, json=json, timeout=timeout, **kwargs)
+
+
+def api_delete(path, timeout=None, **kwargs):
+    return client.delete(path, timeout=timeout, **kwargs)
@@ -5,7 +5,7 @@
 import streamlit as st
 from datetime import datetime
 from io import StringIO
-import requests
+from modules.api_client import api_get, api_post
 import logging
 
 # Set up logger
@@ -126,7 +126,7 @@ def NoteTakingFeature():
         if not notes.strip():  # Only show if notes are empty
             if st.button("↺ Load Previous Note", use_container_width=True, key=f"load_button_{user_id}"):
                 try:
-                    response = requests.get(f"http://web-api:4000/notes/notes/{user_id}")
+                    response = api_get(f"/notes/notes/{user_id}")
                     
                     if response.status_code == 200:
                         data = response.json()
@@ -149,8 +149,8 @@ def NoteTakingFeature():
             
             # auto-save to API
             try:
-                response = requests.post(
-                    "http://web-api:4000/notes/notes",
+                response = api_post(
+                    "/notes/notes",
                     json={
                         "user_id": user_id,
                         "note_content": notes
@@ -202,8 +202,8 @@ def Logout():
                 notes = st.session_state.get(user_notes_key, "").strip()
                 if notes:
                     try:
-                        requests.post(
-                            "http://web-api:4000/notes/notes",
+                        api_post(
+                            "/notes/notes",
                             json={
                                 "user_id": user_id,
                                 "note_content": notes
@@ -1,6 +1,7 @@
 import logging
 import streamlit as st
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get
 import requests
 from streamlit_extras.app_logo import add_logo
 import datetime, base64
@@ -41,7 +42,7 @@ def get_base64(path):
     
 def fetch_users_by_role(role_id):
     try:
-        response = requests.get(f"http://web-api:4000/users/role/{role_id}")
+        response = api_get(f"/users/role/{role_id}")
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -92,7 +93,7 @@ with col2:
     if st.button("Research new locations", type="primary", use_container_width=True):
         st.switch_page("pages/07_Daycare_Research.py")
     if st.button("Add a new location", type="primary", use_container_width=True):
-        API_URL = "http://web-api:4000/location/locations"
+        API_URL = "/location/locations"
         st.switch_page("pages/05_Add_Location.py")
 
 with col1:
@@ -103,9 +104,9 @@ with col1:
         viewLocations = True
 
         if viewLocations:
-            API_URL = "http://web-api:4000/location/locations"
+            API_URL = "/location/locations"
             try:
-                response = requests.get(API_URL)
+                response = api_get(API_URL)
                 if response.status_code == 200:
                     locations = response.json()
 
@@ -2,6 +2,7 @@ import streamlit as st
 import requests
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_post
 import datetime
 
 # Initialize sidebar
@@ -12,7 +13,7 @@ AlwaysShowAtBottom()
 st.title("Add New Daycare Location")
 
 # API endpoint
-API_URL = "http://web-api:4000/location/locations"
+API_URL = "/location/locations"
 
 # Create a form for NGO details
 with st.form("add_location_form"):
@@ -41,7 +42,7 @@ with st.form("add_location_form"):
 
             try:
                 # Send POST request to API
-                response = requests.post(API_URL, json=ngo_data)
+                response = api_post(API_URL, json=ngo_data)
 
                 if response.status_code == 201:
                     st.success("Location added successfully!")
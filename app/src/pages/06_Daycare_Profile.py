@@ -2,6 +2,7 @@ import streamlit as st
 import requests
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get, api_put, api_delete
 
 
 # Initialize sidebar
@@ -42,10 +43,10 @@ with col1:
             on_click=lambda: st.switch_page("pages/04_Business_Planner.py"),
         )
     else:
-        API_URL = f"http://web-api:4000/location/locations/{location_id}"
+        API_URL = f"/location/locations/{location_id}"
 
         try:
-            response = requests.get(API_URL)
+            response = api_get(API_URL)
 
             if response.status_code == 200:
                 loc = response.json()
@@ -128,7 +129,7 @@ if st.session_state["update_location_data"]:
             }
 
             try:
-                response1 = requests.put(f"http://web-api:4000/daycaredata/data/{location_id}",json=payload)
+                response1 = api_put(f"/daycaredata/data/{location_id}",json=payload)
 
                 if response1.status_code == 200:
                     st.success("Data updated successfully!")
@@ -166,7 +167,7 @@ if st.session_state['delete_location']:
 # if user wants to delete the location
 if st.session_state.get("confirm_delete"):
     try:
-        response2 = requests.delete(f"http://web-api:4000/location/locations/{location_id}")
+        response2 = api_delete(f"/location/locations/{location_id}")
 
         if response2.status_code == 200:
             st.success("Data updated successfully!")
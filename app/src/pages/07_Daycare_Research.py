@@ -1,7 +1,7 @@
 import streamlit as st
-import requests
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -28,25 +28,15 @@ st.markdown("""
 - Is this market oversaturated or still growing?
 """)
 
-# 1. Get all locations (only active ones returned by your route)
-locations_response = requests.get("http://web-api:4000/location/locations")
-locations_data = locations_response.json()
-df_locations = pd.DataFrame(locations_data)
-
-# 2. Get all daycare data (raw data, all rows)
-data_response = requests.get("http://web-api:4000/daycaredata/data")
-data_data = data_response.json()
-df_data = pd.DataFrame(data_data)
-
-# 3. Merge & preprocess
-df = pd.merge(df_data, df_locations, on="daycare_id")
-df = df[df["inactive"] == False]  # Filter to active only
-
-# Ensure correct types
-df["year"] = df["Year"].astype(int)
-df["daycare_display_name"] = df["daycare_name"] + " (" + df["city"] + ")"
+# 1. Get average enrollment per country and year, computed by the API
+summary_response = api_get(
+    "/daycaredata/aggregates",
+    params={"group_by": "country,year"}
+)
+df = pd.DataFrame(summary_response.json())
+df["year"] = df["year"].astype(int)
 
-# 4. Country map
+# 2. Country map
 country_map = {
     'BE': 'Belgium',
     'BG': 'Bulgaria',
@@ -80,17 +70,17 @@ df["country_full"] = df["country_code"].map(country_map)
 
 
 
-# 5. Dropdown to select country
+# 3. Dropdown to select country
 available_countries = sorted(df["country_full"].dropna().unique())
 selected_country = st.selectbox("Select Country", available_countries)
 selected_country_code = df[df["country_full"] == selected_country]["country_code"].iloc[0]
 
 
-# 6. Filter by country and group by year
-filtered_df = df[df["country_full"] == selected_country]
-summary = filtered_df.groupby("year")["Enrollment"].mean().reset_index()
+# 4. Filter by country (already grouped by year)
+summary = df[df["country_full"] == selected_country][["year", "avg_enrollment"]]
+summary = summary.rename(columns={"avg_enrollment": "Enrollment"})
 
-# 7. Plot
+# 5. Plot
 fig = px.bar(
     summary,
     x="year",
@@ -113,7 +103,18 @@ with col2:
 
 # --- Filter to latest year ---
 latest_year = df["year"].max()
-bar_df = df[(df["year"] == latest_year) & (df["country_code"] == selected_country_code)].copy()
+# this call needs the latest year and the chosen country, so it cannot run
+# alongside the summary; it fetches only that country's daycares for that year
+daycare_response = api_get(
+    "/daycaredata/aggregates",
+    params={"group_by": "daycare", "year": int(latest_year), "country_code": selected_country_code}
+)
+bar_df = pd.DataFrame(
+    daycare_response.json(),
+    columns=["daycare_name", "city", "avg_enrollment", "avg_staff"]
+)
+bar_df["daycare_display_name"] = bar_df["daycare_name"] + " (" + bar_df["city"] + ")"
+bar_df = bar_df.rename(columns={"avg_enrollment": "Enrollment", "avg_staff": "Staff"})
 bar_df.sort_values(by="Enrollment", ascending=False, inplace=True)
 
 # --- Plot ---
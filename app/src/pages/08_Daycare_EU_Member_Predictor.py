@@ -5,6 +5,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from typing import Dict, List
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get, api_post
 import time
 import base64, logging
 
@@ -18,7 +19,7 @@ st.set_page_config(layout="wide")
 SideBarLinks()
 
 # Configuration
-API_BASE_URL = "http://web-api:4000/model2" 
+API_BASE_URL = "/model2" 
 
 Back("00_Daycare_Home.py")
 
@@ -26,7 +27,7 @@ Back("00_Daycare_Home.py")
 # Fetch feature stats from API
 def get_feature_stats() -> Dict: # return Dict
     try:
-        response = requests.get(f"{API_BASE_URL}/api/features/stats")
+        response = api_get(f"{API_BASE_URL}/api/features/stats")
         if response.status_code == 200:
             return response.json()
         else:
@@ -39,7 +40,7 @@ def get_feature_stats() -> Dict: # return Dict
 # Get country recs
 def get_recommendations(preferences: Dict) -> Dict: # returh Dict
     try:
-        response = requests.post(
+        response = api_post(
             f"{API_BASE_URL}/api/recommend",
             json=preferences
         )
@@ -112,7 +113,7 @@ def get_base64(path):
     
 def fetch_users_by_role(role_id):
     try:
-        response = requests.get(f"http://web-api:4000/users/role/{role_id}")
+        response = api_get(f"/users/role/{role_id}")
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -8,6 +8,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import plotly.express as px
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get
 import streamlit as st
 import requests
 import time
@@ -26,7 +27,7 @@ def get_base64(path):
     
 def fetch_users_by_role(role_id):
     try:
-        response = requests.get(f"http://web-api:4000/users/role/{role_id}")
+        response = api_get(f"/users/role/{role_id}")
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -94,7 +95,7 @@ viewLocations = st.session_state.get('view_locations', False)
 def get_cities_for_country(country_code):
     """Fetch all unique cities for a given country code"""
     try:
-        response = requests.get("http://web-api:4000/location/locations", 
+        response = api_get("/location/locations", 
                               params={"country_code": country_code})
         if response.status_code == 200:
             data = response.json()
@@ -132,7 +133,7 @@ with tab1:
             "country_code": st.session_state.selected_country,
             "city": st.session_state.selected_city
         }
-        response = requests.get("http://web-api:4000/location/locations", params=params)
+        response = api_get("/location/locations", params=params)
 
         if response.status_code == 200:
             data = response.json()
@@ -165,7 +166,7 @@ with tab2:
     selected_country_display_tab2 = st.selectbox('Pick a country', country_names_tab2, key="country_tab2")
     selected_country = selected_country_display_tab2.split(" (")[-1].rstrip(")")
     
-    response = requests.get("http://web-api:4000/location/locations", params={"country_code": selected_country})
+    response = api_get("/location/locations", params={"country_code": selected_country})
     if response.status_code == 200:
         data = response.json()
         if not data:
@@ -196,57 +197,39 @@ with tab2:
         
         st.balloons()
         
+        # both daycares and their 2025 data in one request
+        locations = {}
+        try: 
+            response = api_get(
+                "/location/locations",
+                params={"ids": f"{id1},{id2}", "include": "data", "year": 2025},
+            )
+            if response.status_code == 200:
+                locations = {loc["daycare_id"]: loc for loc in response.json()}
+            else:
+                st.error(f"Failed to fetch daycares: {response.status_code}")
+        except requests.exceptions.RequestException as e:
+                st.error(f"Error connecting to the API: {str(e)}")
+
         col1, col2 = st.columns(2)
 
-        with col1: 
-            with st.container(border=True):
-                try: 
-                    response = requests.get(f"http://web-api:4000/location/locations/{id1}", params={"year": 2025})
-                    if response.status_code == 200:
-                        loc = response.json()
-
-                        
-                        st.header(loc["daycare_name"])
-                        st.write(f"{loc['city']}, {country_map.get(item['country_code'], item['country_code'])}")
-
-                        # Display data
-                        if loc.get("data"):
-                            st.subheader("Details")
-                            for data in loc["data"]: 
-                                    st.write(f"**Enrollment:** {data['Enrollment']}")
-                                    st.write(f"**Monthly Price:** {data['Monthly Price']}")
-                                    st.write(f"**Opening Time:** {data['Opening Time']}")
-                                    st.write(f"**Closing Time:** {data['Closing Time']}")
-                                    
-                        else:
-                            st.info("No data found for this location")
-
-                
-                except requests.exceptions.RequestException as e:
-                        st.error(f"Error connecting to the API: {str(e)}")
-        with col2: 
-            with st.container(border=True):
-                try: 
-                    response = requests.get(f"http://web-api:4000/location/locations/{id2}", params={"year": 2025})
-                    if response.status_code == 200:
-                        loc = response.json()
-
-                        
-                        st.header(loc["daycare_name"])
-                        st.write(f"{loc['city']}, {country_map.get(item['country_code'], item['country_code'])}")
-
-                        # Display data
-                        if loc.get("data"):
-                            st.subheader("Details")
-                            for data in loc["data"]: 
-                                    st.write(f"**Enrollment:** {data['Enrollment']}")
-                                    st.write(f"**Monthly Price:** {data['Monthly Price']}")
-                                    st.write(f"**Opening Time:** {data['Opening Time']}")
-                                    st.write(f"**Closing Time:** {data['Closing Time']}")
-                                    
-                        else:
-                            st.info("No data found for this location")
-
-                
-                except requests.exceptions.RequestException as e:
-                        st.error(f"Error connecting to the API: {str(e)}")
\ No newline at end of file
+        for col, daycare_id in ((col1, id1), (col2, id2)):
+            loc = locations.get(daycare_id)
+            if loc is None:
+                continue
+            with col: 
+                with st.container(border=True):
+                    st.header(loc["daycare_name"])
+                    st.write(f"{loc['city']}, {country_map.get(loc['country_code'], loc['country_code'])}")
+
+                    # Display data
+                    if loc.get("data"):
+                        st.subheader("Details")
+                        for data in loc["data"]: 
+                                st.write(f"**Enrollment:** {data['Enrollment']}")
+                                st.write(f"**Monthly Price:** {data['Monthly Price']}")
+                                st.write(f"**Opening Time:** {data['Opening Time']}")
+                                st.write(f"**Closing Time:** {data['Closing Time']}")
+                                
+                    else:
+                        st.info("No data found for this location")
\ No newline at end of file
@@ -2,6 +2,7 @@ import streamlit as st
 import requests
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get
 import logging, base64
 
 # Initialize sidebar
@@ -16,7 +17,7 @@ def get_base64(path):
     
 def fetch_users_by_role(role_id):
     try:
-        response = requests.get(f"http://web-api:4000/users/role/{role_id}")
+        response = api_get(f"/users/role/{role_id}")
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -91,14 +92,14 @@ country_map = {
 name_to_code = {v: k for k, v in country_map.items()}
 
 # API endpoint
-API_URL = "http://web-api:4000/group/groups"
+API_URL = "/group/groups"
 
 # Create filter columns
 col1, col2, col3 = st.columns(3)
 
 # Get unique values for filters from the API
 try:
-    response = requests.get(API_URL)
+    response = api_get(API_URL)
     if response.status_code == 200:
         groups = response.json()
 
@@ -130,7 +131,7 @@ try:
             params["resource_type"] = selected_type
 
         # Get filtered data
-        filtered_response = requests.get(API_URL, params=params)
+        filtered_response = api_get(API_URL, params=params)
         if filtered_response.status_code == 200:
             filtered_groups = filtered_response.json()
 
@@ -2,6 +2,7 @@ import streamlit as st
 import requests
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get
 
 # Initialize sidebar
 SideBarLinks()
@@ -32,11 +33,11 @@ if location_id is None:
     )
 else:
     # API endpoint
-    API_URL = f"http://web-api:4000/location/locations/{location_id}"
+    API_URL = f"/location/locations/{location_id}"
 
     try:
         # Fetch NGO details
-        response = requests.get(API_URL)
+        response = api_get(API_URL)
 
         if response.status_code == 200:
             loc = response.json()
@@ -5,6 +5,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import base64
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get, api_post
 
 # config & Sidebar
 logger = logging.getLogger(__name__)
@@ -93,17 +94,16 @@ user_country_code = name_to_code.get(user_country)
 # Fetch historical data for the selected country
 def fetch_country_birth_data(country_code):
     """Fetch birth rate data for a specific country"""
-    API_BIRTH_URL = "http://web-api:4000/birthdata/api/birth-rates"
+    API_BIRTH_URL = "/birthdata/api/birth-rates"
     try:
-        resp = requests.get(API_BIRTH_URL, timeout=10)
+        # only this country and years before 2024, one array per column
+        params = {"country": country_code, "year_to": 2023, "format": "columns"}
+        resp = api_get(API_BIRTH_URL, params=params, timeout=10)
         resp.raise_for_status()
         
         # Convert to DataFrame
         cols = ["country", "year", "birth_rate_per_thousand", "live_births"]
-        df = pd.DataFrame(resp.json(), columns=cols)
-        
-        # Filter for specific country and years before 2024
-        country_df = df[(df["country"] == country_code) & (df["year"] < 2024)]
+        country_df = pd.DataFrame(resp.json(), columns=cols)
         return country_df.sort_values("year")
     except requests.exceptions.RequestException as e:
         st.error(f"Unable to fetch birth-rate data: {e}")
@@ -122,61 +122,19 @@ with col2:
     services = st.sidebar.number_input("Childcare Services per Capita (€)", value=20000, min_value=0, step=50)
     maternity = st.sidebar.number_input("Maternity Spending per Capita (€)", value=300, min_value=0, step=50)
 
-# load Model Weights + predict
+# predict with Model 1 on the API (weights and standardization live server-side)
 try:
-    response = requests.get("http://web-api:4000/euro_apis/m1weights") 
+    response = api_post("/model1/api/predict", json={
+        "inputs": {
+            "weekly_hours": weekly_hours,
+            "cash_per_capita": cash,
+            "services_per_capita": services,
+            "maternity_per_capita": maternity,
+            "year": 2024,
+        }
+    })
     response.raise_for_status()
-    weights_list = response.json()
-    weights = {row["feature_name"]: float(row["weight"]) for row in weights_list}
-
-    # Means and stds from training data
-    mean_vals = {
-        'weekly_hours': 37.88517,
-        'maternity_per_capita': 247.1181,
-        'services_per_capita': 26039.31,
-        'year': 2018.45,
-        'weekly_hours_squared': 1440.816,
-        'cash_per_capita_squared': 8.248512e9,
-        'services_per_capita_squared': 3.750855e9
-    }
-
-    std_vals = {
-        'weekly_hours': 2.35736,
-        'maternity_per_capita': 656.3605,
-        'services_per_capita': 55566.02,
-        'year': 2.265675,
-        'weekly_hours_squared': 171.7396,
-        'cash_per_capita_squared': 2.972042e10,
-        'services_per_capita_squared': 1.440493e10
-    }
-
-    # Compute and standardize inputs
-    weekly_hours_sq = weekly_hours ** 2
-    cash_sq = cash ** 2
-    services_sq = services ** 2
-
-    features_std = {
-        "weekly_hours": (weekly_hours - mean_vals['weekly_hours']) / std_vals['weekly_hours'],
-        "maternity_per_capita": (maternity - mean_vals['maternity_per_capita']) / std_vals['maternity_per_capita'],
-        "services_per_capita": (services - mean_vals['services_per_capita']) / std_vals['services_per_capita'],
-        "year": (2024 - mean_vals['year']) / std_vals['year'],
-        "weekly_hours_squared": (weekly_hours_sq - mean_vals['weekly_hours_squared']) / std_vals['weekly_hours_squared'],
-        "cash_per_capita_squared": (cash_sq - mean_vals['cash_per_capita_squared']) / std_vals['cash_per_capita_squared'],
-        "services_per_capita_squared": (services_sq - mean_vals['services_per_capita_squared']) / std_vals['services_per_capita_squared'],
-    }
-
-    # Predict birth rate
-    prediction = (
-        weights.get("intercept", 0)
-        + features_std["weekly_hours"] * weights.get("weekly_hours", 0)
-        + features_std["maternity_per_capita"] * weights.get("maternity_per_capita", 0)
-        + features_std["services_per_capita"] * weights.get("services_per_capita", 0)
-        + features_std["year"] * weights.get("year", 0)
-        + features_std["weekly_hours_squared"] * weights.get("weekly_hours_squared", 0)
-        + features_std["cash_per_capita_squared"] * weights.get("cash_per_capita_squared", 0)
-        + features_std["services_per_capita_squared"] * weights.get("services_per_capita_squared", 0)
-    )
-    prediction = max(0, prediction)
+    prediction = response.json()["prediction"]
     st.text(f"Predicted Birth Rate for {user_country} in 2024:")
     st.markdown(
     
@@ -197,7 +155,7 @@ try:
     )
 
 except requests.exceptions.RequestException as e:
-    st.error(f"Failed to fetch model weights: {e}")
+    st.error(f"Failed to get a prediction: {e}")
     st.stop()
 
 st.divider()
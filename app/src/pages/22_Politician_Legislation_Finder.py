@@ -2,6 +2,7 @@ import logging
 logger = logging.getLogger(__name__)
 import streamlit as st
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get
 import requests
 import pandas as pd
 import plotly.graph_objects as go
@@ -65,11 +66,11 @@ country_map = {
 # DATA LOAD 
 
 def fetch_birth_rates() -> pd.DataFrame:
-    API_BIRTH_URL = "http://web-api:4000/birthdata/api/birth-rates"   # Flask route :contentReference[oaicite:1]{index=1}
+    API_BIRTH_URL = "/birthdata/api/birth-rates"   # Flask route :contentReference[oaicite:1]{index=1}
     try:
-        resp = requests.get(API_BIRTH_URL, timeout=10)
+        resp = api_get(API_BIRTH_URL, params={"format": "columns"}, timeout=10)
         resp.raise_for_status()          # -> HTTPError if 4xx/5xx
-        # Flask returns a JSON list → list of rows in the fixed column order
+        # Flask returns one JSON array per column → straight into the DataFrame
         cols = ["country", "year", "birth_rate_per_thousand", "live_births"]
         return pd.DataFrame(resp.json(), columns=cols)
     except requests.exceptions.RequestException as e:
@@ -194,10 +195,10 @@ st.divider()
 st.info("← Filter legislations using the sidebar.")
 
 # POLICY API SECTION 
-API_URL = "http://web-api:4000/policy/allpolicy"
+API_URL = "/policy/allpolicy"
 
 try:
-    response = requests.get(API_URL)
+    response = api_get(API_URL)
     if response.status_code == 200:
         policy = response.json()
         
@@ -227,7 +228,7 @@ try:
         if selected_year != "All":
             params["year"] = selected_year
 
-        filtered_response = requests.get(API_URL, params=params)
+        filtered_response = api_get(API_URL, params=params)
         if filtered_response.status_code == 200:
             filtered_policy = filtered_response.json()
             st.write(f"Found {len(filtered_policy)} Policies")
@@ -3,6 +3,7 @@ import pandas as pd
 import plotly.graph_objects as go
 from streamlit_extras.app_logo import add_logo
 from modules.nav import SideBarLinks, AlwaysShowAtBottom, Back
+from modules.api_client import api_get, api_get_many
 import requests
 import plotly.express as px
 import base64, logging
@@ -15,7 +16,7 @@ def get_base64(path):
     
 def fetch_users_by_role(role_id):
     try:
-        response = requests.get(f"http://web-api:4000/users/role/{role_id}")
+        response = api_get(f"/users/role/{role_id}")
         if response.status_code == 200:
             return response.json()
     except Exception as e:
@@ -61,7 +62,7 @@ st.write("Get a clear picture of life across Europe — from how many hours peop
 st.divider()
 
 
-API_URL = "http://web-api:4000/hours/weeklyhours"
+API_URL = "/hours/weeklyhours"
 
 
 col1, col2 = st.columns(2)
@@ -78,19 +79,27 @@ with col1:
 with col2:
     selected_year = st.number_input("Select Year", min_value=2015, max_value=2022, step=1, value=2022)
 
-# Fetch data for both sexes
+# Fetch data for both sexes, and the CPI series for the third tab, all at once
 sexes = ["males", "females"]
-data = []
-
+calls = {}
 for sex in sexes:
     params = {
         "country_name": selected_country,
         "year": str(selected_year),
         "sex": sex
     }
-    response = requests.get(API_URL, params=params)
+    calls[sex] = (API_URL, params)
+calls["cpi"] = ("/cpi/cpi", {"country_name": selected_country})
+responses = api_get_many(calls)
+
+data = []
+
+for sex in sexes:
+    response = responses[sex]
 
-    if response.status_code == 200:
+    if isinstance(response, Exception):
+        st.error(f"Failed to fetch data for sex: {sex} ({str(response)})")
+    elif response.status_code == 200:
         results = response.json()
         for row in results:
             emp_all = row["emp_all"]
@@ -168,7 +177,7 @@ with tab2:
     }
 
     try: 
-        API_URL = "http://web-api:4000/benefits/benefit"
+        API_URL = "/benefits/benefit"
         name_to_code = {v: k for k, v in country_map.items()}
 
         # Convert selected full country names to country codes
@@ -180,7 +189,7 @@ with tab2:
             'target_group': "All Parents"  
         }
 
-        response1 = requests.get(API_URL, params=params)
+        response1 = api_get(API_URL, params=params)
         if response1.status_code == 200:
             data = response1.json()
 
@@ -210,12 +219,12 @@ with tab2:
 
 
 with tab3:
-    #CPI Viz
-    API_URL = "http://web-api:4000/cpi/cpi"  # Adjust host/port if needed
-    params = {"country_name": selected_country}
-    response = requests.get(API_URL, params=params)
+    #CPI Viz (fetched together with the weekly hours above)
+    response = responses["cpi"]
 
-    if response.status_code == 200:
+    if isinstance(response, Exception):
+        st.error(f"Error connecting to the API: {str(response)}")
+    elif response.status_code == 200:
         data = response.json()
 
         if data:
@@ -256,565 +256,288 @@ VALUES ('AT', 'A', 2015, 9.8, 84381),
        ('EU27_2020', 'A', 2023, 8.2, 3669659);
 
 -- ## EUCPI
--- INSERTS FOR Austria
 INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2015, 112.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2016, 76.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2017, 83.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2018, 61.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2019, 84.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2021, 121.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2022, 55.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Austria', 2023, 97.3);
-
--- INSERTS FOR Belgium
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2015, 94.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2016, 97.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2017, 132.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2018, 109.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2019, 61.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2020, 123.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2021, 170.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2022, 62.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Belgium', 2023, 47.3);
-
--- INSERTS FOR Bulgaria
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2015, 95.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2016, 96.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2017, 137.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2018, 110.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2019, 85.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2020, 124.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2021, 168.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2022, 49.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Bulgaria', 2023, 44.9);
-
--- INSERTS FOR Croatia
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2015, 110.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2016, 92.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2017, 65.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2018, 57.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2019, 87.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2020, 174.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2021, 119.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2022, 48.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Croatia', 2023, 53.7);
-
--- INSERTS FOR Cyprus
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2015, 112.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2016, 93.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2017, 67.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2018, 57.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2019, 89.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2020, 161.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2021, 142.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2022, 54.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Cyprus', 2023, 56.5);
-
--- INSERTS FOR Czechia
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2015, 94.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2016, 96.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2017, 138.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2018, 111.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2019, 85.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2020, 128.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2021, 164.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2022, 48.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Czechia', 2023, 42.2);
-
--- INSERTS FOR Denmark
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2015, 96.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2016, 94.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2017, 137.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2018, 112.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2019, 86.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2020, 122.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2021, 158.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2022, 48.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Denmark', 2023, 41.4);
-
--- INSERTS FOR Estonia
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2015, 97.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2016, 89.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2017, 62.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2018, 111.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2019, 86.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2020, 114.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2021, 171.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2022, 47.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Estonia', 2023, NULL);
-
--- INSERTS FOR European Union - 27 countries (from 2020)
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2015, 99.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2016, 101.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2017, 127.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2018, 108.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2019, 55.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2020, 130.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2021, 157.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2022, 59.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('European Union - 27 countries (from 2020)', 2023, 61.7);
-
--- INSERTS FOR Finland
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2015, 68.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2016, 65.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2017, 89.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2018, 87.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2019, 125.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2021, 53.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2022, 51.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Finland', 2023, 124.8);
-
--- INSERTS FOR France
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2015, 111.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2016, 90.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2017, 62.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2018, 57.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2019, 87.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2020, 158.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2021, 122.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2022, 51.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('France', 2023, 52.9);
-
--- INSERTS FOR Germany
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2015, 96.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2016, 92.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2017, 134.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2018, 113.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2019, 86.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2020, 114.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2021, 165.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2022, 48.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Germany', 2023, 43.4);
-
--- INSERTS FOR Greece
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2015, 93.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2016, 90.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2017, 60.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2018, 108.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2019, 87.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2020, 125.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2021, 172.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2022, 49.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Greece', 2023, 53.2);
-
--- INSERTS FOR Hungary
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2015, 113.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2016, 73.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2017, 73.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2018, 59.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2019, 70.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2020, 157.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2021, 120.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2022, 48.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Hungary', 2023, NULL);
-
--- INSERTS FOR Ireland
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2015, 94.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2016, 89.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2017, 61.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2018, 108.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2019, 86.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2020, 117.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2021, 166.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2022, 48.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Ireland', 2023, NULL);
-
--- INSERTS FOR Italy
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2015, 111.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2016, 93.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2017, 66.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2018, 58.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2019, 88.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2020, 168.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2021, 128.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2022, 52.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Italy', 2023, 54.7);
-
--- INSERTS FOR Latvia
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2015, 112.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2016, 73.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2017, 66.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2018, 55.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2019, 71.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2020, 142.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2021, 127.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2022, 48.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Latvia', 2023, 54.5);
-
--- INSERTS FOR Lithuania
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2015, 113.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2016, 72.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2017, 68.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2018, 58.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2019, 70.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2020, 149.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2021, 119.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2022, 49.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Lithuania', 2023, 56.8);
-
--- INSERTS FOR Luxembourg
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2015, 113.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2016, 73.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2017, 67.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2018, 59.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2019, 70.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2020, 161.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2021, 119.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2022, 50.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Luxembourg', 2023, 58.2);
-
--- INSERTS FOR Malta
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2015, 113.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2016, 74.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2017, 81.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2018, 59.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2019, 77.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2021, 120.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2022, 51.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Malta', 2023, 98.3);
-
--- INSERTS FOR Netherlands
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2015, 114.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2016, 74.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2017, 83.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2018, 60.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2019, 82.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2021, 123.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2022, 52.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Netherlands', 2023, 96.6);
-
--- INSERTS FOR Poland
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2015, 112.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2016, 77.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2017, 83.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2018, 67.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2019, 86.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2021, 118.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2022, 58.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Poland', 2023, 115.8);
-
--- INSERTS FOR Portugal
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2015, 71.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2016, 78.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2017, 84.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2018, 87.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2019, 83.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2021, 55.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2022, 59.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Portugal', 2023, 119.9);
-
--- INSERTS FOR Romania
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2015, 70.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2016, 75.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2017, 86.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2018, 85.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2019, 82.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2021, 54.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2022, 61.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Romania', 2023, 118.0);
-
--- INSERTS FOR Slovakia
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2015, 67.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2016, 82.0);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2017, 86.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2018, 86.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2019, 83.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2021, 53.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2022, 65.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovakia', 2023, 125.5);
-
--- INSERTS FOR Slovenia
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2015, 68.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2016, 80.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2017, 86.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2018, 86.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2019, 85.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2021, 54.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2022, 61.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Slovenia', 2023, 114.7);
-
--- INSERTS FOR Spain
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2015, 91.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2016, 91.3);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2017, 61.4);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2018, 111.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2019, 86.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2020, 136.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2021, 173.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2022, 49.8);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Spain', 2023, 52.8);
-
--- INSERTS FOR Sweden
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2015, 69.2);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2016, 64.7);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2017, 91.6);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2018, 88.9);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2019, 126.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2020, NULL);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2021, 54.5);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2022, 54.1);
-INSERT INTO EUCPI (country_name, year, cpi_value)
-VALUES ('Sweden', 2023, 122.0);
+VALUES
+       -- INSERTS FOR Austria
+       ('Austria', 2015, 112.4),
+       ('Austria', 2016, 76.7),
+       ('Austria', 2017, 83.9),
+       ('Austria', 2018, 61.6),
+       ('Austria', 2019, 84.5),
+       ('Austria', 2020, NULL),
+       ('Austria', 2021, 121.8),
+       ('Austria', 2022, 55.9),
+       ('Austria', 2023, 97.3),
+       -- INSERTS FOR Belgium
+       ('Belgium', 2015, 94.8),
+       ('Belgium', 2016, 97.8),
+       ('Belgium', 2017, 132.0),
+       ('Belgium', 2018, 109.3),
+       ('Belgium', 2019, 61.1),
+       ('Belgium', 2020, 123.2),
+       ('Belgium', 2021, 170.0),
+       ('Belgium', 2022, 62.1),
+       ('Belgium', 2023, 47.3),
+       -- INSERTS FOR Bulgaria
+       ('Bulgaria', 2015, 95.3),
+       ('Bulgaria', 2016, 96.9),
+       ('Bulgaria', 2017, 137.4),
+       ('Bulgaria', 2018, 110.4),
+       ('Bulgaria', 2019, 85.6),
+       ('Bulgaria', 2020, 124.8),
+       ('Bulgaria', 2021, 168.2),
+       ('Bulgaria', 2022, 49.1),
+       ('Bulgaria', 2023, 44.9),
+       -- INSERTS FOR Croatia
+       ('Croatia', 2015, 110.5),
+       ('Croatia', 2016, 92.6),
+       ('Croatia', 2017, 65.9),
+       ('Croatia', 2018, 57.3),
+       ('Croatia', 2019, 87.1),
+       ('Croatia', 2020, 174.2),
+       ('Croatia', 2021, 119.8),
+       ('Croatia', 2022, 48.9),
+       ('Croatia', 2023, 53.7),
+       -- INSERTS FOR Cyprus
+       ('Cyprus', 2015, 112.0),
+       ('Cyprus', 2016, 93.0),
+       ('Cyprus', 2017, 67.4),
+       ('Cyprus', 2018, 57.6),
+       ('Cyprus', 2019, 89.5),
+       ('Cyprus', 2020, 161.8),
+       ('Cyprus', 2021, 142.6),
+       ('Cyprus', 2022, 54.0),
+       ('Cyprus', 2023, 56.5),
+       -- INSERTS FOR Czechia
+       ('Czechia', 2015, 94.7),
+       ('Czechia', 2016, 96.0),
+       ('Czechia', 2017, 138.7),
+       ('Czechia', 2018, 111.6),
+       ('Czechia', 2019, 85.4),
+       ('Czechia', 2020, 128.7),
+       ('Czechia', 2021, 164.7),
+       ('Czechia', 2022, 48.9),
+       ('Czechia', 2023, 42.2),
+       -- INSERTS FOR Denmark
+       ('Denmark', 2015, 96.4),
+       ('Denmark', 2016, 94.7),
+       ('Denmark', 2017, 137.1),
+       ('Denmark', 2018, 112.2),
+       ('Denmark', 2019, 86.1),
+       ('Denmark', 2020, 122.7),
+       ('Denmark', 2021, 158.9),
+       ('Denmark', 2022, 48.3),
+       ('Denmark', 2023, 41.4),
+       -- INSERTS FOR Estonia
+       ('Estonia', 2015, 97.8),
+       ('Estonia', 2016, 89.5),
+       ('Estonia', 2017, 62.6),
+       ('Estonia', 2018, 111.7),
+       ('Estonia', 2019, 86.9),
+       ('Estonia', 2020, 114.0),
+       ('Estonia', 2021, 171.5),
+       ('Estonia', 2022, 47.9),
+       ('Estonia', 2023, NULL),
+       -- INSERTS FOR European Union - 27 countries (from 2020)
+       ('European Union - 27 countries (from 2020)', 2015, 99.2),
+       ('European Union - 27 countries (from 2020)', 2016, 101.7),
+       ('European Union - 27 countries (from 2020)', 2017, 127.9),
+       ('European Union - 27 countries (from 2020)', 2018, 108.0),
+       ('European Union - 27 countries (from 2020)', 2019, 55.4),
+       ('European Union - 27 countries (from 2020)', 2020, 130.7),
+       ('European Union - 27 countries (from 2020)', 2021, 157.8),
+       ('European Union - 27 countries (from 2020)', 2022, 59.9),
+       ('European Union - 27 countries (from 2020)', 2023, 61.7),
+       -- INSERTS FOR Finland
+       ('Finland', 2015, 68.5),
+       ('Finland', 2016, 65.5),
+       ('Finland', 2017, 89.6),
+       ('Finland', 2018, 87.3),
+       ('Finland', 2019, 125.0),
+       ('Finland', 2020, NULL),
+       ('Finland', 2021, 53.3),
+       ('Finland', 2022, 51.2),
+       ('Finland', 2023, 124.8),
+       -- INSERTS FOR France
+       ('France', 2015, 111.9),
+       ('France', 2016, 90.7),
+       ('France', 2017, 62.4),
+       ('France', 2018, 57.6),
+       ('France', 2019, 87.3),
+       ('France', 2020, 158.8),
+       ('France', 2021, 122.6),
+       ('France', 2022, 51.2),
+       ('France', 2023, 52.9),
+       -- INSERTS FOR Germany
+       ('Germany', 2015, 96.0),
+       ('Germany', 2016, 92.2),
+       ('Germany', 2017, 134.0),
+       ('Germany', 2018, 113.2),
+       ('Germany', 2019, 86.0),
+       ('Germany', 2020, 114.3),
+       ('Germany', 2021, 165.0),
+       ('Germany', 2022, 48.1),
+       ('Germany', 2023, 43.4),
+       -- INSERTS FOR Greece
+       ('Greece', 2015, 93.6),
+       ('Greece', 2016, 90.9),
+       ('Greece', 2017, 60.3),
+       ('Greece', 2018, 108.8),
+       ('Greece', 2019, 87.1),
+       ('Greece', 2020, 125.3),
+       ('Greece', 2021, 172.9),
+       ('Greece', 2022, 49.9),
+       ('Greece', 2023, 53.2),
+       -- INSERTS FOR Hungary
+       ('Hungary', 2015, 113.4),
+       ('Hungary', 2016, 73.1),
+       ('Hungary', 2017, 73.9),
+       ('Hungary', 2018, 59.9),
+       ('Hungary', 2019, 70.7),
+       ('Hungary', 2020, 157.5),
+       ('Hungary', 2021, 120.9),
+       ('Hungary', 2022, 48.3),
+       ('Hungary', 2023, NULL),
+       -- INSERTS FOR Ireland
+       ('Ireland', 2015, 94.5),
+       ('Ireland', 2016, 89.8),
+       ('Ireland', 2017, 61.1),
+       ('Ireland', 2018, 108.5),
+       ('Ireland', 2019, 86.5),
+       ('Ireland', 2020, 117.1),
+       ('Ireland', 2021, 166.2),
+       ('Ireland', 2022, 48.8),
+       ('Ireland', 2023, NULL),
+       -- INSERTS FOR Italy
+       ('Italy', 2015, 111.1),
+       ('Italy', 2016, 93.4),
+       ('Italy', 2017, 66.0),
+       ('Italy', 2018, 58.1),
+       ('Italy', 2019, 88.4),
+       ('Italy', 2020, 168.5),
+       ('Italy', 2021, 128.1),
+       ('Italy', 2022, 52.0),
+       ('Italy', 2023, 54.7),
+       -- INSERTS FOR Latvia
+       ('Latvia', 2015, 112.4),
+       ('Latvia', 2016, 73.9),
+       ('Latvia', 2017, 66.3),
+       ('Latvia', 2018, 55.9),
+       ('Latvia', 2019, 71.9),
+       ('Latvia', 2020, 142.7),
+       ('Latvia', 2021, 127.7),
+       ('Latvia', 2022, 48.9),
+       ('Latvia', 2023, 54.5),
+       -- INSERTS FOR Lithuania
+       ('Lithuania', 2015, 113.0),
+       ('Lithuania', 2016, 72.5),
+       ('Lithuania', 2017, 68.2),
+       ('Lithuania', 2018, 58.8),
+       ('Lithuania', 2019, 70.6),
+       ('Lithuania', 2020, 149.8),
+       ('Lithuania', 2021, 119.6),
+       ('Lithuania', 2022, 49.6),
+       ('Lithuania', 2023, 56.8),
+       -- INSERTS FOR Luxembourg
+       ('Luxembourg', 2015, 113.9),
+       ('Luxembourg', 2016, 73.7),
+       ('Luxembourg', 2017, 67.3),
+       ('Luxembourg', 2018, 59.6),
+       ('Luxembourg', 2019, 70.5),
+       ('Luxembourg', 2020, 161.2),
+       ('Luxembourg', 2021, 119.6),
+       ('Luxembourg', 2022, 50.1),
+       ('Luxembourg', 2023, 58.2),
+       -- INSERTS FOR Malta
+       ('Malta', 2015, 113.0),
+       ('Malta', 2016, 74.4),
+       ('Malta', 2017, 81.4),
+       ('Malta', 2018, 59.1),
+       ('Malta', 2019, 77.9),
+       ('Malta', 2020, NULL),
+       ('Malta', 2021, 120.3),
+       ('Malta', 2022, 51.1),
+       ('Malta', 2023, 98.3),
+       -- INSERTS FOR Netherlands
+       ('Netherlands', 2015, 114.3),
+       ('Netherlands', 2016, 74.9),
+       ('Netherlands', 2017, 83.7),
+       ('Netherlands', 2018, 60.5),
+       ('Netherlands', 2019, 82.4),
+       ('Netherlands', 2020, NULL),
+       ('Netherlands', 2021, 123.5),
+       ('Netherlands', 2022, 52.4),
+       ('Netherlands', 2023, 96.6),
+       -- INSERTS FOR Poland
+       ('Poland', 2015, 112.2),
+       ('Poland', 2016, 77.9),
+       ('Poland', 2017, 83.9),
+       ('Poland', 2018, 67.4),
+       ('Poland', 2019, 86.0),
+       ('Poland', 2020, NULL),
+       ('Poland', 2021, 118.8),
+       ('Poland', 2022, 58.3),
+       ('Poland', 2023, 115.8),
+       -- INSERTS FOR Portugal
+       ('Portugal', 2015, 71.1),
+       ('Portugal', 2016, 78.5),
+       ('Portugal', 2017, 84.5),
+       ('Portugal', 2018, 87.0),
+       ('Portugal', 2019, 83.2),
+       ('Portugal', 2020, NULL),
+       ('Portugal', 2021, 55.0),
+       ('Portugal', 2022, 59.4),
+       ('Portugal', 2023, 119.9),
+       -- INSERTS FOR Romania
+       ('Romania', 2015, 70.0),
+       ('Romania', 2016, 75.2),
+       ('Romania', 2017, 86.3),
+       ('Romania', 2018, 85.3),
+       ('Romania', 2019, 82.4),
+       ('Romania', 2020, NULL),
+       ('Romania', 2021, 54.4),
+       ('Romania', 2022, 61.6),
+       ('Romania', 2023, 118.0),
+       -- INSERTS FOR Slovakia
+       ('Slovakia', 2015, 67.8),
+       ('Slovakia', 2016, 82.0),
+       ('Slovakia', 2017, 86.5),
+       ('Slovakia', 2018, 86.5),
+       ('Slovakia', 2019, 83.8),
+       ('Slovakia', 2020, NULL),
+       ('Slovakia', 2021, 53.8),
+       ('Slovakia', 2022, 65.2),
+       ('Slovakia', 2023, 125.5),
+       -- INSERTS FOR Slovenia
+       ('Slovenia', 2015, 68.4),
+       ('Slovenia', 2016, 80.6),
+       ('Slovenia', 2017, 86.5),
+       ('Slovenia', 2018, 86.3),
+       ('Slovenia', 2019, 85.2),
+       ('Slovenia', 2020, NULL),
+       ('Slovenia', 2021, 54.5),
+       ('Slovenia', 2022, 61.4),
+       ('Slovenia', 2023, 114.7),
+       -- INSERTS FOR Spain
+       ('Spain', 2015, 91.1),
+       ('Spain', 2016, 91.3),
+       ('Spain', 2017, 61.4),
+       ('Spain', 2018, 111.7),
+       ('Spain', 2019, 86.9),
+       ('Spain', 2020, 136.1),
+       ('Spain', 2021, 173.7),
+       ('Spain', 2022, 49.8),
+       ('Spain', 2023, 52.8),
+       -- INSERTS FOR Sweden
+       ('Sweden', 2015, 69.2),
+       ('Sweden', 2016, 64.7),
+       ('Sweden', 2017, 91.6),
+       ('Sweden', 2018, 88.9),
+       ('Sweden', 2019, 126.1),
+       ('Sweden', 2020, NULL),
+       ('Sweden', 2021, 54.5),
+       ('Sweden', 2022, 54.1),
+       ('Sweden', 2023, 122.0);
 
 -- ## EUEmployment (Work_Hours)
 INSERT INTO EUEmployment (country_name, country_code, year, sex, age_group,
@@ -17,841 +17,283 @@ CREATE TABLE eu_family_employment_data
 
 INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
                                       cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2015, 9.8, 112.4, 43410.79, NULL, 16435.35, 36.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2016, 10.0, 76.7, 43853.29, 0.0, 17313.75, 36.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2017, 10.0, 83.9, 43898.8, NULL, 17594.02, 36.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2018, 9.7, 61.6, 44141.21, 0.0, 17836.76, 36.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2019, 9.6, 84.5, 43439.37, 0.0, 18764.34, 36.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2020, 9.4, NULL, 47175.58, NULL, 20157.49, 36.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2021, 9.6, 121.8, 43331.56, 0.0, 20862.31, 35.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2022, 9.1, 55.9, 45654.13, NULL, 21089.56, 35.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2023, 8.5, 97.3, NULL, NULL, NULL, 35.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('AT', 'Austria', 2024, NULL, NULL, NULL, NULL, NULL, 35.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2015, 10.8, 94.8, 45368.78, 847.7, 8758.6, 36.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2016, 10.8, 97.8, 45385.98, 811.84, 9353.9, 36.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2017, 10.5, 132.0, 46196.79, 802.0, 9387.88, 37.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2018, 10.4, 109.3, 46413.69, 773.26, 9462.84, 37.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2019, 10.2, 61.1, 47915.24, 828.48, 10315.6, 37.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2020, 9.9, 123.2, 49351.87, 734.98, 12306.08, 37.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2021, 10.2, 170.0, 49120.18, 766.44, 12183.28, 36.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2022, 9.8, 62.1, 49247.91, 720.32, 12506.82, 36.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2023, 9.4, 47.3, NULL, NULL, NULL, 36.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BE', 'Belgium', 2024, NULL, NULL, NULL, NULL, NULL, 35.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2015, 9.4, 95.3, 3486.92, 84.48, 1985.76, 40.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2016, 9.4, 96.9, 3388.97, 85.28, 1997.78, 40.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2017, 9.4, 137.4, 3469.19, 81.18, 2164.94, 40.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2018, 9.3, 110.4, 3601.66, 78.6, 2152.62, 40.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2019, 9.3, 85.6, 3553.55, 75.4, 2244.3, 40.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2020, 9.0, 124.8, 3629.69, 69.32, 2331.34, 40.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2021, 9.0, 168.2, 3677.77, 69.86, 2569.06, 40.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2022, 8.8, 49.1, 3794.2, 63.14, 3275.62, 40.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2023, 8.9, 44.9, NULL, NULL, NULL, 40.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('BG', 'Bulgaria', 2024, NULL, NULL, NULL, NULL, NULL, 39.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2015, 10.6, 112.0, 2202.86, 48.1, 371.11, 39.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2016, 10.9, 93.0, 2274.51, 56.5, 365.26, 39.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2017, 10.6, 67.4, 2219.1, 57.5, 374.92, 39.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2018, 10.5, 57.6, 2266.91, 52.04, 407.58, 39.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2019, 10.7, 89.5, 2161.51, 44.94, 297.66, 39.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2020, 10.9, 161.8, 2611.8, 32.68, 232.94, 38.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2021, 11.2, 142.6, 2253.42, 57.04, 365.65, 38.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2022, 10.9, 54.0, 2242.63, 54.02, 250.56, 39.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2023, 10.7, 56.5, NULL, NULL, NULL, 39.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CY', 'Cyprus', 2024, NULL, NULL, NULL, NULL, NULL, 39.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2015, 10.5, 94.7, 16129.23, 60.26, 1206.08, 40.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2016, 10.7, 96.0, 16525.25, 60.1, 1297.88, 40.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2017, 10.8, 138.7, 17137.69, 50.6, 1385.04, 39.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2018, 10.7, 111.6, 18649.96, 40.04, 1758.6, 39.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2019, 10.5, 85.4, 18443.96, 29.78, 2635.12, 39.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2020, 10.3, 128.7, 20756.35, 22.78, 2188.1, 39.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2021, 10.6, 164.7, 20572.73, 20.54, 2368.1, 39.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2022, 9.5, 48.9, 20775.28, 17.78, 2476.7, 39.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2023, 8.4, 42.2, NULL, NULL, NULL, 39.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('CZ', 'Czechia', 2024, NULL, NULL, NULL, NULL, NULL, 38.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2015, 9.0, 96.0, 358482.68, 0.0, 209172.38, 34.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2016, 9.6, 92.2, 362626.72, 0.0, 231254.72, 34.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2017, 9.5, 134.0, 368630.73, 0.0, 246222.98, 34.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2018, 9.5, 113.2, 377567.79, 0.0, 256283.58, 34.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2019, 9.4, 86.0, 383426.93, 0.0, 273590.74, 34.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2020, 9.3, 114.3, 420723.18, 0.0, 293943.92, 34.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2021, 9.6, 165.0, 421671.16, 0.0, 304395.18, 34.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2022, 8.9, 48.1, 407370.98, 0.0, 309751.58, 34.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2023, 8.3, 43.4, NULL, NULL, NULL, 34.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DE', 'Germany', 2024, NULL, NULL, NULL, NULL, NULL, 33.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2015, 10.2, 96.4, 24434.52, 0.0, 39786.68, 33.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2016, 10.8, 94.7, 25233.92, 0.0, 39733.34, 33.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2017, 10.6, 137.1, 25263.9, 0.0, 40312.74, 33.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2018, 10.6, 112.2, 25422.26, 0.0, 41000.58, 33.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2019, 10.5, 86.1, 25433.6, 0.0, 41073.81, 33.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2020, 10.4, 122.7, 26040.64, 0.0, 41841.26, 33.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2021, 10.8, 158.9, 25782.06, 0.0, 42734.15, 34.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2022, 9.9, 48.3, 24558.42, NULL, 42344.89, 33.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2023, 9.7, 41.4, NULL, NULL, NULL, 33.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('DK', 'Denmark', 2024, NULL, NULL, NULL, NULL, NULL, 33.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2015, 10.6, 97.8, 3509.16, 38.44, 83.74, 38.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2016, 10.7, 89.5, 3833.54, 37.84, 74.2, 38.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2017, 10.5, 62.6, 3913.92, 34.98, 82.1, 38.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2018, 10.9, 111.7, 4650.5, 35.94, 89.58, 38.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2019, 10.6, 86.9, 4925.62, 33.94, 80.82, 38.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2020, 9.9, 114.0, 5026.1, 34.06, 89.62, 37.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2021, 10.0, 171.5, 4962.6, 31.74, 91.82, 37.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2022, 8.6, 47.9, 4561.28, 24.24, 91.66, 37.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2023, 8.0, NULL, NULL, NULL, NULL, 37.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EE', 'Estonia', 2024, NULL, NULL, NULL, NULL, NULL, 37.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2015, 8.5, 93.6, 10804.95, 32.54, 1126.08, 41.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2016, 8.6, 90.9, 10753.21, 34.7, 876.66, 41.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2017, 8.2, 60.3, 15433.33, 5.94, 872.92, 41.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2018, 8.1, 108.8, 18163.18, 5.66, 1046.52, 41.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2019, 7.8, 87.1, 14731.02, 3.68, 1259.41, 41.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2020, 7.9, 125.3, 13919.0, 716.31, 1086.02, 41.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2021, 8.1, 172.9, 15242.75, 986.96, 1320.7, 41.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2022, 7.3, 49.9, 16039.8, 892.72, 1096.63, 40.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2023, 6.8, 53.2, NULL, NULL, NULL, 40.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EL', 'Greece', 2024, NULL, NULL, NULL, NULL, NULL, 40.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2015, 9.0, 91.1, 34849.46, 317.57, 48158.76, 37.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2016, 8.8, 91.3, 35767.11, 311.3, 47927.4, 37.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2017, 8.4, 61.4, 37215.24, 301.71, 50422.56, 37.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2018, 7.9, 111.7, 38434.07, 289.57, 52727.15, 37.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2019, 7.6, 86.9, 41408.85, 279.86, 55862.17, 37.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2020, 7.2, 136.1, 44354.88, 178.75, 59887.71, 37.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2021, 7.1, 173.7, 46263.86, 220.73, 62097.15, 37.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2022, 6.9, 49.8, 47444.93, 192.94, 64999.24, 37.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2023, 6.6, 52.8, NULL, NULL, NULL, 37.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('ES', 'Spain', 2024, NULL, NULL, NULL, NULL, NULL, 37.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2015, 10.1074, 97.0111, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2016, 10.1815, 83.4222, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2017, 9.9963, 85.9222, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2018, 9.8296, 82.6704, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2019, 9.6259, 85.337, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2020, 9.4259, 140.0412, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2021, 9.5444, 123.0333, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2022, 8.9333, 52.8333, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2023, 8.4889, 76.8917, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('EU27', 'EU Average', 2024, NULL, NULL, NULL, NULL, NULL, NULL);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2015, 10.1, 68.5, 20273.46, 68.34, 23102.38, 36.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2016, 9.6, 65.5, 19890.95, 61.54, 23618.16, 36.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2017, 9.1, 89.6, 19023.44, 58.94, 23943.32, 36.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2018, 8.6, 87.3, 18506.66, 60.7, 25496.3, 36.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2019, 8.3, 125.0, 18017.12, 61.98, 27123.82, 36.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2020, 8.4, NULL, 18575.04, 66.4, 27473.82, 36.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2021, 9.0, 53.3, 18430.58, 62.88, 28496.26, 35.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2022, 8.1, 51.2, 18375.96, 57.54, 29261.42, 35.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2023, 7.8, 124.8, NULL, NULL, NULL, 35.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FI', 'Finland', 2024, NULL, NULL, NULL, NULL, NULL, 35.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2015, 12.0, 111.9, 199893.33, 2417.33, 124643.46, 37.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2016, 11.8, 90.7, 197374.8, 3662.28, 126947.56, 37.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2017, 11.5, 62.4, 196577.68, 3537.85, 129644.21, 37.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2018, 11.3, 57.6, 195541.63, 3411.22, 130002.61, 37.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2019, 11.2, 87.3, 193280.0, 3282.73, 132535.82, 37.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2020, 10.9, 158.8, 203772.87, 3145.73, 125940.71, 37.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2021, 10.9, 122.6, 189340.0, 4199.78, 131175.54, 36.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2022, 10.7, 51.2, 188290.46, 3012.24, 141459.15, 37.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2023, 9.9, 52.9, NULL, NULL, NULL, 36.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('FR', 'France', 2024, NULL, NULL, NULL, NULL, NULL, 36.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2015, 9.0, 110.5, 3566.4, 205.6, 2167.68, 39.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2016, 9.1, 92.6, 3695.45, 236.6, 2377.72, 39.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2017, 9.0, 65.9, 3922.69, 232.2, 2336.88, 39.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2018, 9.3, 57.3, 4235.57, 255.1, 2574.38, 39.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2019, 9.1, 87.1, 4519.7, 300.18, 2634.49, 39.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2020, 9.2, 174.2, 4713.47, 308.8, 2714.23, 39.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2021, 9.4, 119.8, 4840.18, 321.12, 2888.52, 39.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2022, 8.8, 48.9, 4883.78, 296.64, 3014.41, 39.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2023, 8.3, 53.7, NULL, NULL, NULL, 39.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HR', 'Croatia', 2024, NULL, NULL, NULL, NULL, NULL, 39.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2015, 9.4, 113.4, 11352.46, 114.94, 3977.22, 39.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2016, 9.8, 73.1, 11515.83, 119.54, 3774.29, 39.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2017, 9.7, 73.9, 11738.38, 115.28, 4168.64, 39.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2018, 9.6, 59.9, 11823.66, 113.68, 4584.32, 39.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2019, 9.6, 70.7, 11993.3, 110.3, 4384.58, 39.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2020, 9.7, 157.5, 12606.59, 118.36, 4325.93, 39.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2021, 9.8, 120.9, 12234.46, 107.24, 4723.04, 39.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2022, 9.3, 48.3, 11935.07, 89.76, 5034.87, 39.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2023, 9.1, NULL, NULL, NULL, NULL, 39.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('HU', 'Hungary', 2024, NULL, NULL, NULL, NULL, NULL, 39.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2015, 13.9, 94.5, 25400.11, 0.62, 4028.07, 35.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2016, 13.4, 89.8, 25391.16, 0.6, 4096.79, 35.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2017, 12.8, 61.1, 25401.75, 0.6, 4344.45, 36.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2018, 12.5, 108.5, 25418.57, 0.6, 4634.77, 36.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2019, 11.9, 86.5, 25143.0, 0.6, 5023.98, 36.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2020, 11.1, 117.1, 25075.67, 0.6, 5219.23, 36.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2021, 11.8, 166.2, 24836.65, 0.58, 5385.34, 35.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2022, 10.4, 48.8, 26148.8, 0.52, 6017.98, 35.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2023, 10.3, NULL, NULL, NULL, NULL, 35.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IE', 'Ireland', 2024, NULL, NULL, NULL, NULL, NULL, 35.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2015, 8.1, 111.1, 87945.27, 0.0, 21291.6, 36.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2016, 7.9, 93.4, 93717.14, 0.0, 21210.12, 36.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2017, 7.6, 66.0, 97964.38, 0.0, 19224.72, 36.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2018, 7.3, 58.1, 96004.78, 0.0, 20271.44, 36.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2019, 7.0, 88.4, 98792.3, 0.0, 20014.9, 36.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2020, 6.8, 168.5, 101316.22, 0.0, 20510.24, 36.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2021, 6.8, 128.1, 110950.66, 0.0, 20933.96, 36.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2022, 6.7, 52.0, 149623.62, 0.0, 20258.02, 36.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2023, 6.4, 54.7, NULL, NULL, NULL, 36.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('IT', 'Italy', 2024, NULL, NULL, NULL, NULL, NULL, 36.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2015, 10.3, 113.0, 2130.46, 98.36, 842.4, 38.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2016, 10.3, 72.5, 2257.83, 99.44, 880.29, 38.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2017, 9.8, 68.2, 2519.15, 89.26, 981.62, 38.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2018, 9.5, 58.8, 3801.29, 83.02, 1098.76, 38.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2019, 8.9, 70.6, 4745.47, 76.24, 862.29, 38.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2020, 8.4, 149.8, 5844.33, 69.36, 1143.66, 38.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2021, 8.3, 119.6, 5734.06, 66.5, 1342.61, 38.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2022, 7.8, 49.6, 5713.76, 61.38, 1431.27, 38.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2023, 7.2, 56.8, NULL, NULL, NULL, 38.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LT', 'Lithuania', 2024, NULL, NULL, NULL, NULL, NULL, 38.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2015, 10.7, 113.9, 16425.72, 170.2, 5058.78, 37.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2016, 10.4, 73.7, 15857.63, 142.98, 5303.68, 37.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2017, 10.4, 67.3, 15990.55, 143.34, 5789.44, 37.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2018, 10.3, 59.6, 16435.71, 143.58, 6405.54, 37.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2019, 10.0, 70.5, 16466.28, 142.92, 7085.94, 37.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2020, 10.2, 161.2, 19106.73, 143.84, 7809.06, 37.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2021, 10.5, 119.6, 16961.1, 143.68, 8231.42, 37.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2022, 9.9, 50.1, 17022.08, 137.66, 8602.04, 37.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2023, 9.5, 58.2, NULL, NULL, NULL, 37.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LU', 'Luxembourg', 2024, NULL, NULL, NULL, NULL, NULL, 37.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2015, 11.1, 112.4, 2412.1, 72.42, 604.83, 39.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2016, 11.2, 73.9, 2658.42, 71.64, 551.34, 38.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2017, 10.7, 66.3, 2740.53, 65.98, 525.01, 38.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2018, 10.0, 55.9, 3006.05, 60.12, 518.32, 38.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2019, 9.8, 71.9, 3017.18, 56.14, 509.9, 38.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2020, 9.2, 142.7, 3102.46, 52.28, 528.75, 38.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2021, 9.2, 127.7, 4337.54, 49.84, 510.56, 38.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2022, 8.5, 48.9, 3916.92, 41.72, 530.06, 38.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2023, 7.7, 54.5, NULL, NULL, NULL, 38.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('LV', 'Latvia', 2024, NULL, NULL, NULL, NULL, NULL, 38.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2015, 9.7, 113.0, 1180.22, 0.0, 362.28, 37.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2016, 9.8, 74.4, 1026.89, 0.0, 368.37, 38.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2017, 9.2, 81.4, 965.41, 0.0, 461.48, 38.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2018, 9.2, 59.1, 923.0, 0.0, 540.57, 38.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2019, 8.6, 77.9, 876.21, 0.0, 652.08, 39.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2020, 8.6, NULL, 901.9, 10.24, 657.11, 39.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2021, 8.5, 120.3, 932.74, 12.44, 842.61, 38.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2022, 8.1, 51.1, 957.14, 15.3, 856.55, 38.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2023, 8.1, 98.3, NULL, NULL, NULL, 38.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('MT', 'Malta', 2024, NULL, NULL, NULL, NULL, NULL, 38.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2015, 10.1, 114.3, 31458.64, 0.0, 15108.46, 29.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2016, 10.1, 74.9, 32360.63, 0.0, 17319.11, 29.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2017, 9.9, 83.7, 31995.67, 0.0, 19075.97, 30.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2018, 9.8, 60.5, 31733.44, 0.0, 20784.53, 30.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2019, 9.8, 82.4, 34154.3, 0.0, 23801.52, 30.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2020, 9.7, NULL, 37550.41, 0.0, 22964.98, 30.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2021, 10.2, 123.5, 36481.86, 0.0, 25733.83, 30.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2022, 9.5, 52.4, 36118.86, NULL, 27339.1, 31.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2023, 9.2, 96.6, NULL, NULL, NULL, 31.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('NL', 'Netherlands', 2024, NULL, NULL, NULL, NULL, NULL, 30.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2015, 9.7, 112.2, 20682.77, 585.31, 18753.0, 40.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2016, 10.1, 77.9, 47873.72, 632.8, 19884.86, 40.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2017, 10.6, 83.9, 56764.98, 621.21, 17314.58, 40.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2018, 10.2, 67.4, 55254.26, 573.64, 19379.06, 40.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2019, 9.9, 86.0, 72877.01, 527.78, 23146.38, 40.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2020, 9.5, NULL, 91982.69, 412.47, 25846.22, 39.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2021, 9.0, 118.8, 85750.48, 333.49, 27891.6, 40.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2022, 8.3, 58.3, 86226.14, 257.84, 29370.08, 40.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2023, 7.4, 115.8, NULL, NULL, NULL, 39.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PL', 'Poland', 2024, NULL, NULL, NULL, NULL, NULL, 39.85);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2015, 8.2, 71.1, 8432.1, 0.0, 4700.72, 39.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2016, 8.4, 78.5, 9043.62, 0.0, 4661.72, 39.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2017, 8.3, 84.5, 9262.71, 0.0, 4742.68, 39.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2018, 8.4, 87.0, 10028.84, 0.0, 4756.4, 39.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2019, 8.4, 83.2, 10850.82, 0.0, 4812.24, 39.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2020, 8.1, NULL, 11800.13, 0.0, 4933.46, 39.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2021, 7.6, 55.0, 11444.74, 0.0, 5340.19, 39.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2022, 8.0, 59.4, 11794.53, 0.0, 5629.39, 39.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2023, 8.1, 119.9, NULL, NULL, NULL, 39.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('PT', 'Portugal', 2024, NULL, NULL, NULL, NULL, NULL, 39.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2015, 10.2, 70.0, 9127.18, 0.0, 3071.64, 39.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2016, 10.4, 75.2, 10802.1, 0.0, 3316.59, 39.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2017, 10.8, 86.3, 12874.26, 0.0, 3815.37, 39.65);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2018, 10.4, 85.3, 13492.33, 0.0, 4494.5, 39.5);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2019, 10.3, 82.4, 16138.46, 0.0, 5241.52, 39.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2020, 10.3, NULL, 18623.7, 0.0, 5278.18, 39.7);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2021, 10.1, 54.4, 21223.23, 0.0, 4801.58, 40.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2022, 9.4, 61.6, 23336.62, NULL, 4598.96, 40.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2023, 8.4, 118.0, NULL, NULL, NULL, 40.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('RO', 'Romania', 2024, NULL, NULL, NULL, NULL, NULL, 39.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2015, 11.7, 69.2, 37927.4, 9.94, 45201.06, 36.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2016, 11.8, 64.7, 38818.44, 7.22, 46924.26, 36.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2017, 11.5, 91.6, 39178.38, 10.24, 47677.5, 36.3);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2018, 11.4, 88.9, 41172.6, 8.62, 48184.44, 36.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2019, 11.1, 126.1, 41423.88, 8.38, 48287.12, 36.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2020, 10.9, NULL, 40617.52, 5.32, 48247.68, 36.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2021, 11.0, 54.5, 40930.42, 5.3, 49299.86, 37.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2022, 10.0, 54.1, 38866.12, 4.46, 48979.04, 37.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2023, 9.5, 122.0, NULL, NULL, NULL, 37.6);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SE', 'Sweden', 2024, NULL, NULL, NULL, NULL, NULL, 37.55);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2015, 10.0, 68.4, 3857.74, 0.0, 1564.16, 39.15);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2016, 9.9, 80.6, 3890.29, 0.0, 1561.4, 39.25);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2017, 9.8, 86.5, 3924.22, 23.42, 2203.38, 38.95);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2018, 9.4, 86.3, 4030.75, 23.32, 2282.78, 39.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2019, 9.3, 85.2, 4237.33, 23.36, 2352.96, 39.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2020, 8.9, NULL, 4446.21, 58.94, 2299.14, 39.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2021, 9.0, 54.5, 4716.64, 77.06, 2319.22, 39.35);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2022, 8.3, 61.4, 4582.22, 65.98, 2346.16, 39.2);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2023, 8.0, 114.7, NULL, NULL, NULL, 39.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SI', 'Slovenia', 2024, NULL, NULL, NULL, NULL, NULL, 39.1);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2015, 10.3, 67.8, 7496.62, 271.54, 879.92, 40.05);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2016, 10.6, 82.0, 7626.79, 287.68, 919.14, 39.9);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2017, 10.7, 86.5, 7900.34, 285.66, 942.76, 39.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2018, 10.6, 86.5, 7847.43, 282.14, 1000.04, 39.8);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2019, 10.5, 83.8, 8545.6, 291.08, 1013.18, 40.0);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2020, 10.4, NULL, 10159.19, 266.8, 803.26, 39.75);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2021, 10.4, 53.8, 10955.95, 259.24, 911.92, 39.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2022, 9.7, 65.2, 11164.11, 250.92, 842.32, 39.45);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2023, 9.0, 125.5, NULL, NULL, NULL, 39.4);
-INSERT INTO eu_family_employment_data(country_code, Country, year, birth_rate_per_thousand, price_index,
-                                      cash_per_capita, maternity_per_capita, services_per_capita, weekly_hours)
-VALUES ('SK', 'Slovakia', 2024, NULL, NULL, NULL, NULL, NULL, 39.3);
+VALUES ('AT', 'Austria', 2015, 9.8, 112.4, 43410.79, NULL, 16435.35, 36.3),
+       ('AT', 'Austria', 2016, 10.0, 76.7, 43853.29, 0.0, 17313.75, 36.25),
+       ('AT', 'Austria', 2017, 10.0, 83.9, 43898.8, NULL, 17594.02, 36.1),
+       ('AT', 'Austria', 2018, 9.7, 61.6, 44141.21, 0.0, 17836.76, 36.2),
+       ('AT', 'Austria', 2019, 9.6, 84.5, 43439.37, 0.0, 18764.34, 36.2),
+       ('AT', 'Austria', 2020, 9.4, NULL, 47175.58, NULL, 20157.49, 36.15),
+       ('AT', 'Austria', 2021, 9.6, 121.8, 43331.56, 0.0, 20862.31, 35.6),
+       ('AT', 'Austria', 2022, 9.1, 55.9, 45654.13, NULL, 21089.56, 35.4),
+       ('AT', 'Austria', 2023, 8.5, 97.3, NULL, NULL, NULL, 35.35),
+       ('AT', 'Austria', 2024, NULL, NULL, NULL, NULL, NULL, 35.15),
+       ('BE', 'Belgium', 2015, 10.8, 94.8, 45368.78, 847.7, 8758.6, 36.85),
+       ('BE', 'Belgium', 2016, 10.8, 97.8, 45385.98, 811.84, 9353.9, 36.8),
+       ('BE', 'Belgium', 2017, 10.5, 132.0, 46196.79, 802.0, 9387.88, 37.25),
+       ('BE', 'Belgium', 2018, 10.4, 109.3, 46413.69, 773.26, 9462.84, 37.0),
+       ('BE', 'Belgium', 2019, 10.2, 61.1, 47915.24, 828.48, 10315.6, 37.0),
+       ('BE', 'Belgium', 2020, 9.9, 123.2, 49351.87, 734.98, 12306.08, 37.0),
+       ('BE', 'Belgium', 2021, 10.2, 170.0, 49120.18, 766.44, 12183.28, 36.4),
+       ('BE', 'Belgium', 2022, 9.8, 62.1, 49247.91, 720.32, 12506.82, 36.35),
+       ('BE', 'Belgium', 2023, 9.4, 47.3, NULL, NULL, NULL, 36.05),
+       ('BE', 'Belgium', 2024, NULL, NULL, NULL, NULL, NULL, 35.9),
+       ('BG', 'Bulgaria', 2015, 9.4, 95.3, 3486.92, 84.48, 1985.76, 40.8),
+       ('BG', 'Bulgaria', 2016, 9.4, 96.9, 3388.97, 85.28, 1997.78, 40.8),
+       ('BG', 'Bulgaria', 2017, 9.4, 137.4, 3469.19, 81.18, 2164.94, 40.75),
+       ('BG', 'Bulgaria', 2018, 9.3, 110.4, 3601.66, 78.6, 2152.62, 40.65),
+       ('BG', 'Bulgaria', 2019, 9.3, 85.6, 3553.55, 75.4, 2244.3, 40.45),
+       ('BG', 'Bulgaria', 2020, 9.0, 124.8, 3629.69, 69.32, 2331.34, 40.35),
+       ('BG', 'Bulgaria', 2021, 9.0, 168.2, 3677.77, 69.86, 2569.06, 40.35),
+       ('BG', 'Bulgaria', 2022, 8.8, 49.1, 3794.2, 63.14, 3275.62, 40.15),
+       ('BG', 'Bulgaria', 2023, 8.9, 44.9, NULL, NULL, NULL, 40.0),
+       ('BG', 'Bulgaria', 2024, NULL, NULL, NULL, NULL, NULL, 39.9),
+       ('CY', 'Cyprus', 2015, 10.6, 112.0, 2202.86, 48.1, 371.11, 39.5),
+       ('CY', 'Cyprus', 2016, 10.9, 93.0, 2274.51, 56.5, 365.26, 39.15),
+       ('CY', 'Cyprus', 2017, 10.6, 67.4, 2219.1, 57.5, 374.92, 39.2),
+       ('CY', 'Cyprus', 2018, 10.5, 57.6, 2266.91, 52.04, 407.58, 39.25),
+       ('CY', 'Cyprus', 2019, 10.7, 89.5, 2161.51, 44.94, 297.66, 39.25),
+       ('CY', 'Cyprus', 2020, 10.9, 161.8, 2611.8, 32.68, 232.94, 38.95),
+       ('CY', 'Cyprus', 2021, 11.2, 142.6, 2253.42, 57.04, 365.65, 38.65),
+       ('CY', 'Cyprus', 2022, 10.9, 54.0, 2242.63, 54.02, 250.56, 39.05),
+       ('CY', 'Cyprus', 2023, 10.7, 56.5, NULL, NULL, NULL, 39.55),
+       ('CY', 'Cyprus', 2024, NULL, NULL, NULL, NULL, NULL, 39.55),
+       ('CZ', 'Czechia', 2015, 10.5, 94.7, 16129.23, 60.26, 1206.08, 40.25),
+       ('CZ', 'Czechia', 2016, 10.7, 96.0, 16525.25, 60.1, 1297.88, 40.15),
+       ('CZ', 'Czechia', 2017, 10.8, 138.7, 17137.69, 50.6, 1385.04, 39.95),
+       ('CZ', 'Czechia', 2018, 10.7, 111.6, 18649.96, 40.04, 1758.6, 39.95),
+       ('CZ', 'Czechia', 2019, 10.5, 85.4, 18443.96, 29.78, 2635.12, 39.85),
+       ('CZ', 'Czechia', 2020, 10.3, 128.7, 20756.35, 22.78, 2188.1, 39.75),
+       ('CZ', 'Czechia', 2021, 10.6, 164.7, 20572.73, 20.54, 2368.1, 39.25),
+       ('CZ', 'Czechia', 2022, 9.5, 48.9, 20775.28, 17.78, 2476.7, 39.35),
+       ('CZ', 'Czechia', 2023, 8.4, 42.2, NULL, NULL, NULL, 39.1),
+       ('CZ', 'Czechia', 2024, NULL, NULL, NULL, NULL, NULL, 38.9),
+       ('DE', 'Germany', 2015, 9.0, 96.0, 358482.68, 0.0, 209172.38, 34.85),
+       ('DE', 'Germany', 2016, 9.6, 92.2, 362626.72, 0.0, 231254.72, 34.85),
+       ('DE', 'Germany', 2017, 9.5, 134.0, 368630.73, 0.0, 246222.98, 34.7),
+       ('DE', 'Germany', 2018, 9.5, 113.2, 377567.79, 0.0, 256283.58, 34.6),
+       ('DE', 'Germany', 2019, 9.4, 86.0, 383426.93, 0.0, 273590.74, 34.55),
+       ('DE', 'Germany', 2020, 9.3, 114.3, 420723.18, 0.0, 293943.92, 34.4),
+       ('DE', 'Germany', 2021, 9.6, 165.0, 421671.16, 0.0, 304395.18, 34.55),
+       ('DE', 'Germany', 2022, 8.9, 48.1, 407370.98, 0.0, 309751.58, 34.45),
+       ('DE', 'Germany', 2023, 8.3, 43.4, NULL, NULL, NULL, 34.15),
+       ('DE', 'Germany', 2024, NULL, NULL, NULL, NULL, NULL, 33.95),
+       ('DK', 'Denmark', 2015, 10.2, 96.4, 24434.52, 0.0, 39786.68, 33.55),
+       ('DK', 'Denmark', 2016, 10.8, 94.7, 25233.92, 0.0, 39733.34, 33.25),
+       ('DK', 'Denmark', 2017, 10.6, 137.1, 25263.9, 0.0, 40312.74, 33.3),
+       ('DK', 'Denmark', 2018, 10.6, 112.2, 25422.26, 0.0, 41000.58, 33.35),
+       ('DK', 'Denmark', 2019, 10.5, 86.1, 25433.6, 0.0, 41073.81, 33.15),
+       ('DK', 'Denmark', 2020, 10.4, 122.7, 26040.64, 0.0, 41841.26, 33.3),
+       ('DK', 'Denmark', 2021, 10.8, 158.9, 25782.06, 0.0, 42734.15, 34.25),
+       ('DK', 'Denmark', 2022, 9.9, 48.3, 24558.42, NULL, 42344.89, 33.95),
+       ('DK', 'Denmark', 2023, 9.7, 41.4, NULL, NULL, NULL, 33.6),
+       ('DK', 'Denmark', 2024, NULL, NULL, NULL, NULL, NULL, 33.0),
+       ('EE', 'Estonia', 2015, 10.6, 97.8, 3509.16, 38.44, 83.74, 38.6),
+       ('EE', 'Estonia', 2016, 10.7, 89.5, 3833.54, 37.84, 74.2, 38.35),
+       ('EE', 'Estonia', 2017, 10.5, 62.6, 3913.92, 34.98, 82.1, 38.45),
+       ('EE', 'Estonia', 2018, 10.9, 111.7, 4650.5, 35.94, 89.58, 38.25),
+       ('EE', 'Estonia', 2019, 10.6, 86.9, 4925.62, 33.94, 80.82, 38.05),
+       ('EE', 'Estonia', 2020, 9.9, 114.0, 5026.1, 34.06, 89.62, 37.9),
+       ('EE', 'Estonia', 2021, 10.0, 171.5, 4962.6, 31.74, 91.82, 37.65),
+       ('EE', 'Estonia', 2022, 8.6, 47.9, 4561.28, 24.24, 91.66, 37.4),
+       ('EE', 'Estonia', 2023, 8.0, NULL, NULL, NULL, NULL, 37.3),
+       ('EE', 'Estonia', 2024, NULL, NULL, NULL, NULL, NULL, 37.35),
+       ('EL', 'Greece', 2015, 8.5, 93.6, 10804.95, 32.54, 1126.08, 41.75),
+       ('EL', 'Greece', 2016, 8.6, 90.9, 10753.21, 34.7, 876.66, 41.8),
+       ('EL', 'Greece', 2017, 8.2, 60.3, 15433.33, 5.94, 872.92, 41.55),
+       ('EL', 'Greece', 2018, 8.1, 108.8, 18163.18, 5.66, 1046.52, 41.55),
+       ('EL', 'Greece', 2019, 7.8, 87.1, 14731.02, 3.68, 1259.41, 41.35),
+       ('EL', 'Greece', 2020, 7.9, 125.3, 13919.0, 716.31, 1086.02, 41.4),
+       ('EL', 'Greece', 2021, 8.1, 172.9, 15242.75, 986.96, 1320.7, 41.0),
+       ('EL', 'Greece', 2022, 7.3, 49.9, 16039.8, 892.72, 1096.63, 40.6),
+       ('EL', 'Greece', 2023, 6.8, 53.2, NULL, NULL, NULL, 40.65),
+       ('EL', 'Greece', 2024, NULL, NULL, NULL, NULL, NULL, 40.75),
+       ('ES', 'Spain', 2015, 9.0, 91.1, 34849.46, 317.57, 48158.76, 37.55),
+       ('ES', 'Spain', 2016, 8.8, 91.3, 35767.11, 311.3, 47927.4, 37.5),
+       ('ES', 'Spain', 2017, 8.4, 61.4, 37215.24, 301.71, 50422.56, 37.45),
+       ('ES', 'Spain', 2018, 7.9, 111.7, 38434.07, 289.57, 52727.15, 37.45),
+       ('ES', 'Spain', 2019, 7.6, 86.9, 41408.85, 279.86, 55862.17, 37.25),
+       ('ES', 'Spain', 2020, 7.2, 136.1, 44354.88, 178.75, 59887.71, 37.3),
+       ('ES', 'Spain', 2021, 7.1, 173.7, 46263.86, 220.73, 62097.15, 37.2),
+       ('ES', 'Spain', 2022, 6.9, 49.8, 47444.93, 192.94, 64999.24, 37.45),
+       ('ES', 'Spain', 2023, 6.6, 52.8, NULL, NULL, NULL, 37.45),
+       ('ES', 'Spain', 2024, NULL, NULL, NULL, NULL, NULL, 37.35),
+       ('EU27', 'EU Average', 2015, 10.1074, 97.0111, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2016, 10.1815, 83.4222, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2017, 9.9963, 85.9222, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2018, 9.8296, 82.6704, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2019, 9.6259, 85.337, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2020, 9.4259, 140.0412, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2021, 9.5444, 123.0333, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2022, 8.9333, 52.8333, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2023, 8.4889, 76.8917, NULL, NULL, NULL, NULL),
+       ('EU27', 'EU Average', 2024, NULL, NULL, NULL, NULL, NULL, NULL),
+       ('FI', 'Finland', 2015, 10.1, 68.5, 20273.46, 68.34, 23102.38, 36.8),
+       ('FI', 'Finland', 2016, 9.6, 65.5, 19890.95, 61.54, 23618.16, 36.6),
+       ('FI', 'Finland', 2017, 9.1, 89.6, 19023.44, 58.94, 23943.32, 36.65),
+       ('FI', 'Finland', 2018, 8.6, 87.3, 18506.66, 60.7, 25496.3, 36.65),
+       ('FI', 'Finland', 2019, 8.3, 125.0, 18017.12, 61.98, 27123.82, 36.5),
+       ('FI', 'Finland', 2020, 8.4, NULL, 18575.04, 66.4, 27473.82, 36.45),
+       ('FI', 'Finland', 2021, 9.0, 53.3, 18430.58, 62.88, 28496.26, 35.3),
+       ('FI', 'Finland', 2022, 8.1, 51.2, 18375.96, 57.54, 29261.42, 35.1),
+       ('FI', 'Finland', 2023, 7.8, 124.8, NULL, NULL, NULL, 35.1),
+       ('FI', 'Finland', 2024, NULL, NULL, NULL, NULL, NULL, 35.25),
+       ('FR', 'France', 2015, 12.0, 111.9, 199893.33, 2417.33, 124643.46, 37.15),
+       ('FR', 'France', 2016, 11.8, 90.7, 197374.8, 3662.28, 126947.56, 37.2),
+       ('FR', 'France', 2017, 11.5, 62.4, 196577.68, 3537.85, 129644.21, 37.1),
+       ('FR', 'France', 2018, 11.3, 57.6, 195541.63, 3411.22, 130002.61, 37.15),
+       ('FR', 'France', 2019, 11.2, 87.3, 193280.0, 3282.73, 132535.82, 37.35),
+       ('FR', 'France', 2020, 10.9, 158.8, 203772.87, 3145.73, 125940.71, 37.3),
+       ('FR', 'France', 2021, 10.9, 122.6, 189340.0, 4199.78, 131175.54, 36.8),
+       ('FR', 'France', 2022, 10.7, 51.2, 188290.46, 3012.24, 141459.15, 37.0),
+       ('FR', 'France', 2023, 9.9, 52.9, NULL, NULL, NULL, 36.95),
+       ('FR', 'France', 2024, NULL, NULL, NULL, NULL, NULL, 36.85),
+       ('HR', 'Croatia', 2015, 9.0, 110.5, 3566.4, 205.6, 2167.68, 39.5),
+       ('HR', 'Croatia', 2016, 9.1, 92.6, 3695.45, 236.6, 2377.72, 39.35),
+       ('HR', 'Croatia', 2017, 9.0, 65.9, 3922.69, 232.2, 2336.88, 39.55),
+       ('HR', 'Croatia', 2018, 9.3, 57.3, 4235.57, 255.1, 2574.38, 39.6),
+       ('HR', 'Croatia', 2019, 9.1, 87.1, 4519.7, 300.18, 2634.49, 39.7),
+       ('HR', 'Croatia', 2020, 9.2, 174.2, 4713.47, 308.8, 2714.23, 39.65),
+       ('HR', 'Croatia', 2021, 9.4, 119.8, 4840.18, 321.12, 2888.52, 39.55),
+       ('HR', 'Croatia', 2022, 8.8, 48.9, 4883.78, 296.64, 3014.41, 39.45),
+       ('HR', 'Croatia', 2023, 8.3, 53.7, NULL, NULL, NULL, 39.55),
+       ('HR', 'Croatia', 2024, NULL, NULL, NULL, NULL, NULL, 39.45),
+       ('HU', 'Hungary', 2015, 9.4, 113.4, 11352.46, 114.94, 3977.22, 39.75),
+       ('HU', 'Hungary', 2016, 9.8, 73.1, 11515.83, 119.54, 3774.29, 39.7),
+       ('HU', 'Hungary', 2017, 9.7, 73.9, 11738.38, 115.28, 4168.64, 39.75),
+       ('HU', 'Hungary', 2018, 9.6, 59.9, 11823.66, 113.68, 4584.32, 39.6),
+       ('HU', 'Hungary', 2019, 9.6, 70.7, 11993.3, 110.3, 4384.58, 39.45),
+       ('HU', 'Hungary', 2020, 9.7, 157.5, 12606.59, 118.36, 4325.93, 39.2),
+       ('HU', 'Hungary', 2021, 9.8, 120.9, 12234.46, 107.24, 4723.04, 39.3),
+       ('HU', 'Hungary', 2022, 9.3, 48.3, 11935.07, 89.76, 5034.87, 39.3),
+       ('HU', 'Hungary', 2023, 9.1, NULL, NULL, NULL, NULL, 39.35),
+       ('HU', 'Hungary', 2024, NULL, NULL, NULL, NULL, NULL, 39.25),
+       ('IE', 'Ireland', 2015, 13.9, 94.5, 25400.11, 0.62, 4028.07, 35.6),
+       ('IE', 'Ireland', 2016, 13.4, 89.8, 25391.16, 0.6, 4096.79, 35.7),
+       ('IE', 'Ireland', 2017, 12.8, 61.1, 25401.75, 0.6, 4344.45, 36.05),
+       ('IE', 'Ireland', 2018, 12.5, 108.5, 25418.57, 0.6, 4634.77, 36.2),
+       ('IE', 'Ireland', 2019, 11.9, 86.5, 25143.0, 0.6, 5023.98, 36.2),
+       ('IE', 'Ireland', 2020, 11.1, 117.1, 25075.67, 0.6, 5219.23, 36.15),
+       ('IE', 'Ireland', 2021, 11.8, 166.2, 24836.65, 0.58, 5385.34, 35.75),
+       ('IE', 'Ireland', 2022, 10.4, 48.8, 26148.8, 0.52, 6017.98, 35.85),
+       ('IE', 'Ireland', 2023, 10.3, NULL, NULL, NULL, NULL, 35.4),
+       ('IE', 'Ireland', 2024, NULL, NULL, NULL, NULL, NULL, 35.3),
+       ('IT', 'Italy', 2015, 8.1, 111.1, 87945.27, 0.0, 21291.6, 36.45),
+       ('IT', 'Italy', 2016, 7.9, 93.4, 93717.14, 0.0, 21210.12, 36.45),
+       ('IT', 'Italy', 2017, 7.6, 66.0, 97964.38, 0.0, 19224.72, 36.55),
+       ('IT', 'Italy', 2018, 7.3, 58.1, 96004.78, 0.0, 20271.44, 36.65),
+       ('IT', 'Italy', 2019, 7.0, 88.4, 98792.3, 0.0, 20014.9, 36.6),
+       ('IT', 'Italy', 2020, 6.8, 168.5, 101316.22, 0.0, 20510.24, 36.35),
+       ('IT', 'Italy', 2021, 6.8, 128.1, 110950.66, 0.0, 20933.96, 36.7),
+       ('IT', 'Italy', 2022, 6.7, 52.0, 149623.62, 0.0, 20258.02, 36.75),
+       ('IT', 'Italy', 2023, 6.4, 54.7, NULL, NULL, NULL, 36.75),
+       ('IT', 'Italy', 2024, NULL, NULL, NULL, NULL, NULL, 36.7),
+       ('LT', 'Lithuania', 2015, 10.3, 113.0, 2130.46, 98.36, 842.4, 38.35),
+       ('LT', 'Lithuania', 2016, 10.3, 72.5, 2257.83, 99.44, 880.29, 38.5),
+       ('LT', 'Lithuania', 2017, 9.8, 68.2, 2519.15, 89.26, 981.62, 38.5),
+       ('LT', 'Lithuania', 2018, 9.5, 58.8, 3801.29, 83.02, 1098.76, 38.7),
+       ('LT', 'Lithuania', 2019, 8.9, 70.6, 4745.47, 76.24, 862.29, 38.8),
+       ('LT', 'Lithuania', 2020, 8.4, 149.8, 5844.33, 69.36, 1143.66, 38.85),
+       ('LT', 'Lithuania', 2021, 8.3, 119.6, 5734.06, 66.5, 1342.61, 38.9),
+       ('LT', 'Lithuania', 2022, 7.8, 49.6, 5713.76, 61.38, 1431.27, 38.9),
+       ('LT', 'Lithuania', 2023, 7.2, 56.8, NULL, NULL, NULL, 38.8),
+       ('LT', 'Lithuania', 2024, NULL, NULL, NULL, NULL, NULL, 38.9),
+       ('LU', 'Luxembourg', 2015, 10.7, 113.9, 16425.72, 170.2, 5058.78, 37.05),
+       ('LU', 'Luxembourg', 2016, 10.4, 73.7, 15857.63, 142.98, 5303.68, 37.2),
+       ('LU', 'Luxembourg', 2017, 10.4, 67.3, 15990.55, 143.34, 5789.44, 37.1),
+       ('LU', 'Luxembourg', 2018, 10.3, 59.6, 16435.71, 143.58, 6405.54, 37.35),
+       ('LU', 'Luxembourg', 2019, 10.0, 70.5, 16466.28, 142.92, 7085.94, 37.65),
+       ('LU', 'Luxembourg', 2020, 10.2, 161.2, 19106.73, 143.84, 7809.06, 37.25),
+       ('LU', 'Luxembourg', 2021, 10.5, 119.6, 16961.1, 143.68, 8231.42, 37.85),
+       ('LU', 'Luxembourg', 2022, 9.9, 50.1, 17022.08, 137.66, 8602.04, 37.7),
+       ('LU', 'Luxembourg', 2023, 9.5, 58.2, NULL, NULL, NULL, 37.55),
+       ('LU', 'Luxembourg', 2024, NULL, NULL, NULL, NULL, NULL, 37.5),
+       ('LV', 'Latvia', 2015, 11.1, 112.4, 2412.1, 72.42, 604.83, 39.05),
+       ('LV', 'Latvia', 2016, 11.2, 73.9, 2658.42, 71.64, 551.34, 38.75),
+       ('LV', 'Latvia', 2017, 10.7, 66.3, 2740.53, 65.98, 525.01, 38.85),
+       ('LV', 'Latvia', 2018, 10.0, 55.9, 3006.05, 60.12, 518.32, 38.85),
+       ('LV', 'Latvia', 2019, 9.8, 71.9, 3017.18, 56.14, 509.9, 38.65),
+       ('LV', 'Latvia', 2020, 9.2, 142.7, 3102.46, 52.28, 528.75, 38.6),
+       ('LV', 'Latvia', 2021, 9.2, 127.7, 4337.54, 49.84, 510.56, 38.5),
+       ('LV', 'Latvia', 2022, 8.5, 48.9, 3916.92, 41.72, 530.06, 38.7),
+       ('LV', 'Latvia', 2023, 7.7, 54.5, NULL, NULL, NULL, 38.6),
+       ('LV', 'Latvia', 2024, NULL, NULL, NULL, NULL, NULL, 38.5),
+       ('MT', 'Malta', 2015, 9.7, 113.0, 1180.22, 0.0, 362.28, 37.8),
+       ('MT', 'Malta', 2016, 9.8, 74.4, 1026.89, 0.0, 368.37, 38.05),
+       ('MT', 'Malta', 2017, 9.2, 81.4, 965.41, 0.0, 461.48, 38.25),
+       ('MT', 'Malta', 2018, 9.2, 59.1, 923.0, 0.0, 540.57, 38.5),
+       ('MT', 'Malta', 2019, 8.6, 77.9, 876.21, 0.0, 652.08, 39.1),
+       ('MT', 'Malta', 2020, 8.6, NULL, 901.9, 10.24, 657.11, 39.2),
+       ('MT', 'Malta', 2021, 8.5, 120.3, 932.74, 12.44, 842.61, 38.8),
+       ('MT', 'Malta', 2022, 8.1, 51.1, 957.14, 15.3, 856.55, 38.4),
+       ('MT', 'Malta', 2023, 8.1, 98.3, NULL, NULL, NULL, 38.5),
+       ('MT', 'Malta', 2024, NULL, NULL, NULL, NULL, NULL, 38.6),
+       ('NL', 'Netherlands', 2015, 10.1, 114.3, 31458.64, 0.0, 15108.46, 29.7),
+       ('NL', 'Netherlands', 2016, 10.1, 74.9, 32360.63, 0.0, 17319.11, 29.95),
+       ('NL', 'Netherlands', 2017, 9.9, 83.7, 31995.67, 0.0, 19075.97, 30.0),
+       ('NL', 'Netherlands', 2018, 9.8, 60.5, 31733.44, 0.0, 20784.53, 30.1),
+       ('NL', 'Netherlands', 2019, 9.8, 82.4, 34154.3, 0.0, 23801.52, 30.1),
+       ('NL', 'Netherlands', 2020, 9.7, NULL, 37550.41, 0.0, 22964.98, 30.0),
+       ('NL', 'Netherlands', 2021, 10.2, 123.5, 36481.86, 0.0, 25733.83, 30.95),
+       ('NL', 'Netherlands', 2022, 9.5, 52.4, 36118.86, NULL, 27339.1, 31.05),
+       ('NL', 'Netherlands', 2023, 9.2, 96.6, NULL, NULL, NULL, 31.05),
+       ('NL', 'Netherlands', 2024, NULL, NULL, NULL, NULL, NULL, 30.95),
+       ('PL', 'Poland', 2015, 9.7, 112.2, 20682.77, 585.31, 18753.0, 40.55),
+       ('PL', 'Poland', 2016, 10.1, 77.9, 47873.72, 632.8, 19884.86, 40.5),
+       ('PL', 'Poland', 2017, 10.6, 83.9, 56764.98, 621.21, 17314.58, 40.3),
+       ('PL', 'Poland', 2018, 10.2, 67.4, 55254.26, 573.64, 19379.06, 40.2),
+       ('PL', 'Poland', 2019, 9.9, 86.0, 72877.01, 527.78, 23146.38, 40.15),
+       ('PL', 'Poland', 2020, 9.5, NULL, 91982.69, 412.47, 25846.22, 39.9),
+       ('PL', 'Poland', 2021, 9.0, 118.8, 85750.48, 333.49, 27891.6, 40.05),
+       ('PL', 'Poland', 2022, 8.3, 58.3, 86226.14, 257.84, 29370.08, 40.1),
+       ('PL', 'Poland', 2023, 7.4, 115.8, NULL, NULL, NULL, 39.9),
+       ('PL', 'Poland', 2024, NULL, NULL, NULL, NULL, NULL, 39.85),
+       ('PT', 'Portugal', 2015, 8.2, 71.1, 8432.1, 0.0, 4700.72, 39.4),
+       ('PT', 'Portugal', 2016, 8.4, 78.5, 9043.62, 0.0, 4661.72, 39.3),
+       ('PT', 'Portugal', 2017, 8.3, 84.5, 9262.71, 0.0, 4742.68, 39.4),
+       ('PT', 'Portugal', 2018, 8.4, 87.0, 10028.84, 0.0, 4756.4, 39.45),
+       ('PT', 'Portugal', 2019, 8.4, 83.2, 10850.82, 0.0, 4812.24, 39.4),
+       ('PT', 'Portugal', 2020, 8.1, NULL, 11800.13, 0.0, 4933.46, 39.15),
+       ('PT', 'Portugal', 2021, 7.6, 55.0, 11444.74, 0.0, 5340.19, 39.7),
+       ('PT', 'Portugal', 2022, 8.0, 59.4, 11794.53, 0.0, 5629.39, 39.7),
+       ('PT', 'Portugal', 2023, 8.1, 119.9, NULL, NULL, NULL, 39.65),
+       ('PT', 'Portugal', 2024, NULL, NULL, NULL, NULL, NULL, 39.5),
+       ('RO', 'Romania', 2015, 10.2, 70.0, 9127.18, 0.0, 3071.64, 39.7),
+       ('RO', 'Romania', 2016, 10.4, 75.2, 10802.1, 0.0, 3316.59, 39.8),
+       ('RO', 'Romania', 2017, 10.8, 86.3, 12874.26, 0.0, 3815.37, 39.65),
+       ('RO', 'Romania', 2018, 10.4, 85.3, 13492.33, 0.0, 4494.5, 39.5),
+       ('RO', 'Romania', 2019, 10.3, 82.4, 16138.46, 0.0, 5241.52, 39.75),
+       ('RO', 'Romania', 2020, 10.3, NULL, 18623.7, 0.0, 5278.18, 39.7),
+       ('RO', 'Romania', 2021, 10.1, 54.4, 21223.23, 0.0, 4801.58, 40.1),
+       ('RO', 'Romania', 2022, 9.4, 61.6, 23336.62, NULL, 4598.96, 40.1),
+       ('RO', 'Romania', 2023, 8.4, 118.0, NULL, NULL, NULL, 40.05),
+       ('RO', 'Romania', 2024, NULL, NULL, NULL, NULL, NULL, 39.95),
+       ('SE', 'Sweden', 2015, 11.7, 69.2, 37927.4, 9.94, 45201.06, 36.3),
+       ('SE', 'Sweden', 2016, 11.8, 64.7, 38818.44, 7.22, 46924.26, 36.3),
+       ('SE', 'Sweden', 2017, 11.5, 91.6, 39178.38, 10.24, 47677.5, 36.3),
+       ('SE', 'Sweden', 2018, 11.4, 88.9, 41172.6, 8.62, 48184.44, 36.35),
+       ('SE', 'Sweden', 2019, 11.1, 126.1, 41423.88, 8.38, 48287.12, 36.35),
+       ('SE', 'Sweden', 2020, 10.9, NULL, 40617.52, 5.32, 48247.68, 36.2),
+       ('SE', 'Sweden', 2021, 11.0, 54.5, 40930.42, 5.3, 49299.86, 37.55),
+       ('SE', 'Sweden', 2022, 10.0, 54.1, 38866.12, 4.46, 48979.04, 37.6),
+       ('SE', 'Sweden', 2023, 9.5, 122.0, NULL, NULL, NULL, 37.6),
+       ('SE', 'Sweden', 2024, NULL, NULL, NULL, NULL, NULL, 37.55),
+       ('SI', 'Slovenia', 2015, 10.0, 68.4, 3857.74, 0.0, 1564.16, 39.15),
+       ('SI', 'Slovenia', 2016, 9.9, 80.6, 3890.29, 0.0, 1561.4, 39.25),
+       ('SI', 'Slovenia', 2017, 9.8, 86.5, 3924.22, 23.42, 2203.38, 38.95),
+       ('SI', 'Slovenia', 2018, 9.4, 86.3, 4030.75, 23.32, 2282.78, 39.1),
+       ('SI', 'Slovenia', 2019, 9.3, 85.2, 4237.33, 23.36, 2352.96, 39.45),
+       ('SI', 'Slovenia', 2020, 8.9, NULL, 4446.21, 58.94, 2299.14, 39.4),
+       ('SI', 'Slovenia', 2021, 9.0, 54.5, 4716.64, 77.06, 2319.22, 39.35),
+       ('SI', 'Slovenia', 2022, 8.3, 61.4, 4582.22, 65.98, 2346.16, 39.2),
+       ('SI', 'Slovenia', 2023, 8.0, 114.7, NULL, NULL, NULL, 39.1),
+       ('SI', 'Slovenia', 2024, NULL, NULL, NULL, NULL, NULL, 39.1),
+       ('SK', 'Slovakia', 2015, 10.3, 67.8, 7496.62, 271.54, 879.92, 40.05),
+       ('SK', 'Slovakia', 2016, 10.6, 82.0, 7626.79, 287.68, 919.14, 39.9),
+       ('SK', 'Slovakia', 2017, 10.7, 86.5, 7900.34, 285.66, 942.76, 39.75),
+       ('SK', 'Slovakia', 2018, 10.6, 86.5, 7847.43, 282.14, 1000.04, 39.8),
+       ('SK', 'Slovakia', 2019, 10.5, 83.8, 8545.6, 291.08, 1013.18, 40.0),
+       ('SK', 'Slovakia', 2020, 10.4, NULL, 10159.19, 266.8, 803.26, 39.75),
+       ('SK', 'Slovakia', 2021, 10.4, 53.8, 10955.95, 259.24, 911.92, 39.45),
+       ('SK', 'Slovakia', 2022, 9.7, 65.2, 11164.11, 250.92, 842.32, 39.45),
+       ('SK', 'Slovakia', 2023, 9.0, 125.5, NULL, NULL, NULL, 39.4),
+       ('SK', 'Slovakia', 2024, NULL, NULL, NULL, NULL, NULL, 39.3);
@@ -0,0 +1,20 @@
+USE euro_database;
+
+-- ### FeatureStatistics
+-- Materialized summary of the model2 features, one row per feature.
+-- Rebuilt by the API (or `flask --app backend_app model2 refresh-feature-stats`)
+-- whenever eu_family_employment_data has a new data_version.
+CREATE TABLE IF NOT EXISTS FeatureStatistics
+(
+    feature_name VARCHAR(50) PRIMARY KEY,
+    data_version VARCHAR(100) NOT NULL,
+    data_points  INT          NOT NULL,
+    min_value    DOUBLE,
+    max_value    DOUBLE,
+    mean_value   DOUBLE,
+    median_value DOUBLE,
+    std_value    DOUBLE,
+    percentiles  JSON,
+    histogram    JSON,
+    refreshed_at DATETIME     NOT NULL
+);
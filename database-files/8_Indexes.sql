@@ -0,0 +1,50 @@
+USE euro_database;
+
+-- # Secondary indexes matching the filters the API routes use.
+-- Created after the seed data so the inserts above do not have to
+-- maintain them row by row. Keep in sync with INDEXES in
+-- api/scripts/query_shapes.py (used by the index advisor and benchmark).
+
+-- ### /hours/weeklyhours
+CREATE INDEX idx_euemployment_country_year_sex
+    ON EUEmployment (country_name, year, sex);
+
+-- ### /benefits/benefit
+CREATE INDEX idx_familybenefits_country_year_type_group
+    ON Children_FamilyBenefits (country_code, year, benefit_type, target_group);
+
+-- ### /cpi/cpi
+CREATE INDEX idx_eucpi_country_year
+    ON EUCPI (country_name, year);
+
+-- ### /birthdata/api/birth-rates
+CREATE INDEX idx_birthdata_w24_country_year
+    ON EUBirthData_With2024 (country, year);
+
+-- ### /model2/api/* (latest row per country, country details)
+CREATE INDEX idx_family_employment_country_year
+    ON eu_family_employment_data (country_code, year);
+
+-- ### /location/locations
+CREATE INDEX idx_daycarelocations_active_country_city
+    ON DaycareLocations (inactive, country_code, city);
+
+-- ### /daycaredata/* (per daycare and per year lookups)
+-- Unique: one row per daycare and year, which POST /daycaredata/data/bulk
+-- relies on to update an existing year (INSERT ... ON DUPLICATE KEY UPDATE).
+CREATE UNIQUE INDEX idx_daycaredata_daycare_year
+    ON DaycareData (daycare_id, year);
+CREATE INDEX idx_daycaredata_year
+    ON DaycareData (year);
+
+-- ### /policy/policy and /policy/allpolicy
+CREATE INDEX idx_policies_country_focus_year
+    ON Policies (country_code, focus_area, year);
+
+-- ### /group/groups
+CREATE INDEX idx_affinityresources_country_focus_type
+    ON AffinityResources (country_code, focus_area, resource_type);
+
+-- ### /users/role/<role_id>
+CREATE INDEX idx_user_role_name
+    ON User (role_id, last_name, first_name);
@@ -0,0 +1,92 @@
+## BENCHMARK: model one training
+# Times the original normal-equation fit (inv(X'X) X'y on the fully
+# materialized matrix) against the solvers in model_one_training, on
+# synthetic data shaped like family_employment_data.csv, and times
+# k-fold cross-validation serially and on a process pool.
+#
+#   python bench_model_one_training.py --rows 10000 100000 1000000 5000000
+#   python bench_model_one_training.py --rows 1000000 --cv-workers 4
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import model_one_training as mt
+
+# mean and spread of each raw input, roughly as in the EU data
+INPUT_SCALES = {
+    'weekly_hours': (37.9, 2.4),
+    'cash_per_capita': (45000.0, 30000.0),
+    'maternity_per_capita': (250.0, 650.0),
+    'services_per_capita': (26000.0, 55000.0),
+}
+
+
+def synthetic(rows, rng):
+    # raw inputs (rows x INPUTS) and a birth rate from a known model plus noise
+    inputs = np.column_stack([
+        np.abs(rng.normal(mean, spread, rows)) for mean, spread in INPUT_SCALES.values()
+    ])
+    X_mean, X_std = mt.feature_moments(inputs)
+    beta = rng.normal(0, 0.5, len(mt.FEATURES) + 1)
+    beta[0] = 9.5
+    y = mt.predict_arrays(inputs, beta, X_mean, X_std) + rng.normal(0, 1.0, rows)
+    return inputs, y
+
+
+def fit_normal_equation(inputs, y):
+    # model_one_code.train_model as it was: full matrix, then inv(X'X)
+    X_raw = mt.expand(inputs)
+    X_mean = X_raw.mean(axis=0)
+    X_std = X_raw.std(axis=0)
+    X_std[X_std == 0] = 1
+    X_design = np.c_[np.ones(X_raw.shape[0]), (X_raw - X_mean) / X_std]
+    return np.linalg.inv(X_design.T @ X_design) @ (X_design.T @ y), X_mean, X_std
+
+
+def measure(fit):
+    # (seconds, peak MB traced, result)
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fit()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark model one training on synthetic data')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--ridge', type=float, default=0.0)
+    parser.add_argument('--chunk-size', type=int, default=mt.DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--cv-workers', type=int, default=None, help='processes for the parallel CV run')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>10} {'method':<16} {'time':>9} {'peak MB':>9} {'max |beta - qr|':>16} {'train R²':>9}")
+    for rows in args.rows:
+        inputs, y = synthetic(rows, rng)
+        fits = {'inv (original)': lambda: fit_normal_equation(inputs, y)}
+        for method in mt.METHODS:
+            fits[method] = lambda method=method: mt.fit_arrays(inputs, y, method, args.ridge, args.chunk_size)
+
+        results = {name: measure(fit) for name, fit in fits.items()}
+        reference = results['qr'][2][0]
+        for name, (elapsed, peak, (beta, X_mean, X_std)) in results.items():
+            r2 = mt.scores(y, mt.predict_arrays(inputs, beta, X_mean, X_std))['r2']
+            print(f"{rows:>10} {name:<16} {elapsed:>8.3f}s {peak:>9.1f} {np.abs(beta - reference).max():>16.2e} {r2:>9.4f}")
+
+        df = pd.DataFrame(inputs, columns=mt.INPUTS).assign(**{mt.TARGET: y})
+        for workers in (1, args.cv_workers):
+            started = time.perf_counter()
+            cv = mt.cross_validate(df, args.folds, 'qr', args.ridge, workers, chunk_size=args.chunk_size)
+            label = f"{args.folds}-fold CV x{workers or 'cpu'}"
+            print(f"{rows:>10} {label:<16} {time.perf_counter() - started:>8.3f}s {'':>9} {'':>16} {cv['mean']['r2']:>9.4f}")
+
+
+if __name__ == '__main__':
+    main()
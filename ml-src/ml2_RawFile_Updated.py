@@ -1,56 +1,39 @@
-import pandas as pd
+## MODEL TWO: COUNTRY SIMILARITY (batch)
+# Cosine similarity of user preference profiles (0-10 per feature)
+# against the latest min-max normalized data of every country.
+# All profiles are scored with one matrix multiply and written as one
+# long table: profile_id, country_code, iso_code, Country, similarity, rank.
+#
+#   python ml2_RawFile_Updated.py                                  # the example profile below
+#   python ml2_RawFile_Updated.py --profiles profiles.csv --out scores.parquet
+#   python ml2_RawFile_Updated.py --profiles profiles.json --map 7 # also draw profile 7's map
+#
+# A profiles file (.csv, .json list of objects, or .parquet) has the
+# four feature columns and an optional profile_id. The scores go to
+# country_similarity_scores.csv unless --out names another file; a
+# .parquet or .feather/.arrow file needs pyarrow, and without it the
+# scores are written as CSV instead. Plotly is only imported when
+# --map is given, so headless runs never load it.
+import argparse
+import os
+from functools import lru_cache
+
 import numpy as np
-import plotly.express as px
-import pycountry
+import pandas as pd
 
-df = pd.read_csv("/Users/miagiargiari/Documents/GitHub/25su-DoC-Project-Team-Cool25/datasets/raw-datasets/family_employment_data.csv")
+from snapshots import read_table
 
 features = ["weekly_hours", "cash_per_capita", "maternity_per_capita", "services_per_capita"]
-df = df.dropna(subset=features)
-df_latest = df.sort_values("year").groupby("country_code", as_index=False).tail(1).reset_index(drop=True)
-df_latest["year"] = 2023
-
-
-
-df_norm = df_latest.copy()
-df_norm[features] = (df_latest[features] - df_latest[features].min()) / (
-    df_latest[features].max() - df_latest[features].min()
-)
-
-
-def get_iso3(country_name):
-    try:
-        return pycountry.countries.lookup(country_name).alpha_3
-    except:
-        return None
-
-df_norm["iso_code"] = df_norm["Country"].apply(get_iso3)
-df_norm = df_norm.dropna(subset=["iso_code"])
-
-def normalize_user_input(user_input, max_scale=10):
-    return np.array([user_input[feature] / max_scale for feature in features])
-
-
-def compute_cosine_similarity(user_vec, country_vec):
-    dot = np.dot(user_vec, country_vec)
-    norm_user = np.linalg.norm(user_vec)
-    norm_country = np.linalg.norm(country_vec)
-    if norm_user == 0 or norm_country == 0:
-        return 0
-    return dot / (norm_user * norm_country)
-
-
-def compute_similarities(user_input_raw):
-    user_vec = normalize_user_input(user_input_raw)
-    similarities = []
-
-    for _, row in df_norm.iterrows():
-        country_vec = row[features].values
-        similarity = compute_cosine_similarity(user_vec, country_vec)
-        similarities.append(similarity)
-
-    df_norm["similarity"] = similarities
-    return df_norm.sort_values("similarity", ascending=False)
+MAX_SCALE = 10
+
+# ISO-3 code of every country in the data, by its Eurostat code (EL is Greece);
+# the EU27 average has none and is left off the map
+ISO3 = {
+    "AT": "AUT", "BE": "BEL", "BG": "BGR", "CY": "CYP", "CZ": "CZE", "DE": "DEU", "DK": "DNK",
+    "EE": "EST", "EL": "GRC", "ES": "ESP", "FI": "FIN", "FR": "FRA", "HR": "HRV", "HU": "HUN",
+    "IE": "IRL", "IT": "ITA", "LT": "LTU", "LU": "LUX", "LV": "LVA", "MT": "MLT", "NL": "NLD",
+    "PL": "POL", "PT": "PRT", "RO": "ROU", "SE": "SWE", "SI": "SVN", "SK": "SVK",
+}
 
 user_input = {
     "weekly_hours": 3,
@@ -59,21 +42,144 @@ user_input = {
     "services_per_capita": 9
 }
 
-result_df = compute_similarities(user_input)
 
-fig = px.choropleth(
-    result_df,
-    locations="iso_code",
-    color="similarity",
-    hover_name="Country",
-    color_continuous_scale="Blues",
-    range_color=(0, 1),
-    locationmode="ISO-3",
-    scope="europe",
-    title="Similarity Score by Country (Higher = Better Match)"
-)
+@lru_cache(maxsize=None)
+def lookup_iso3(country_name):
+    # only for countries missing from ISO3; pycountry is slow to load, so import it here
+    import pycountry
+    try:
+        return pycountry.countries.lookup(country_name).alpha_3
+    except LookupError:
+        return None
 
-fig.update_geos(fitbounds="locations", visible=False)
-fig.show()
 
-result_df.to_csv("country_similarity_scores.csv", index=False)
+def get_iso3(country_code, country_name):
+    if country_code == "EU27":
+        return None
+    return ISO3.get(country_code) or lookup_iso3(country_name)
+
+
+# COUNTRIES
+def load_countries():
+    # latest complete row per country, min-max normalized; a new frame, nothing global is changed
+    df = read_table("family_employment", columns=["country_code", "Country", "year"] + features)
+    df = df.dropna(subset=features)
+    df_latest = df.sort_values("year").groupby("country_code", as_index=False).tail(1).reset_index(drop=True)
+    df_latest["year"] = 2023
+
+    df_norm = df_latest.copy()
+    df_norm[features] = (df_latest[features] - df_latest[features].min()) / (
+        df_latest[features].max() - df_latest[features].min()
+    )
+    df_norm["iso_code"] = [get_iso3(code, name) for code, name in zip(df_norm["country_code"], df_norm["Country"])]
+    return df_norm.dropna(subset=["iso_code"]).reset_index(drop=True)
+
+
+# PROFILES
+def load_profiles(path):
+    if path.endswith(".json"):
+        profiles = pd.read_json(path, orient="records")
+    elif path.endswith(".parquet"):
+        profiles = pd.read_parquet(path)
+    else:
+        profiles = pd.read_csv(path)
+
+    missing = [feature for feature in features if feature not in profiles]
+    if missing:
+        raise ValueError(f"{path}: missing columns {', '.join(missing)}")
+    values = profiles[features].apply(pd.to_numeric, errors="coerce")
+    bad = values.isna().any(axis=1) | ((values < 0) | (values > MAX_SCALE)).any(axis=1)
+    if bad.any():
+        rows = ", ".join(str(i) for i in profiles.index[bad][:10])
+        raise ValueError(f"{path}: every feature must be a number from 0 to {MAX_SCALE} (bad rows: {rows})")
+
+    if "profile_id" not in profiles:
+        profiles = profiles.assign(profile_id=np.arange(len(profiles)))
+    return profiles.assign(**{feature: values[feature] for feature in features})
+
+
+# SIMILARITY
+def unit_rows(matrix):
+    # every row divided by its L2 norm; all-zero rows stay zero, so their similarity is 0
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def compute_similarities(profiles, countries):
+    # (profiles x countries) cosine similarities in one matrix multiply
+    users = profiles[features].to_numpy(dtype=np.float64) / MAX_SCALE
+    return unit_rows(users) @ unit_rows(countries[features].to_numpy(dtype=np.float64)).T
+
+
+def similarity_table(profiles, countries):
+    # long table, one row per (profile, country), best match first within a profile
+    scores = compute_similarities(profiles, countries)
+    n_profiles, n_countries = scores.shape
+    order = np.argsort(-scores, axis=1, kind="stable")
+
+    countries_by_rank = order.ravel()
+    return pd.DataFrame({
+        "profile_id": np.repeat(profiles["profile_id"].to_numpy(), n_countries),
+        "country_code": countries["country_code"].to_numpy()[countries_by_rank],
+        "iso_code": countries["iso_code"].to_numpy()[countries_by_rank],
+        "Country": countries["Country"].to_numpy()[countries_by_rank],
+        "similarity": np.take_along_axis(scores, order, axis=1).ravel(),
+        "rank": np.tile(np.arange(1, n_countries + 1, dtype=np.int16), n_profiles),
+    })
+
+
+def write_table(df, path):
+    # returns the path written: a .csv next to path when no Parquet/Arrow engine is installed
+    try:
+        if path.endswith((".feather", ".arrow")):
+            df.to_feather(path)
+            return path
+        if not path.endswith(".csv"):
+            df.to_parquet(path, index=False)
+            return path
+    except ImportError:
+        print(f"cannot write {path} without pyarrow (pip install pyarrow); writing CSV instead")
+        path = os.path.splitext(path)[0] + ".csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+# MAP
+def show_map(result_df, profile_id):
+    import plotly.express as px
+
+    fig = px.choropleth(
+        result_df[result_df["profile_id"] == profile_id],
+        locations="iso_code",
+        color="similarity",
+        hover_name="Country",
+        color_continuous_scale="Blues",
+        range_color=(0, 1),
+        locationmode="ISO-3",
+        scope="europe",
+        title="Similarity Score by Country (Higher = Better Match)"
+    )
+    fig.update_geos(fitbounds="locations", visible=False)
+    fig.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score preference profiles against every country")
+    parser.add_argument("--profiles", help="profiles file (.csv, .json or .parquet); default: the example profile")
+    parser.add_argument("--out", default="country_similarity_scores.csv",
+                        help=".csv, .parquet or .feather/.arrow (the last two need pyarrow)")
+    parser.add_argument("--map", nargs="?", const="first", metavar="PROFILE_ID",
+                        help="draw the choropleth of one profile (default: the first) with Plotly")
+    args = parser.parse_args()
+
+    profiles = load_profiles(args.profiles) if args.profiles else pd.DataFrame([{"profile_id": 0, **user_input}])
+    result_df = similarity_table(profiles, load_countries())
+    out = write_table(result_df, args.out)
+    print(f"{len(profiles)} profiles x {result_df['country_code'].nunique()} countries -> {out}")
+
+    if args.map is not None:
+        ids = profiles["profile_id"]
+        matches = ids.iloc[:1] if args.map == "first" else ids[ids.astype(str) == args.map]
+        if matches.empty:
+            parser.error(f"no profile with profile_id {args.map}")
+        show_map(result_df, matches.iloc[0])
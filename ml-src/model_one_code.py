@@ -34,8 +34,8 @@ def train_model(df):
     X_standardized = (X_raw - X_mean) / X_std
     X_design = np.c_[np.ones(X_standardized.shape[0]), X_standardized]
 
-    # train using normal equation
-    beta = np.linalg.inv(X_design.T @ X_design) @ (X_design.T @ Y)
+    # least squares fit (no inverse of X'X; see model_one_training for chunked QR/Cholesky and ridge)
+    beta = np.linalg.lstsq(X_design, Y, rcond=None)[0]
 
     # evaluate
     predictions = X_design @ beta
@@ -74,3 +74,77 @@ def predict_birth_rate(user_input: dict, beta, X_mean, X_std, features):
     return (X_input_design @ beta)[0]
 
 
+
+
+# SAVE
+def save_model(path, beta, X_mean, X_std, features, metrics=None):
+    # one .npz with everything predict_birth_rate needs, in the layout
+    # the API's model registry reads (publish it with scripts.publish_model1)
+    metrics = metrics or {}
+    np.savez(
+        path,
+        beta=np.asarray(beta, dtype=np.float64),
+        means=np.asarray(X_mean, dtype=np.float64),
+        stds=np.asarray(X_std, dtype=np.float64),
+        features=np.asarray(features, dtype=str),
+        metric_names=np.asarray(list(metrics), dtype=str),
+        metric_values=np.asarray(list(metrics.values()), dtype=np.float64),
+    )
+
+
+# LOAD
+def load_model(path):
+    # returns beta, X_mean, X_std, features like train_model
+    with np.load(path, allow_pickle=False) as arrays:
+        return arrays["beta"], arrays["means"], arrays["stds"], arrays["features"].tolist()
+
+
+# BATCH PREDICT
+# suffix of a derived feature and the power of its raw input
+FEATURE_POWERS = {'_squared': 2, '_cubed': 3}
+
+# rows scored at a time; the work buffer is BATCH_CHUNK_SIZE x features floats
+BATCH_CHUNK_SIZE = 65_536
+
+
+def feature_source(feature):
+    # ('weekly_hours', 2) for 'weekly_hours_squared'
+    for suffix, power in FEATURE_POWERS.items():
+        if feature.endswith(suffix):
+            return feature[:-len(suffix)], power
+    return feature, 1
+
+
+def predict_birth_rates(inputs, beta, X_mean, X_std, features, columns=None, chunk_size=BATCH_CHUNK_SIZE):
+    # predict_birth_rate for many rows at once.
+    # inputs: DataFrame or dict with the raw input columns, or a 2-D array whose
+    # columns are named by `columns`. Rows are scored chunk_size at a time in one
+    # preallocated buffer, so memory stays bounded however many rows come in.
+    sources = [feature_source(feature) for feature in features]
+    names = list(dict.fromkeys(name for name, _ in sources))
+
+    if isinstance(inputs, np.ndarray):
+        if columns is None:
+            raise ValueError("columns must name the columns of an array input")
+        values = {name: inputs[:, list(columns).index(name)] for name in names}
+    else:
+        values = {name: np.asarray(inputs[name], dtype=np.float64) for name in names}
+
+    n = len(values[names[0]]) if names else 0
+    X_mean = np.asarray(X_mean, dtype=np.float64)
+    X_std = np.asarray(X_std, dtype=np.float64)
+    weights, intercept = np.asarray(beta[1:], dtype=np.float64), float(beta[0])
+
+    predictions = np.empty(n)
+    buffer = np.empty((min(chunk_size, n), len(features)))
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        block = buffer[:stop - start]
+        # polynomial features, then standardize, all in place
+        for j, (name, power) in enumerate(sources):
+            np.power(values[name][start:stop], power, out=block[:, j])
+        block -= X_mean
+        block /= X_std
+        np.dot(block, weights, out=predictions[start:stop])
+        predictions[start:stop] += intercept
+    return predictions
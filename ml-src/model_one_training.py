@@ -0,0 +1,250 @@
+## MODEL ONE TRAINING
+# Same model as model_one_code.train_model (linear regression of the
+# birth rate on standardized weekly hours, benefits and their powers),
+# fitted without inverting X'X:
+#   - "qr"        chunked QR of [1, X, y]: only a small R matrix is kept
+#                 between chunks, most accurate, the default
+#   - "cholesky"  chunked X'X and X'y, solved with a Cholesky factor;
+#                 fastest, fine when the features are not collinear
+#   - "lstsq"     np.linalg.lstsq on the full design matrix, as a reference
+# Every method takes an optional ridge penalty (the intercept is not
+# penalized) and, except lstsq, builds the squared/cubed features one
+# chunk of rows at a time instead of materializing the whole matrix.
+#
+#   from model_one_training import train_model, evaluate, cross_validate
+#   beta, X_mean, X_std, features = train_model(df, ridge=1.0)
+#   cross_validate(df, k=5, ridge=1.0, workers=4)
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+TARGET = 'birth_rate_per_thousand'
+INPUTS = ['weekly_hours', 'cash_per_capita', 'maternity_per_capita', 'services_per_capita']
+
+# model features as (input, power), in the order of the weights
+FEATURE_SOURCES = [
+    ('weekly_hours', 1), ('cash_per_capita', 1), ('maternity_per_capita', 1), ('services_per_capita', 1),
+    ('weekly_hours', 2), ('weekly_hours', 3), ('cash_per_capita', 2), ('services_per_capita', 2),
+]
+POWER_SUFFIX = {1: '', 2: '_squared', 3: '_cubed'}
+FEATURES = [name + POWER_SUFFIX[power] for name, power in FEATURE_SOURCES]
+
+METHODS = ('qr', 'cholesky', 'lstsq')
+
+# rows expanded at a time; 100k rows x 10 columns is 8 MB of float64
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+# FEATURES
+def expand(inputs):
+    # (n x INPUTS) raw inputs -> (n x FEATURES) model features
+    out = np.empty((inputs.shape[0], len(FEATURE_SOURCES)))
+    for j, (name, power) in enumerate(FEATURE_SOURCES):
+        column = inputs[:, INPUTS.index(name)]
+        out[:, j] = column if power == 1 else column ** power
+    return out
+
+
+def chunks(n, chunk_size):
+    for start in range(0, n, chunk_size):
+        yield slice(start, min(start + chunk_size, n))
+
+
+def feature_moments(inputs, chunk_size=DEFAULT_CHUNK_SIZE):
+    # mean and population std of every feature, merging per-chunk
+    # statistics (Chan et al.) so huge squared/cubed values never get summed raw
+    count, mean, m2 = 0, np.zeros(len(FEATURES)), np.zeros(len(FEATURES))
+    for rows in chunks(inputs.shape[0], chunk_size):
+        block = expand(inputs[rows])
+        n = block.shape[0]
+        block_mean = block.mean(axis=0)
+        block_m2 = ((block - block_mean) ** 2).sum(axis=0)
+        delta = block_mean - mean
+        total = count + n
+        mean = mean + delta * n / total
+        m2 = m2 + block_m2 + delta ** 2 * count * n / total
+        count = total
+    std = np.sqrt(m2 / count)
+    std[std == 0] = 1  # avoid division by zero, as in model_one_code
+    return mean, std
+
+
+def design_chunk(inputs, mean, std):
+    # [1, standardized features] for one chunk of rows
+    block = (expand(inputs) - mean) / std
+    return np.c_[np.ones(block.shape[0]), block]
+
+
+# SOLVERS
+def ridge_matrix(p, ridge):
+    # ridge on every weight but the intercept
+    penalty = np.full(p, float(ridge))
+    penalty[0] = 0.0
+    return np.diag(penalty)
+
+
+def solve_qr(inputs, y, mean, std, ridge, chunk_size):
+    # R of [1, X, y] is updated chunk by chunk: R = qr([R; qr(chunk)])
+    r = None
+    for rows in chunks(inputs.shape[0], chunk_size):
+        block = np.c_[design_chunk(inputs[rows], mean, std), y[rows]]
+        stacked = block if r is None else np.vstack([r, block])
+        r = np.linalg.qr(stacked, mode='r')
+
+    p = len(FEATURES) + 1
+    if ridge:
+        # ridge as extra rows sqrt(ridge) * I, with a zero target
+        extra = np.c_[np.sqrt(ridge_matrix(p, ridge)), np.zeros(p)]
+        r = np.linalg.qr(np.vstack([r, extra]), mode='r')
+    # the first p columns of R are the triangular factor of [1, X], the last is Q'y
+    return np.linalg.solve(r[:p, :p], r[:p, p])
+
+
+def solve_cholesky(inputs, y, mean, std, ridge, chunk_size):
+    p = len(FEATURES) + 1
+    gram, rhs = np.zeros((p, p)), np.zeros(p)
+    for rows in chunks(inputs.shape[0], chunk_size):
+        block = design_chunk(inputs[rows], mean, std)
+        gram += block.T @ block
+        rhs += block.T @ y[rows]
+
+    try:
+        lower = np.linalg.cholesky(gram + ridge_matrix(p, ridge))
+    except np.linalg.LinAlgError:
+        raise ValueError("X'X is singular (collinear features): use method='qr' or a ridge penalty")
+    return np.linalg.solve(lower.T, np.linalg.solve(lower, rhs))
+
+
+def solve_lstsq(inputs, y, mean, std, ridge, chunk_size):
+    design = design_chunk(inputs, mean, std)
+    target = y
+    if ridge:
+        p = design.shape[1]
+        design = np.vstack([design, np.sqrt(ridge_matrix(p, ridge))])
+        target = np.r_[y, np.zeros(p)]
+    return np.linalg.lstsq(design, target, rcond=None)[0]
+
+
+SOLVERS = {'qr': solve_qr, 'cholesky': solve_cholesky, 'lstsq': solve_lstsq}
+
+
+def fit_arrays(inputs, y, method='qr', ridge=0.0, chunk_size=DEFAULT_CHUNK_SIZE):
+    # inputs: (n x INPUTS) raw values, y: n birth rates
+    if method not in SOLVERS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}")
+    mean, std = feature_moments(inputs, chunk_size)
+    beta = SOLVERS[method](inputs, y, mean, std, ridge, chunk_size)
+    return beta, mean, std
+
+
+def predict_arrays(inputs, beta, X_mean, X_std, chunk_size=DEFAULT_CHUNK_SIZE):
+    out = np.empty(inputs.shape[0])
+    for rows in chunks(inputs.shape[0], chunk_size):
+        out[rows] = design_chunk(inputs[rows], X_mean, X_std) @ beta
+    return out
+
+
+def scores(y, predictions):
+    residuals = y - predictions
+    return {
+        'mae': float(np.mean(np.abs(residuals))),
+        'rmse': float(np.sqrt(np.mean(residuals ** 2))),
+        'r2': float(1 - np.sum(residuals ** 2) / np.sum((y - y.mean()) ** 2)),
+    }
+
+
+# DATAFRAMES
+def to_arrays(df):
+    # drop rows w missing, like model_one_code.train_model
+    df = df.dropna(subset=[TARGET] + INPUTS)
+    return df[INPUTS].to_numpy(dtype=np.float64), df[TARGET].to_numpy(dtype=np.float64)
+
+
+def train_model(df, method='qr', ridge=0.0, chunk_size=DEFAULT_CHUNK_SIZE):
+    # drop-in for model_one_code.train_model: returns beta, X_mean, X_std, features
+    inputs, y = to_arrays(df)
+    beta, X_mean, X_std = fit_arrays(inputs, y, method, ridge, chunk_size)
+    return beta, X_mean, X_std, list(FEATURES)
+
+
+def evaluate(df, beta, X_mean, X_std):
+    inputs, y = to_arrays(df)
+    return scores(y, predict_arrays(inputs, beta, X_mean, X_std))
+
+
+# CROSS VALIDATION
+_fold_data = {}
+
+
+def _load_fold_data(inputs, y):
+    # runs once per worker process, so the data is sent once per worker, not once per fold
+    _fold_data['inputs'], _fold_data['y'] = inputs, y
+
+
+def _run_fold(test_rows, method, ridge, chunk_size):
+    inputs, y = _fold_data['inputs'], _fold_data['y']
+    train = np.ones(len(y), dtype=bool)
+    train[test_rows] = False
+    beta, mean, std = fit_arrays(inputs[train], y[train], method, ridge, chunk_size)
+    return scores(y[test_rows], predict_arrays(inputs[test_rows], beta, mean, std, chunk_size))
+
+
+def cross_validate(df, k=5, method='qr', ridge=0.0, workers=None, seed=0, chunk_size=DEFAULT_CHUNK_SIZE):
+    # k-fold CV with the folds trained in parallel processes;
+    # returns {'folds': [scores per fold], 'mean': averaged scores}
+    inputs, y = to_arrays(df)
+    if not 2 <= k <= len(y):
+        raise ValueError(f"k must be between 2 and the number of rows ({len(y)})")
+    folds = np.array_split(np.random.default_rng(seed).permutation(len(y)), k)
+    workers = min(k, workers or os.cpu_count() or 1)
+
+    if workers == 1:
+        _load_fold_data(inputs, y)
+        results = [_run_fold(rows, method, ridge, chunk_size) for rows in folds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_load_fold_data, initargs=(inputs, y)) as pool:
+            results = list(pool.map(
+                _run_fold, folds, [method] * k, [ridge] * k, [chunk_size] * k
+            ))
+
+    return {
+        'folds': results,
+        'mean': {name: float(np.mean([fold[name] for fold in results])) for name in results[0]},
+    }
+
+
+if __name__ == '__main__':
+    import argparse
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description='Train model one and report its cross-validated error')
+    parser.add_argument('csv', help="family_employment_data.csv, a file with the same columns, or a snapshot name (e.g. family_employment)")
+    parser.add_argument('--method', choices=METHODS, default='qr')
+    parser.add_argument('--ridge', type=float, default=0.0)
+    parser.add_argument('--folds', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--save', help='write the trained model to this .npz (model_one_code.save_model)')
+    args = parser.parse_args()
+
+    if args.csv.endswith('.csv'):
+        df = pd.read_csv(args.csv)
+    else:
+        from snapshots import read_table
+        # only the columns the model uses
+        df = read_table(args.csv, columns=[TARGET] + INPUTS)
+    beta, X_mean, X_std, features = train_model(df, args.method, args.ridge)
+    train_scores = evaluate(df, beta, X_mean, X_std)
+    cv = cross_validate(df, args.folds, args.method, args.ridge, args.workers)
+
+    print('Model Evaluation:')
+    print(f"train  MAE: {train_scores['mae']:.4f}  R²: {train_scores['r2']:.4f}")
+    print(f"{args.folds}-fold CV MAE: {cv['mean']['mae']:.4f}  R²: {cv['mean']['r2']:.4f}")
+    print('\nModel Coefficients:')
+    for name, b in zip(['intercept'] + features, beta):
+        print(f"{name} {b}")
+
+    if args.save:
+        from model_one_code import save_model
+        save_model(args.save, beta, X_mean, X_std, features, {**train_scores, 'cv_mae': cv['mean']['mae'], 'cv_r2': cv['mean']['r2']})
+        print(f"\nsaved to {args.save}")
@@ -0,0 +1,252 @@
+## SNAPSHOT STORE
+# Typed, columnar copies of the analytical CSVs, so training and the
+# notebooks stop re-parsing text on every run.
+#
+# Each table is written once from its CSV (again only when the CSV
+# changes) as a hive-partitioned dataset, year=<year>/<country>=<code>/,
+# of Parquet files or Arrow IPC files. load() then reads only the
+# columns asked for and only the partitions (and Parquet row groups)
+# the filters can match. Arrow IPC files are memory-mapped, so their
+# columns are not copied until they are used.
+#
+#   python snapshots.py                          # snapshot every table as Parquet
+#   python snapshots.py model --format arrow     # one table as Arrow IPC
+#
+#   from snapshots import load
+#   df = load('family_employment', columns=['country_code', 'year', 'weekly_hours'],
+#             filters=[('year', '>=', 2020), ('country_code', 'in', ['AT', 'DE'])])
+#
+# Needs pyarrow (pip install pyarrow). read_table() falls back to the
+# CSV when pyarrow or the snapshot is missing.
+import hashlib
+import json
+import operator
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only the CSV fallback works without it
+    pa = None
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'datasets')
+DEFAULT_ROOT = os.environ.get('SNAPSHOT_DIR', os.path.join(DATASETS, 'snapshots'))
+
+FORMATS = {'parquet': 'parquet', 'arrow': 'ipc'}
+METADATA_FILE = '_snapshot.json'
+
+# line number of every row in its CSV, stored so load() can give back the CSV's order
+ROW_COLUMN = '_row'
+
+
+# TABLES
+# name -> CSV, relative to datasets/
+SOURCES = {
+    'family_employment': 'raw-datasets/family_employment_data.csv',
+    'model': 'raw-datasets/MODEL.csv',
+    'workhour_total': 'raw-datasets/workhour_total.csv',
+    'work_hours': 'preprocessed-datasets/2Work_hours_with_codes.csv',
+}
+TABLES = tuple(SOURCES)
+
+
+def _specs():
+    # column types and the (year, country) columns to partition by;
+    # columns not listed get the table's default type, else text
+    text, year, number = pa.string(), pa.int16(), pa.float64()
+    return {
+        'family_employment': {
+            'types': {
+                'country_code': text, 'Country': text, 'year': year,
+                'birth_rate_per_thousand': number, 'price_index': number, 'cash_per_capita': number,
+                'maternity_per_capita': number, 'services_per_capita': number, 'weekly_hours': number,
+            },
+            'partition': ('year', 'country_code'),
+        },
+        'model': {
+            'types': {
+                'country_code': text, 'country_name': text, 'year': year,
+                'birth_rate_per_thousand': number, 'weekly_hours': number, 'Country': text,
+                'price_index': number, 'cash_per_capita': number, 'maternity_per_capita': number,
+                'services_per_capita': number,
+            },
+            'partition': ('year', 'country_code'),
+        },
+        'workhour_total': {
+            'types': {'TIME_PERIOD': year, 'OBS_VALUE': number},
+            'partition': ('TIME_PERIOD', 'geo'),
+        },
+        'work_hours': {
+            # every measure column is a float
+            'types': {'geo': text, 'Country Code': text, 'time': year, 'sex': text, 'age': text},
+            'default': number,
+            'partition': ('time', 'geo'),
+        },
+    }
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError('snapshots need pyarrow: pip install pyarrow')
+
+
+def spec(name):
+    _require_pyarrow()
+    if name not in TABLES:
+        raise ValueError(f"unknown table {name!r} (known: {', '.join(TABLES)})")
+    return _specs()[name]
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def csv_schema(table_spec, header):
+    # schema in CSV column order: declared type, else the table default, else text
+    default = table_spec.get('default', pa.string())
+    types = {**table_spec['types'], ROW_COLUMN: pa.int32()}
+    return pa.schema([(column, types.get(column, default)) for column in header])
+
+
+def read_csv_typed(path, table_spec):
+    # the CSV as an Arrow table with the declared types
+    header = pd.read_csv(path, nrows=0).columns
+    schema = csv_schema(table_spec, header)
+    df = pd.read_csv(path, dtype={field.name: str for field in schema if pa.types.is_string(field.type)})
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    return table.append_column(pa.field(ROW_COLUMN, pa.int32()), pa.array(range(len(df)), pa.int32()))
+
+
+# WRITING
+def snapshot(name, fmt='parquet', root=DEFAULT_ROOT, datasets=DATASETS, force=False):
+    # (re)write one table's snapshot; returns False when the CSV is unchanged since the last one
+    table_spec = spec(name)
+    csv = os.path.join(datasets, SOURCES[name])
+    source_hash = file_hash(csv)
+    target = os.path.join(root, name)
+    meta = metadata(name, root)
+    if (not force and meta and meta['source_sha256'] == source_hash and meta['format'] == fmt
+            and ROW_COLUMN in meta['schema']):
+        return False
+
+    table = read_csv_typed(csv, table_spec)
+    partitioning = ds.partitioning(
+        pa.schema([table.schema.field(column) for column in table_spec['partition']]), flavor='hive'
+    )
+
+    # written next to the old snapshot and swapped in, so a failed write never leaves half of one
+    os.makedirs(root, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=f'.{name}-', dir=root)
+    try:
+        ds.write_dataset(
+            table, staging, format=FORMATS[fmt], partitioning=partitioning,
+            existing_data_behavior='overwrite_or_ignore',
+        )
+        with open(os.path.join(staging, METADATA_FILE), 'w', encoding='utf-8') as f:
+            json.dump({
+                'source': SOURCES[name], 'source_sha256': source_hash, 'format': fmt,
+                'rows': table.num_rows, 'schema': {field.name: str(field.type) for field in table.schema},
+            }, f, indent=2)
+        old = None
+        if os.path.exists(target):
+            old = target + '.old'
+            shutil.rmtree(old, ignore_errors=True)
+            os.replace(target, old)
+        os.replace(staging, target)
+        if old:
+            shutil.rmtree(old, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return True
+
+
+def metadata(name, root=DEFAULT_ROOT):
+    path = os.path.join(root, name, METADATA_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+# READING
+def dataset(name, root=DEFAULT_ROOT):
+    # the snapshot as a pyarrow dataset, with its CSV's schema
+    table_spec = spec(name)
+    meta = metadata(name, root)
+    if meta is None:
+        raise FileNotFoundError(f"no snapshot of {name} in {root}: run `python snapshots.py {name}`")
+    if ROW_COLUMN not in meta['schema']:
+        raise ValueError(f"the snapshot of {name} has no row numbers: rerun `python snapshots.py {name}`")
+    schema = csv_schema(table_spec, meta['schema'])
+    partitioning = ds.partitioning(pa.schema([schema.field(column) for column in table_spec['partition']]), flavor='hive')
+    # memory-mapped reads: Arrow IPC columns are used in place instead of copied
+    return ds.dataset(
+        os.path.join(root, name), schema=schema, format=FORMATS[meta['format']], partitioning=partitioning,
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+    )
+
+
+def load_arrow(name, columns=None, filters=None, root=DEFAULT_ROOT):
+    # filters: pandas/pyarrow style [(column, op, value), ...], all of which must hold;
+    # partition columns prune whole directories, others skip Parquet row groups
+    expression = pq.filters_to_expression(filters) if filters else None
+    return dataset(name, root).to_table(columns=columns, filter=expression)
+
+
+def load(name, columns=None, filters=None, root=DEFAULT_ROOT):
+    # snapshot as a DataFrame with only the requested columns and matching rows, in CSV order
+    # (partitions come back in directory order, so the stored row numbers are always read)
+    read = columns and list(columns) + [ROW_COLUMN]
+    df = load_arrow(name, read, filters, root).to_pandas()
+    df = df.sort_values(ROW_COLUMN, ignore_index=True).drop(columns=ROW_COLUMN)
+    return df[columns] if columns else df
+
+
+FILTER_OPS = {
+    '=': operator.eq, '==': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+    'in': lambda series, values: series.isin(values),
+    'not in': lambda series, values: ~series.isin(values),
+}
+
+
+def read_table(name, columns=None, filters=None, root=DEFAULT_ROOT):
+    # load(), or the CSV when pyarrow or the snapshot is missing (filters are then applied in pandas)
+    if pa is not None and metadata(name, root) is not None:
+        return load(name, columns, filters, root)
+    df = pd.read_csv(os.path.join(DATASETS, SOURCES[name]))
+    for column, op, value in filters or []:
+        df = df[FILTER_OPS[op](df[column], value)]
+    return df[columns].reset_index(drop=True) if columns else df.reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Write typed, partitioned snapshots of the analytical CSVs')
+    parser.add_argument('tables', nargs='*', help=f"tables to snapshot (default: {', '.join(TABLES)})")
+    parser.add_argument('--format', choices=list(FORMATS), default='parquet')
+    parser.add_argument('--root', default=DEFAULT_ROOT)
+    parser.add_argument('--force', action='store_true', help='rewrite even if the CSV is unchanged')
+    args = parser.parse_args()
+    unknown = [name for name in args.tables if name not in TABLES]
+    if unknown:
+        parser.error(f"unknown table {', '.join(unknown)} (known: {', '.join(TABLES)})")
+
+    for name in args.tables or TABLES:
+        started = time.perf_counter()
+        written = snapshot(name, args.format, args.root, force=args.force)
+        status = f"{metadata(name, args.root)['rows']} rows" if written else 'unchanged'
+        print(f"{name:<18} {status:<12} {time.perf_counter() - started:.2f}s")